@@ -3,38 +3,622 @@ Pytest configuration file
 Contains shared fixtures and hooks for WebDriver setup
 """
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from datetime import datetime
+import functools
+import logging
 import os
+import time
 
-# Test configuration constants
-BASE_URL = "https://opensource-demo.orangehrmlive.com"
+from utils.api import ApiUsersSearch, OrangeHrmApi
+from utils.artifacts import ArtifactWriter, DEFAULT_RETENTION, IMAGE_FORMATS
+from utils.browser_metrics import BrowserMetrics
+from utils.browser_profiles import PROFILES, build_chrome_options, apply_runtime_settings, get_profile
+from utils.config import DEMO_BASE_URL, BASE_URL_ENV, get_base_url
+from utils.driver_pool import DriverPool
+from utils.driver_resolver import resolve_chromedriver_path, start_chrome
+from utils.helpers import FormFillPolicy, WaitPolicy
+from utils.jsonl_report import JsonlReporter
+from utils.network_control import BLOCKED_URL_PATTERNS, NetworkControl
+from utils.pages import AdminTabs, AdminUsersPage, PageSession, TopNav
+from utils.seed_data import DataFactory
+from utils import flakiness, impact, perf_history
+from utils.session import SessionCache
+from utils.sleep_check import find_bare_sleeps
+from utils.step_timing import recorder
+
+logger = logging.getLogger(__name__)
+
+# Test configuration constants (the base URL comes from utils.config / --target)
 IMPLICIT_WAIT = 5
 EXPLICIT_WAIT = 10
+ADMIN_USERNAME = "Admin"
+ADMIN_PASSWORD = "admin123"
+
+# Markers used to keep related tests on the same xdist worker
+GROUPING_MARKERS = ("login", "admin", "navigation")
+
+# Stand-in server started by --target local (controller process only)
+STANDIN_SERVER = pytest.StashKey()
+
+# Benchmark mode: phase durations and perf_budget overrides per test id (controller process)
+benchmark_results = {}
+perf_budgets = {}
+PERF_REGRESSIONS = pytest.StashKey()
+
+# Attempts, transient errors and JS click fallbacks per test id (controller process)
+flaky_results = {}
+FLAKY_SCORES = pytest.StashKey()
+
+# Helpers and locators read per test id (controller process) and the --impact selection summary
+impact_results = {}
+IMPACT_SELECTION = pytest.StashKey()
+
+# BrowserMetrics collector of the running test (item stash)
+BROWSER_METRICS = pytest.StashKey()
+
+# Network control: per-test request counts and bytes, collected on the controller
+NETWORK_CONTROL = pytest.StashKey()
+network_results = {}
+
+# Background writer for failure artifacts (one per process) and the test start time (item stash)
+ARTIFACTS = pytest.StashKey()
+TEST_STARTED = pytest.StashKey()
+
+# Streaming JSON-lines report (controller process only, None when disabled)
+jsonl_reporter = None
+
+
+def pytest_addoption(parser):
+    """
+    Command line options for browser lifecycle management
+    """
+    group = parser.getgroup("browser")
+    group.addoption(
+        "--driver-mode",
+        action="store",
+        default="pooled",
+        choices=("pooled", "fresh"),
+        help="pooled: reuse warm browsers reset between tests; fresh: new browser per test",
+    )
+    group.addoption(
+        "--driver-pool-size",
+        action="store",
+        type=int,
+        default=1,
+        help="Max number of warm browsers kept by the session driver pool",
+    )
+    group.addoption(
+        "--browser-profile",
+        action="store",
+        default="default",
+        choices=tuple(PROFILES),
+        help="Chrome launch profile: default (headed), headless, lean or container; "
+             "overridden per test by @pytest.mark.browser_profile",
+    )
+    group.addoption(
+        "--chromedriver-path",
+        action="store",
+        default=None,
+        help="Pinned ChromeDriver binary (overrides CHROMEDRIVER_PATH and the lockfile)",
+    )
+    group.addoption(
+        "--driver-offline",
+        action="store_true",
+        default=False,
+        help="Resolve ChromeDriver without network access (lockfile, pinned path or PATH only)",
+    )
+
+    group = parser.getgroup("waits")
+    group.addoption(
+        "--wait-policy",
+        action="store",
+        default="explicit",
+        choices=("explicit", "mixed"),
+        help="explicit: no implicit wait, explicit waits only; mixed: add a browser implicit wait",
+    )
+    group.addoption(
+        "--poll-frequency",
+        action="store",
+        type=float,
+        default=None,
+        help="Seconds between explicit-wait polls (default 0.1; per-helper overrides in WaitPolicy)",
+    )
+    group.addoption(
+        "--wait-engine",
+        action="store",
+        default="browser",
+        choices=("browser", "poll"),
+        help="browser: helper waits run in the page, one round-trip each; poll: WebDriver polling",
+    )
+    group.addoption(
+        "--form-fill",
+        action="store",
+        default="batched",
+        choices=("batched", "ui"),
+        help="batched: set text inputs and dropdowns in one script call; ui: real clicks and keystrokes only",
+    )
+    parser.addoption(
+        "--allow-sleep",
+        action="store_true",
+        default=False,
+        help="Do not fail the run when test modules contain fixed time.sleep calls",
+    )
+
+    group = parser.getgroup("target")
+    group.addoption(
+        "--target",
+        action="store",
+        default="demo",
+        choices=("demo", "local"),
+        help="demo: public OrangeHRM demo site; local: start the bundled stand-in server "
+             "(standin/) with seeded data",
+    )
+    group.addoption(
+        "--orangehrm-url",
+        action="store",
+        default=None,
+        help="Base URL of another OrangeHRM instance, e.g. a stand-in started with "
+             "python -m standin (overrides ORANGEHRM_BASE_URL)",
+    )
+    group.addoption(
+        "--data-via",
+        action="store",
+        default="ui",
+        choices=("ui", "api"),
+        help="ui: data_check tests search through the System Users page; api: they query "
+             "/api/v2 without a browser (every other test still runs in the browser)",
+    )
+
+    group = parser.getgroup("reporting")
+    group.addoption(
+        "--step-timings",
+        action="store",
+        default="reports/step_timings.json",
+        help="Where to write the per-step timing summary of SeleniumHelpers calls (JSON)",
+    )
+    group.addoption(
+        "--report-jsonl",
+        action="store",
+        default="reports/results.jsonl",
+        help="Streaming report, one JSON record per finished test (view with reports/viewer.html, "
+             "empty string disables)",
+    )
+    group.addoption(
+        "--browser-metrics",
+        action="store_true",
+        default=False,
+        help="Collect Navigation/Resource Timing, long tasks and CDP performance metrics "
+             "in every browser test and attach them to the report",
+    )
+    group.addoption(
+        "--network-control",
+        action="store_true",
+        default=False,
+        help="Block analytics, fonts and marketing requests, stub external pages and record "
+             "requests and bytes in every browser test (utils/network_control.py)",
+    )
+    group.addoption(
+        "--block-url",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="Extra URL pattern (* wildcards) blocked by the network_control fixture, repeatable",
+    )
+
+    group = parser.getgroup("artifacts")
+    group.addoption(
+        "--screenshot-dir",
+        action="store",
+        default="screenshots",
+        help="Directory for failure screenshots and other artifacts",
+    )
+    group.addoption(
+        "--screenshot-format",
+        action="store",
+        default="png",
+        choices=IMAGE_FORMATS,
+        help="Screenshot file format; webp needs Pillow (falls back to png without it)",
+    )
+    group.addoption(
+        "--screenshot-max-width",
+        action="store",
+        type=int,
+        default=0,
+        help="Downscale failure screenshots to this width in pixels (needs Pillow, 0 = full size)",
+    )
+    group.addoption(
+        "--artifact-retention",
+        action="store",
+        type=int,
+        default=DEFAULT_RETENTION,
+        help=f"Max files kept in --screenshot-dir, oldest deleted first (default {DEFAULT_RETENTION}, 0 = unlimited)",
+    )
+    group.addoption(
+        "--capture-dom",
+        action="store_true",
+        default=False,
+        help="Also save the page source of failed tests",
+    )
+    group.addoption(
+        "--capture-console",
+        action="store_true",
+        default=False,
+        help="Also save the browser console log of failed tests",
+    )
+
+    group = parser.getgroup("benchmark")
+    group.addoption(
+        "--benchmark",
+        action="store_true",
+        default=False,
+        help="Record test and step durations in the performance history and check budgets",
+    )
+    group.addoption(
+        "--perf-db",
+        action="store",
+        default=perf_history.DEFAULT_DB,
+        help="SQLite performance history used by --benchmark",
+    )
+    group.addoption(
+        "--perf-budget",
+        action="store",
+        type=float,
+        default=perf_history.DEFAULT_BUDGET_PCT,
+        help="Allowed slowdown in percent over the rolling baseline (perf_budget marker overrides per test)",
+    )
+    group.addoption(
+        "--perf-min-delta",
+        action="store",
+        type=float,
+        default=perf_history.DEFAULT_MIN_DELTA,
+        help="Ignore slowdowns smaller than this many seconds",
+    )
+    group.addoption(
+        "--perf-window",
+        action="store",
+        type=int,
+        default=perf_history.DEFAULT_WINDOW,
+        help="Number of previous passing runs in the rolling baseline",
+    )
+    group.addoption(
+        "--perf-budget-action",
+        action="store",
+        default="fail",
+        choices=("fail", "warn"),
+        help="fail: budget regressions fail the run; warn: only report them",
+    )
+
+    group = parser.getgroup("retries")
+    group.addoption(
+        "--retries",
+        action="store",
+        type=int,
+        default=flakiness.DEFAULT_RETRIES,
+        help="Rerun a test up to N times when setup or call fails with a transient error "
+             "(timeout, stale element, intercepted click); retries(n) marker overrides per test, 0 disables",
+    )
+    group.addoption(
+        "--flaky-db",
+        action="store",
+        default=flakiness.DEFAULT_DB,
+        help="SQLite history of attempts per test used for flakiness scores (empty string disables)",
+    )
+    group.addoption(
+        "--flaky-window",
+        action="store",
+        type=int,
+        default=flakiness.DEFAULT_WINDOW,
+        help="Number of recent runs a flakiness score is computed over",
+    )
+
+    group = parser.getgroup("impact")
+    group.addoption(
+        "--impact",
+        action="store_true",
+        default=False,
+        help="Only run tests that used a SeleniumHelpers method or locator changed since "
+             "--impact-base (plus new tests and tests whose code changed)",
+    )
+    group.addoption(
+        "--impact-base",
+        action="store",
+        default="HEAD",
+        help="Git revision the working tree is compared with for --impact (default HEAD)",
+    )
+    group.addoption(
+        "--impact-map",
+        action="store",
+        default=impact.DEFAULT_MAP,
+        help="Where the helpers and locators used by each test are recorded (empty string disables)",
+    )
+
+    group = parser.getgroup("parallel")
+    group.addoption(
+        "--marker-group-size",
+        action="store",
+        type=int,
+        default=4,
+        help="With -n N: number of same-marker tests scheduled together on one worker",
+    )
+
+
+def get_worker_id(config):
+    """Return the pytest-xdist worker id (gw0, gw1, ...) or 'master' when not distributed"""
+    return getattr(config, "workerinput", {}).get("workerid", "master")
+
+
+def get_browser_profile(request):
+    """Browser profile for a test: browser_profile marker first, then --browser-profile"""
+    marker = request.node.get_closest_marker("browser_profile")
+    return marker.args[0] if marker else request.config.getoption("--browser-profile")
+
+
+def create_driver(driver_path, profile="default"):
+    """
+    Launch and configure a new Chrome instance
+    driver_path comes from the session-cached chromedriver_path fixture,
+    profile selects the launch options in utils/browser_profiles.py
+    """
+    # Setup - Initialize ChromeDriver from the resolved binary (resolved again if it no longer matches Chrome)
+    driver = start_chrome(driver_path, build_chrome_options(profile))
+
+    # Configure browser (implicit wait is 0 under the default explicit policy)
+    apply_runtime_settings(driver, profile)
+    driver.implicitly_wait(WaitPolicy.implicit_wait)
+    return driver
+
+
+@pytest.fixture(scope="session")
+def chromedriver_path(request):
+    """
+    ChromeDriver binary resolved once per session
+    Uses webdriver-manager only when no pinned path or lockfile is available
+    """
+    return resolve_chromedriver_path(
+        pinned_path=request.config.getoption("--chromedriver-path"),
+        offline=request.config.getoption("--driver-offline"),
+    )
+
+
+@pytest.fixture(scope="session")
+def driver_pools(request, chromedriver_path):
+    """
+    Session-scoped pools of warm browsers, one pool per browser profile
+
+    Returns a function profile -> DriverPool. Browsers are launched lazily
+    on first use and quit once at session end
+    """
+    size = request.config.getoption("--driver-pool-size")
+    pools = {}
+
+    def get_pool(profile):
+        if profile not in pools:
+            pools[profile] = DriverPool(functools.partial(create_driver, chromedriver_path, profile), size=size)
+        return pools[profile]
+
+    yield get_pool
+    for pool in pools.values():
+        pool.close()
+
+
+def lease_driver(request):
+    """
+    Browser for a fixture and the function that gives it back
+
+    - pooled (default): a warm browser from the session pool, reset
+      (windows, cookies, storage) and returned to the pool afterwards
+    - fresh: a new browser instance, quit afterwards
+    The browser profile comes from the browser_profile marker or --browser-profile
+    """
+    profile = get_browser_profile(request)
+    if request.config.getoption("--driver-mode") == "fresh":
+        driver = create_driver(request.getfixturevalue("chromedriver_path"), profile)
+        return driver, driver.quit
+
+    pool = request.getfixturevalue("driver_pools")(profile)
+    driver = pool.acquire()
+    return driver, functools.partial(pool.release, driver)
 
 
 @pytest.fixture(scope="function")
-def driver():
+def driver(request):
     """
     WebDriver fixture with proper setup and teardown
-    Uses webdriver-manager for automatic ChromeDriver management
 
-    Scope: function (creates new browser instance for each test)
+    Scope: function - a pooled or fresh browser per test (see lease_driver)
     """
-    # Setup - Initialize ChromeDriver with webdriver-manager
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service)
-
-    # Configure browser
-    driver.maximize_window()
-    driver.implicitly_wait(IMPLICIT_WAIT)
+    driver, give_back = lease_driver(request)
 
     yield driver
 
-    # Teardown - Quit browser
-    driver.quit()
+    # Teardown - Reset and return browser to the pool (or quit it)
+    give_back()
+
+
+@pytest.fixture(scope="session")
+def session_cache():
+    """
+    Authenticated-session snapshot shared by every test in the session
+    The first logged_in_driver logs in through the UI; the rest reuse its cookies
+    """
+    return SessionCache(get_base_url(), ADMIN_USERNAME, ADMIN_PASSWORD)
+
+
+@pytest.fixture(scope="function")
+def logged_in_driver(driver, session_cache):
+    """
+    Driver that starts on the dashboard with an authenticated session
+    Restores the session snapshot by cookie injection and only falls back
+    to the UI login flow when the snapshot is missing or rejected
+    """
+    return session_cache.login(driver)
+
+
+@pytest.fixture(scope="function")
+def admin_users_page(driver, session_cache):
+    """
+    AdminUsersPage opened by URL with an authenticated session
+    Lands on /admin/viewSystemUsers directly instead of the dashboard and the
+    Admin menu; tests about the menu itself call open_via_menu() instead
+    """
+    session_cache.login(driver, landing_path=AdminUsersPage.path)
+    return AdminUsersPage(driver).wait_until_ready()
+
+
+@pytest.fixture(scope="session")
+def api_client(session_cache):
+    """
+    OrangeHrmApi for cross-checks and test data, shared by the session
+    Starts from the browser session's cookies when a browser has logged in
+    already, otherwise logs in over HTTP on the first request
+    """
+    api = OrangeHrmApi(get_base_url(), ADMIN_USERNAME, ADMIN_PASSWORD, cookies=session_cache.cookies())
+    yield api
+    api.close()
+
+
+@pytest.fixture(scope="module")
+def seed_data(request, api_client):
+    """
+    DataFactory with the records declared in the test module's SEED_DATA
+    Created over the API in one batch when the module's first test asks for
+    it and deleted after the module in one call per record type
+    """
+    factory = DataFactory(api_client)
+    try:
+        factory.seed(**getattr(request.module, "SEED_DATA", {}))
+        yield factory
+    finally:
+        factory.cleanup()
+
+
+@pytest.fixture(scope="class")
+def users_page_session(request, session_cache):
+    """
+    PageSession on one System Users page for the shared_page tests of a class
+    The browser is leased, logged in and the page loaded once per class
+    """
+    driver, give_back = lease_driver(request)
+    try:
+        session_cache.login(driver, landing_path=AdminUsersPage.path)
+        session = PageSession(AdminUsersPage(driver).wait_until_ready())
+        yield session
+        logger.info(f"✓ Shared System Users page: {session.reuses} reuses, {session.reloads} reloads")
+    finally:
+        give_back()
+
+
+@pytest.fixture(scope="function")
+def shared_users_page(users_page_session):
+    """
+    The class's shared AdminUsersPage, checked and reset (Reset button) for this test
+    Only for read-only tests marked shared_page; tests that change data or
+    leave the page take admin_users_page
+    """
+    return users_page_session.begin()
+
+
+@pytest.fixture(scope="function")
+def users_search(request):
+    """
+    System Users search for the data_check tests
+    AdminUsersPage by default (the class's shared page for shared_page tests);
+    ApiUsersSearch (same search/rows/row_count interface, no browser) under
+    --data-via api
+    """
+    if request.config.getoption("--data-via") == "api":
+        return ApiUsersSearch(request.getfixturevalue("api_client"))
+    if request.node.get_closest_marker("shared_page"):
+        return request.getfixturevalue("shared_users_page")
+    return request.getfixturevalue("admin_users_page")
+
+
+def uses_browser(request):
+    """
+    True when the test gets a browser of its own: it takes driver, or
+    users_search without --data-via api. shared_page tests share the class's
+    browser and never lease a second one
+    """
+    if "driver" in request.fixturenames:
+        return True
+    if request.node.get_closest_marker("shared_page"):
+        return False
+    return "users_search" in request.fixturenames and request.config.getoption("--data-via") == "ui"
+
+
+def browser_of(item):
+    """The test's driver: its driver argument, else the one behind its page fixture"""
+    driver = item.funcargs.get("driver")
+    for name in ("users_search", "shared_users_page"):
+        driver = driver or getattr(item.funcargs.get(name), "driver", None)
+    return driver
+
+
+@pytest.fixture(scope="function")
+def admin_tabs(driver, session_cache):
+    """AdminTabs on the System Users page, reached by URL, for the top bar tests"""
+    session_cache.login(driver, landing_path=AdminTabs.path)
+    return AdminTabs(driver).wait_until_ready()
+
+
+@pytest.fixture(scope="function")
+def top_nav(logged_in_driver):
+    """TopNav for the header and sidebar of the dashboard"""
+    return TopNav(logged_in_driver).wait_until_ready()
+
+
+@pytest.fixture(scope="function")
+def browser_metrics(request, driver):
+    """
+    Browser-side performance probe for the test's driver
+    Samples Navigation/Resource Timing, long tasks and CDP Performance.getMetrics
+    after each navigation and search; call .capture(label) for extra samples.
+    pytest_runtest_makereport attaches the report to the test's call report
+    (user_properties and a JSON extra in reports/report.html)
+    """
+    metrics = BrowserMetrics(driver).install()
+    recorder.add_listener(metrics.on_step)
+    request.node.stash[BROWSER_METRICS] = metrics
+
+    yield metrics
+
+    recorder.remove_listener(metrics.on_step)
+    metrics.uninstall()
+
+
+@pytest.fixture(autouse=True)
+def _browser_metrics_everywhere(request):
+    """--browser-metrics: enable the browser_metrics fixture for every test that uses a driver"""
+    if request.config.getoption("--browser-metrics") and uses_browser(request):
+        request.getfixturevalue("browser_metrics")
+
+
+@pytest.fixture(scope="function")
+def network_control(request, driver):
+    """
+    Network control for the test's browser
+    Blocks BLOCKED_URL_PATTERNS plus --block-url, answers external pages with
+    canned responses and counts requests and bytes; pytest_runtest_makereport
+    attaches the counts to the call report. Uninstalling puts the browser
+    profile's own blocked URLs back, so a pooled browser is returned unchanged
+    """
+    control = NetworkControl(
+        driver,
+        blocked=BLOCKED_URL_PATTERNS + request.config.getoption("--block-url"),
+        restore_blocked=get_profile(get_browser_profile(request))["blocked_urls"],
+    ).install()
+    request.node.stash[NETWORK_CONTROL] = control
+
+    yield control
+
+    control.uninstall()
+
+
+@pytest.fixture(autouse=True)
+def _network_control_everywhere(request):
+    """--network-control: enable the network_control fixture for every test that uses a driver"""
+    if request.config.getoption("--network-control") and uses_browser(request):
+        request.getfixturevalue("network_control")
 
 
 @pytest.fixture(scope="function")
@@ -42,9 +626,27 @@ def wait(driver):
     """
     Explicit wait fixture for reusable waits across tests
     Returns a WebDriverWait object with 10 second timeout
+    Polls at the WaitPolicy interval instead of the 0.5 s default
     """
-    from selenium.webdriver.support.ui import WebDriverWait
-    return WebDriverWait(driver, EXPLICIT_WAIT)
+    return WaitPolicy.wait(driver, EXPLICIT_WAIT)
+
+
+# Step timing: tell the recorder which test phase the helper calls belong to
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    item.stash[TEST_STARTED] = time.time()
+    recorder.begin("setup")
+    impact.begin_tracking()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_call(item):
+    recorder.begin("call")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_teardown(item):
+    recorder.begin("teardown")
 
 
 # Pytest hook for screenshot capture on test failure
@@ -53,35 +655,411 @@ def pytest_runtest_makereport(item, call):
     """
     Captures screenshots when tests fail
     Screenshots saved to 'screenshots/' directory with timestamp
+    Filenames carry microseconds and the xdist worker id so parallel runs never collide
+    Only the screenshot (and DOM/console) round-trips run here; encoding and
+    writing happen on the ArtifactWriter thread pool
+    Tags setup/call failures caused by transient errors for the retry loop
+    Also attaches the test's step timings and the helpers and locators it
+    used to the teardown report
+    (user_properties travel from xdist workers to the controller)
+    and the browser metrics report (shown as a JSON extra in the HTML
+    report) and network counts to the call report
     """
     outcome = yield
     report = outcome.get_result()
 
+    if report.failed and report.when in ('setup', 'call'):
+        error = flakiness.transient_error(call.excinfo)
+        if error:
+            report.user_properties.append(("transient_error", error))
+
+    metrics = item.stash.get(BROWSER_METRICS, None)
+    if report.when == 'call' and metrics is not None:
+        metrics.capture("end of test", force=False)
+        browser_report = metrics.report()
+        report.user_properties.append(("browser_metrics", browser_report))
+        if item.config.pluginmanager.hasplugin("html"):
+            from pytest_html import extras
+            report.extras = getattr(report, "extras", []) + [extras.json(browser_report, name="Browser metrics")]
+
+    network = item.stash.get(NETWORK_CONTROL, None)
+    if report.when == 'call' and network is not None:
+        report.user_properties.append(("network", network.report()))
+
+    if report.when == 'teardown':
+        report.user_properties.append(("step_timings", recorder.pop_steps()))
+        usage = impact.end_tracking()
+        # Data checks run over the API touch no helpers; keep the usage of their UI runs
+        if not (item.get_closest_marker("data_check") and item.config.getoption("--data-via") == "api"):
+            report.user_properties.append(("impact", usage))
+        budget = item.get_closest_marker("perf_budget")
+        if budget:
+            report.user_properties.append(("perf_budget", budget.args[0]))
+
     # Only capture screenshot if test failed during execution
     if report.when == 'call' and report.failed:
-        driver = item.funcargs.get('driver')
+        # users_search and shared_users_page get their browser without a driver funcarg
+        driver = browser_of(item)
         if driver:
-            # Create screenshots directory if it doesn't exist
-            screenshot_dir = 'screenshots'
-            os.makedirs(screenshot_dir, exist_ok=True)
+            # Generate filename with timestamp (and worker id under xdist)
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+            worker_id = get_worker_id(item.config)
+            suffix = "" if worker_id == "master" else f"_{worker_id}"
+            basename = f"{item.name}_{timestamp}{suffix}"
+
+            # Grab the screenshot and queue the write
+            paths = item.config.stash[ARTIFACTS].capture(driver, basename, since=item.stash.get(TEST_STARTED, None))
+            report.user_properties.append(("artifacts", paths))
+            print(f"\n📸 Screenshot saved: {paths[0]}")
+            for path in paths[1:]:
+                print(f"📄 Artifact saved: {path}")
+
+
+def get_retries(item):
+    """Retry budget of a test: retries marker first, then --retries"""
+    marker = item.get_closest_marker("retries")
+    return marker.args[0] if marker else item.config.getoption("--retries")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_protocol(item, nextitem):
+    """
+    Run a test, rerunning it while setup or call fails with a transient error
+    Retries tear down only the test's own fixtures (flakiness.run_with_retries)
+    """
+    retries = get_retries(item)
+    if not retries:
+        return None
+    flakiness.run_with_retries(item, nextitem, retries)
+    return True
+
+
+def pytest_report_teststatus(report):
+    """Show failed attempts that are retried as RERUN (R)"""
+    if report.outcome == "rerun":
+        return "rerun", "R", ("RERUN", {"yellow": True})
+
+
+def pytest_sessionstart(session):
+    """Hand the run metadata to the streaming report (controller process only)"""
+    if jsonl_reporter:
+        config = session.config
+        jsonl_reporter.session_start(
+            target=config.getoption("--target"),
+            base_url=os.environ.get(BASE_URL_ENV),
+            browser_profile=config.getoption("--browser-profile"),
+            driver_mode=config.getoption("--driver-mode"),
+            workers=config.getoption("numprocesses", None) or 0,
+        )
+
+
+def pytest_runtest_logreport(report):
+    """
+    Collect step timings, phase durations and retry attempts of finished
+    tests and stream each finished test to the JSON-lines report
+    (runs on the controller under xdist)
+    """
+    if jsonl_reporter:
+        jsonl_reporter.add_report(report)
+
+    flaky = flaky_results.setdefault(report.nodeid, {
+        "outcome": "passed", "attempts": 1, "transient_errors": [], "js_fallbacks": 0,
+    })
+    error = dict(report.user_properties).get("transient_error")
+    if error:
+        flaky["transient_errors"].append(error)
+    if report.outcome == "rerun":
+        return
+    if report.failed:
+        flaky["outcome"] = "failed" if report.when == "call" else "error"
+    elif report.skipped and flaky["outcome"] == "passed":
+        flaky["outcome"] = "skipped"
+
+    result = benchmark_results.setdefault(report.nodeid, {"outcome": "passed"})
+    result[f"{report.when}_s"] = report.duration
+    if report.failed:
+        result["outcome"] = "failed"
+    elif report.skipped and result["outcome"] == "passed":
+        result["outcome"] = "skipped"
+
+    network = dict(report.user_properties).get("network")
+    if network:
+        network_results[report.nodeid] = network
+
+    if report.when != "teardown":
+        return
+    for name, value in report.user_properties:
+        if name == "step_timings":
+            recorder.add_result(report.nodeid, value)
+            flaky["js_fallbacks"] = sum(step["js_fallbacks"] for step in value if step["depth"] == 0)
+        elif name == "perf_budget":
+            perf_budgets[report.nodeid] = value
+        elif name == "attempts":
+            flaky["attempts"] = value
+        elif name == "impact" and flaky["outcome"] in ("passed", "failed"):
+            impact_results[report.nodeid] = value
 
-            # Generate filename with timestamp
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            screenshot_name = f"{item.name}_{timestamp}.png"
-            screenshot_path = os.path.join(screenshot_dir, screenshot_name)
 
-            # Capture and save screenshot
-            driver.save_screenshot(screenshot_path)
-            print(f"\n📸 Screenshot saved: {screenshot_path}")
+def pytest_sessionfinish(session):
+    """
+    Write the step timing summary and, with --benchmark, record the run in
+    the performance history and check budgets - once, from the controller process
+    Stores attempts per test in the flakiness history, the helpers and
+    locators each test used in the impact map, and closes the
+    streaming report with the final exit status
+    """
+    if hasattr(session.config, "workerinput"):
+        return
+    if recorder.results:
+        path = recorder.write_json(session.config.getoption("--step-timings"))
+        print(f"\n⏱ Step timings saved: {path}")
+    if session.config.getoption("--benchmark") and benchmark_results:
+        check_performance_budgets(session)
+    if session.config.getoption("--flaky-db") and flaky_results:
+        record_flakiness(session.config)
+    if session.config.getoption("--impact-map") and impact_results:
+        impact_map = impact.ImpactMap(session.config.getoption("--impact-map"))
+        impact_map.update(impact_results)
+        impact_map.save()
+    if jsonl_reporter and jsonl_reporter.close(session.exitstatus):
+        print(f"📝 Streaming report saved: {jsonl_reporter.path} (open reports/viewer.html)")
+
+
+def check_performance_budgets(session):
+    """
+    Store this run in the history database and compare each passing test
+    with the median of its previous passing runs on the same target/profile
+    """
+    config = session.config
+    store = perf_history.HistoryStore(config.getoption("--perf-db"))
+    try:
+        run_id = store.record_run(
+            benchmark_results,
+            recorder.results,
+            target=config.getoption("--target"),
+            browser_profile=config.getoption("--browser-profile"),
+            workers=config.getoption("numprocesses", None) or 0,
+        )
+        regressions = store.check_budgets(
+            run_id,
+            budget_pct=config.getoption("--perf-budget"),
+            min_delta=config.getoption("--perf-min-delta"),
+            window=config.getoption("--perf-window"),
+            test_budgets=perf_budgets,
+        )
+    finally:
+        store.close()
+
+    config.stash[PERF_REGRESSIONS] = (run_id, regressions)
+    if regressions and config.getoption("--perf-budget-action") == "fail" and session.exitstatus == pytest.ExitCode.OK:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def record_flakiness(config):
+    """
+    Store attempts and transient errors of this run and score the tests
+    that needed a retry or a JavaScript click fallback
+    """
+    store = flakiness.FlakinessStore(config.getoption("--flaky-db"))
+    try:
+        store.record_run(flaky_results, target=config.getoption("--target"))
+        flagged = {
+            nodeid for nodeid, result in flaky_results.items()
+            if result["attempts"] > 1 or result["transient_errors"] or result["js_fallbacks"]
+        }
+        config.stash[FLAKY_SCORES] = store.scores(flagged, window=config.getoption("--flaky-window")) if flagged else []
+    finally:
+        store.close()
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """
+    Report network traffic of the tests that used network_control, flaky
+    tests of this run and performance budget regressions found by --benchmark
+    """
+    if network_results:
+        terminalreporter.section("network")
+        total = sum(n["bytes"] for n in network_results.values())
+        requests = sum(n["requests"] for n in network_results.values())
+        blocked = sum(n["blocked"] for n in network_results.values())
+        stubbed = sum(n["stubbed"] for n in network_results.values())
+        terminalreporter.write_line(
+            f"{len(network_results)} tests: {requests} requests, {total / 1024:.0f} KB "
+            f"({total / 1024 / len(network_results):.0f} KB per test), {blocked} blocked, {stubbed} stubbed"
+        )
+        heaviest = sorted(network_results.items(), key=lambda n: n[1]["bytes"], reverse=True)[:5]
+        for nodeid, network in heaviest:
+            terminalreporter.write_line(f"  {network['bytes'] / 1024:8.0f} KB  {network['requests']:4d} requests  {nodeid}")
+        if not all(n["connected"] for n in network_results.values()):
+            terminalreporter.write_line("⚠ Some browsers had no DevTools connection: URL blocking only, no counts")
+
+    scores = config.stash.get(FLAKY_SCORES, None)
+    if scores:
+        terminalreporter.section("flaky tests")
+        for score in scores:
+            terminalreporter.write_line(f"  {score}")
+        terminalreporter.write_line(f"History of all tests: python -m utils.flakiness report --db {config.getoption('--flaky-db')}")
+
+    if PERF_REGRESSIONS not in config.stash:
+        return
+    run_id, regressions = config.stash[PERF_REGRESSIONS]
+    terminalreporter.section("performance budget")
+    if not regressions:
+        terminalreporter.write_line(f"✓ Run {run_id}: no test exceeded its performance budget")
+        return
+    symbol = "✗" if config.getoption("--perf-budget-action") == "fail" else "⚠"
+    terminalreporter.write_line(f"{symbol} Run {run_id}: {len(regressions)} test(s) over budget")
+    for regression in regressions:
+        terminalreporter.write_line(f"  {regression}")
+    terminalreporter.write_line(f"Compare runs with: python -m utils.perf_history compare --db {config.getoption('--perf-db')}")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_summary(prefix, summary, postfix, session):
+    """Add a "Slowest steps" table to reports/report.html"""
+    postfix.append(recorder.slowest_steps_html())
 
 
 def pytest_configure(config):
     """
-   Custom markers for test categorization
-    Markers allow running specific test subsets (e.g., pytest -m smoke)
+    Select the target application, open the streaming report and apply the
+    wait and form fill policies selected on the command line
+    Markers are registered in pytest.ini
+    """
+    configure_target(config)
+    configure_jsonl_report(config)
+    config.stash[ARTIFACTS] = ArtifactWriter(
+        directory=config.getoption("--screenshot-dir"),
+        image_format=config.getoption("--screenshot-format"),
+        max_width=config.getoption("--screenshot-max-width"),
+        retention=config.getoption("--artifact-retention"),
+        dom=config.getoption("--capture-dom"),
+        console=config.getoption("--capture-console"),
+    )
+    WaitPolicy.configure(
+        mode=config.getoption("--wait-policy"),
+        implicit_wait=IMPLICIT_WAIT,
+        poll_frequency=config.getoption("--poll-frequency"),
+        engine=config.getoption("--wait-engine"),
+    )
+    FormFillPolicy.configure(config.getoption("--form-fill"))
+
+
+def configure_target(config):
+    """
+    Export the base URL of the application under test in ORANGEHRM_BASE_URL
+
+    --target local starts the stand-in once in the controller process;
+    pytest-xdist workers inherit the environment variable and share that server
+    """
+    if hasattr(config, "workerinput"):
+        return
+    if config.getoption("--target") == "local":
+        from standin import StandInServer
+        server = StandInServer()
+        config.stash[STANDIN_SERVER] = server
+        base_url = server.start()
+    else:
+        base_url = config.getoption("--orangehrm-url") or os.environ.get(BASE_URL_ENV) or DEMO_BASE_URL
+    os.environ[BASE_URL_ENV] = base_url
+
+
+def configure_jsonl_report(config):
+    """
+    Set up --report-jsonl in the controller process; xdist workers send their
+    reports to the controller, which writes every record. --collect-only
+    runs leave the previous report in place
+    """
+    global jsonl_reporter
+    path = config.getoption("--report-jsonl")
+    if path and not hasattr(config, "workerinput") and not config.option.collectonly:
+        jsonl_reporter = JsonlReporter(path)
+
+
+def pytest_unconfigure(config):
+    """Flush queued failure artifacts and stop the stand-in server started by --target local"""
+    artifacts = config.stash.get(ARTIFACTS, None)
+    if artifacts:
+        artifacts.close()
+    server = config.stash.get(STANDIN_SERVER, None)
+    if server:
+        server.stop()
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Reject fixed sleeps in test modules, keep only impacted tests with
+    --impact, then group tests by marker for pytest-xdist --dist loadgroup
+    scheduling
+
+    Consecutive tests sharing a login/admin/navigation marker are chunked into
+    groups of --marker-group-size, so each worker runs a batch of related
+    tests back to back (warm pooled browser, one restored session) while the
+    chunks still spread across all workers
+    """
+    if not config.getoption("--allow-sleep"):
+        check_no_bare_sleeps(items)
+
+    if config.getoption("--impact"):
+        select_impacted_tests(config, items)
+
+    if not config.pluginmanager.hasplugin("xdist"):
+        return
+
+    group_size = max(1, config.getoption("--marker-group-size"))
+    counters = {}
+    for item in items:
+        if item.get_closest_marker("xdist_group"):
+            continue
+        if item.get_closest_marker("shared_page"):
+            # The whole class on one worker, so the page is loaded once
+            owner = item.cls or item.module
+            item.add_marker(pytest.mark.xdist_group(f"shared_page-{owner.__name__}"))
+            continue
+        marker = next((m for m in GROUPING_MARKERS if item.get_closest_marker(m)), "other")
+        index = counters.get(marker, 0)
+        counters[marker] = index + 1
+        item.add_marker(pytest.mark.xdist_group(f"{marker}-{index // group_size}"))
+
+
+def select_impacted_tests(config, items):
+    """
+    Deselect tests that used none of the helpers or locators changed since
+    --impact-base, according to the impact map of previous runs
+    Runs everything when git is unavailable or non-helper code changed
+    """
+    changes = impact.changed_lines(config.getoption("--impact-base"), cwd=str(config.rootpath))
+    if changes is None:
+        config.stash[IMPACT_SELECTION] = "git diff failed, running all tests"
+        return
+    impact_map = impact.ImpactMap(config.getoption("--impact-map") or impact.DEFAULT_MAP)
+    selected, reason = impact.select(items, impact_map, changes, rootdir=str(config.rootpath))
+    kept = set(map(id, selected))
+    deselected = [item for item in items if id(item) not in kept]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+    config.stash[IMPACT_SELECTION] = f"{len(selected)}/{len(selected) + len(deselected)} tests ({reason})"
+
+
+def pytest_report_collectionfinish(config):
+    """Show what --impact selected"""
+    if IMPACT_SELECTION in config.stash:
+        return f"impact selection: {config.stash[IMPACT_SELECTION]}"
+
+
+def check_no_bare_sleeps(items):
+    """
+    Fail the run if any collected test module calls time.sleep
+    Fixed sleeps must be replaced by the event-driven waits in SeleniumHelpers
     """
-    config.addinivalue_line("markers", "smoke: Critical smoke tests")
-    config.addinivalue_line("markers", "regression: Comprehensive regression tests")
-    config.addinivalue_line("markers", "admin: Admin module tests")
-    config.addinivalue_line("markers", "login: Login functionality tests")
-    config.addinivalue_line("markers", "navigation: Navigation tests")
+    violations = []
+    for path in sorted({str(item.path) for item in items}):
+        for lineno, line in find_bare_sleeps(path):
+            violations.append(f"  {os.path.relpath(path)}:{lineno}: {line}")
+    if violations:
+        raise pytest.UsageError(
+            "Fixed time.sleep calls found in test modules "
+            "(use SeleniumHelpers wait_for_* helpers, or --allow-sleep):\n"
+            + "\n".join(violations)
+        )
@@ -0,0 +1,7 @@
+"""
+Local stand-in for the OrangeHRM demo site
+Lets the suite run offline against deterministic data (pytest --target local)
+"""
+from standin.server import StandInServer
+
+__all__ = ["StandInServer"]
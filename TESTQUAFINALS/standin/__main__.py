@@ -0,0 +1,28 @@
+"""
+Run the OrangeHRM stand-in in the foreground
+
+    python -m standin --port 8080
+    pytest --orangehrm-url http://127.0.0.1:8080
+"""
+import argparse
+import logging
+
+from standin.server import StandInServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local OrangeHRM stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    server = StandInServer(args.host, args.port)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""
+Deterministic seed data and in-memory store for the local OrangeHRM stand-in
+Every server start (and every POST /standin/reset) begins from the same records
+"""
+import copy
+import threading
+
+ROLES = {1: "Admin", 2: "ESS"}
+
+# (empNumber, employeeId, firstName, middleName, lastName)
+SEED_EMPLOYEES = [
+    (1, "0001", "Paul", "", "Collings"),
+    (2, "0002", "Linda", "Jane", "Anderson"),
+    (3, "0003", "Russel", "", "Hamilton"),
+    (4, "0004", "Odis", "", "Adalwin"),
+    (5, "0005", "Peter", "Mac", "Anderson"),
+    (6, "0006", "Fiona", "", "Grace"),
+    (7, "0007", "Garry", "", "White"),
+    (8, "0008", "Aaliyah", "", "Haq"),
+    (9, "0009", "Charlie", "", "Carter"),
+    (10, "0010", "Rebecca", "", "Harmony"),
+    (11, "0011", "Joe", "", "Root"),
+    (12, "0012", "Thomas", "Kutty", "Benny"),
+]
+
+# (id, userName, userRoleId, empNumber, enabled, password)
+SEED_USERS = [
+    (1, "Admin", 1, 1, True, "admin123"),
+    (2, "linda.anderson", 2, 2, True, "linda123"),
+    (3, "russel.hamilton", 2, 3, True, "russel123"),
+    (4, "odis.adalwin", 1, 4, True, "odis1234"),
+    (5, "peter.anderson", 2, 5, False, "peter123"),
+    (6, "fiona.grace", 2, 6, True, "fiona123"),
+    (7, "garry.white", 1, 7, False, "garry123"),
+    (8, "aaliyah.haq", 2, 8, True, "aaliyah1"),
+    (9, "charlie.carter", 2, 9, False, "charlie1"),
+    (10, "rebecca.harmony", 1, 10, True, "rebecca1"),
+    (11, "joe.root", 2, 11, True, "joeroot1"),
+    # Spare user for manual edits, so status changes never affect other searches
+    (12, "edit.target", 2, 12, True, "target123"),
+]
+
+
+class ValidationError(Exception):
+    """Rejected create/update/delete; status and message mirror the OrangeHRM API error body"""
+
+    def __init__(self, message, status=422):
+        super().__init__(message)
+        self.message = message
+        self.status = status
+
+
+def employee_name(employee, with_middle=True):
+    parts = [employee["firstName"], employee["middleName"] if with_middle else "", employee["lastName"]]
+    return " ".join(p for p in parts if p)
+
+
+class DataStore:
+    """
+    Thread-safe employees and system users, shaped like the OrangeHRM v2 API
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.employees = {
+                emp[0]: {
+                    "empNumber": emp[0], "employeeId": emp[1], "firstName": emp[2],
+                    "middleName": emp[3], "lastName": emp[4], "terminationId": None,
+                }
+                for emp in SEED_EMPLOYEES
+            }
+            self.users = {
+                user[0]: {
+                    "id": user[0], "userName": user[1], "userRoleId": user[2],
+                    "empNumber": user[3], "status": user[4], "password": user[5],
+                }
+                for user in SEED_USERS
+            }
+            self._next_user_id = max(self.users) + 1
+            self._next_emp_number = max(self.employees) + 1
+
+    # ----- users ----- #
+
+    def serialize_user(self, user):
+        employee = self.employees.get(user["empNumber"])
+        return {
+            "id": user["id"],
+            "userName": user["userName"],
+            "deleted": False,
+            "status": user["status"],
+            "employee": copy.deepcopy(employee),
+            "userRole": {
+                "id": user["userRoleId"],
+                "name": ROLES[user["userRoleId"]],
+                "displayName": ROLES[user["userRoleId"]],
+            },
+        }
+
+    def authenticate(self, username, password):
+        """Return the enabled user matching the credentials, or None"""
+        with self._lock:
+            for user in self.users.values():
+                if user["userName"] == username and user["password"] == password and user["status"]:
+                    return user["id"]
+        return None
+
+    def search_users(self, username=None, user_role_id=None, emp_number=None, status=None,
+                     sort_order="ASC", offset=0, limit=50):
+        """
+        Filter users like GET /api/v2/admin/users
+        username matches exactly (case-insensitive); status is True/False/None
+
+        Returns:
+            tuple: (page of serialized users, total matches)
+        """
+        with self._lock:
+            users = list(self.users.values())
+            if username:
+                users = [u for u in users if u["userName"].lower() == username.lower()]
+            if user_role_id:
+                users = [u for u in users if u["userRoleId"] == user_role_id]
+            if emp_number:
+                users = [u for u in users if u["empNumber"] == emp_number]
+            if status is not None:
+                users = [u for u in users if u["status"] == status]
+            users.sort(key=lambda u: u["userName"].lower(), reverse=sort_order == "DESC")
+            page = [self.serialize_user(u) for u in users[offset:offset + limit]]
+            return page, len(users)
+
+    def get_user(self, user_id):
+        with self._lock:
+            user = self.users.get(user_id)
+            return self.serialize_user(user) if user else None
+
+    def create_user(self, payload):
+        with self._lock:
+            fields = self._validate_user(payload, require_password=True)
+            user_id = self._next_user_id
+            self._next_user_id += 1
+            self.users[user_id] = dict(fields, id=user_id)
+            return self.serialize_user(self.users[user_id])
+
+    def update_user(self, user_id, payload):
+        with self._lock:
+            if user_id not in self.users:
+                raise ValidationError("Record Not Found", status=404)
+            fields = self._validate_user(payload, user_id=user_id,
+                                         require_password=bool(payload.get("changePassword")))
+            if not payload.get("changePassword"):
+                fields["password"] = self.users[user_id]["password"]
+            self.users[user_id].update(fields)
+            return self.serialize_user(self.users[user_id])
+
+    def delete_users(self, ids, current_user_id=None):
+        """Delete users by id; the logged-in user cannot delete themselves"""
+        with self._lock:
+            if current_user_id in ids:
+                raise ValidationError("Cannot be deleted")
+            missing = [i for i in ids if i not in self.users]
+            if missing:
+                raise ValidationError("Record Not Found", status=404)
+            return [self.serialize_user(self.users.pop(i)) for i in ids]
+
+    def _validate_user(self, payload, user_id=None, require_password=False):
+        username = (payload.get("username") or "").strip()
+        if len(username) < 5:
+            raise ValidationError("Should be at least 5 characters")
+        if any(u["userName"].lower() == username.lower() and u["id"] != user_id for u in self.users.values()):
+            raise ValidationError("Already exists")
+        role_id = payload.get("userRoleId")
+        if role_id not in ROLES:
+            raise ValidationError("Invalid user role")
+        if payload.get("empNumber") not in self.employees:
+            raise ValidationError("Invalid")
+        password = payload.get("password") or ""
+        if require_password and (len(password) < 7 or not any(c.isdigit() for c in password)):
+            raise ValidationError("Your password must contain minimum 1 number and 7 characters")
+        return {
+            "userName": username,
+            "userRoleId": role_id,
+            "empNumber": payload["empNumber"],
+            "status": bool(payload.get("status")),
+            "password": password,
+        }
+
+    # ----- employees ----- #
+
+    def search_employees(self, name_or_id=None, offset=0, limit=50):
+        with self._lock:
+            employees = sorted(self.employees.values(), key=lambda e: (e["firstName"], e["lastName"]))
+            if name_or_id:
+                needle = name_or_id.lower()
+                employees = [
+                    e for e in employees
+                    if needle in employee_name(e).lower() or needle == e["employeeId"].lower()
+                ]
+            page = [copy.deepcopy(e) for e in employees[offset:offset + limit]]
+            return page, len(employees)
+
+    def create_employee(self, payload):
+        with self._lock:
+            first, last = (payload.get("firstName") or "").strip(), (payload.get("lastName") or "").strip()
+            if not first or not last:
+                raise ValidationError("Required")
+            emp_number = self._next_emp_number
+            self._next_emp_number += 1
+            self.employees[emp_number] = {
+                "empNumber": emp_number,
+                "employeeId": payload.get("employeeId") or f"{emp_number:04d}",
+                "firstName": first,
+                "middleName": (payload.get("middleName") or "").strip(),
+                "lastName": last,
+                "terminationId": None,
+            }
+            return copy.deepcopy(self.employees[emp_number])
+
+    def delete_employees(self, ids):
+        """Delete employees and the system users attached to them"""
+        with self._lock:
+            missing = [i for i in ids if i not in self.employees]
+            if missing:
+                raise ValidationError("Record Not Found", status=404)
+            for user_id in [u["id"] for u in self.users.values() if u["empNumber"] in ids]:
+                del self.users[user_id]
+            return [self.employees.pop(i) for i in ids]
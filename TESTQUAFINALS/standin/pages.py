@@ -0,0 +1,347 @@
+"""
+Server-rendered HTML for the local OrangeHRM stand-in
+Markup mirrors the OrangeHRM 5 DOM (oxd-* classes, role attributes, labels)
+so utils/locators.py resolves the same CSS/XPath strategies as on the demo site
+"""
+from html import escape
+import json
+
+SIDEBAR_ITEMS = [
+    ("Admin", "/web/index.php/admin/viewAdminModule"),
+    ("PIM", "/web/index.php/pim/viewPimModule"),
+    ("Leave", "/web/index.php/leave/viewLeaveModule"),
+    ("Time", "/web/index.php/time/viewTimeModule"),
+    ("Recruitment", "/web/index.php/recruitment/viewRecruitmentModule"),
+    ("My Info", "/web/index.php/pim/viewMyDetails"),
+    ("Performance", "/web/index.php/performance/viewPerformanceModule"),
+    ("Dashboard", "/web/index.php/dashboard/index"),
+    ("Directory", "/web/index.php/directory/viewDirectory"),
+    ("Maintenance", "/web/index.php/maintenance/viewMaintenanceModule"),
+    ("Claim", "/web/index.php/claim/viewClaimModule"),
+    ("Buzz", "/web/index.php/buzz/viewBuzz"),
+]
+
+# Admin top navigation: (tab, [(link text, path)]) - tabs without a menu are plain links
+ADMIN_TABS = [
+    ("User Management", [("Users", "/web/index.php/admin/viewSystemUsers")]),
+    ("Job", [
+        ("Job Titles", "/web/index.php/admin/viewJobTitleList"),
+        ("Pay Grades", "/web/index.php/admin/viewPayGrades"),
+        ("Employment Status", "/web/index.php/admin/employmentStatus"),
+        ("Job Categories", "/web/index.php/admin/jobCategory"),
+        ("Work Shifts", "/web/index.php/admin/workShift"),
+    ]),
+    ("Organization", [
+        ("General Information", "/web/index.php/admin/viewOrganizationGeneralInformation"),
+        ("Locations", "/web/index.php/admin/viewLocations"),
+        ("Structure", "/web/index.php/admin/viewCompanyStructure"),
+    ]),
+    ("Qualifications", [
+        ("Skills", "/web/index.php/admin/viewSkills"),
+        ("Education", "/web/index.php/admin/viewEducation"),
+        ("Licenses", "/web/index.php/admin/viewLicenses"),
+        ("Languages", "/web/index.php/admin/viewLanguages"),
+        ("Memberships", "/web/index.php/admin/membership"),
+    ]),
+    ("Nationalities", "/web/index.php/admin/nationality"),
+    ("Corporate Branding", "/web/index.php/admin/addTheme"),
+    ("Configuration", [
+        ("Email Configuration", "/web/index.php/admin/listMailConfiguration"),
+        ("Email Subscriptions", "/web/index.php/admin/viewEmailNotification"),
+        ("Localization", "/web/index.php/admin/localization"),
+        ("Language Packages", "/web/index.php/admin/languagePackage"),
+        ("Modules", "/web/index.php/admin/viewModules"),
+        ("Social Media Authentication", "/web/index.php/admin/openIdProvider"),
+        ("Register OAuth Client", "/web/index.php/admin/registerOAuthClient"),
+        ("LDAP", "/web/index.php/admin/ldapConfiguration"),
+    ]),
+]
+
+MODULE_TITLES = {
+    "admin": "Admin", "pim": "PIM", "leave": "Leave", "time": "Time",
+    "recruitment": "Recruitment", "performance": "Performance", "dashboard": "Dashboard",
+    "directory": "Directory", "maintenance": "Maintenance", "claim": "Claim",
+    "buzz": "Buzz", "help": "Help",
+}
+
+UPGRADE_PATH = "/open-source/upgrade-to-advanced"
+
+
+def document(title, body, page_state=None):
+    """Full HTML document; page_state is exposed to app.js as window.STANDIN"""
+    state = json.dumps(page_state or {}).replace("</", "<\\/")
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{escape(title)}</title>
+<link rel="stylesheet" href="/web/dist/app.css">
+</head>
+<body>
+<div id="app">{body}</div>
+<div class="oxd-toaster_1" id="oxd-toaster_1"></div>
+<script>window.STANDIN = {state};</script>
+<script src="/web/dist/app.js"></script>
+</body>
+</html>
+"""
+
+
+def field_error(message):
+    return f'<span class="oxd-text oxd-text--span oxd-input-field-error-message oxd-input-group__message">{escape(message)}</span>'
+
+
+def input_group(label, control, required=False):
+    required_class = " oxd-input-field-required" if required else ""
+    return f"""<div class="oxd-input-group oxd-input-field-bottom-space">
+<div class="oxd-input-group__label-wrapper"><label class="oxd-label{required_class}">{escape(label)}</label></div>
+<div class="">{control}</div>
+</div>"""
+
+
+def text_input(name="", input_type="text", placeholder=""):
+    name_attr = f' name="{escape(name)}"' if name else ""
+    placeholder_attr = f' placeholder="{escape(placeholder)}"' if placeholder else ""
+    return f'<input class="oxd-input oxd-input--active" type="{input_type}"{name_attr}{placeholder_attr} autocomplete="off">'
+
+
+def select_control(field):
+    # Options are rendered by app.js into a listbox that only exists while open
+    return f"""<div class="oxd-select-wrapper" data-select="{escape(field)}">
+<div class="oxd-select-text oxd-select-text--active" tabindex="0">
+<div class="oxd-select-text-input">-- Select --</div>
+<div class="oxd-select-text--after"><i class="oxd-icon bi-caret-down-fill oxd-select-text--arrow"></i></div>
+</div>
+</div>"""
+
+
+def autocomplete_control(field):
+    return f"""<div class="oxd-autocomplete-wrapper" data-autocomplete="{escape(field)}">
+<div class="oxd-autocomplete-text-input oxd-autocomplete-text-input--active">
+<input placeholder="Type for hints..." autocomplete="off">
+</div>
+</div>"""
+
+
+def grid_item(content):
+    return f'<div class="oxd-grid-item oxd-grid-item--gutters">{content}</div>'
+
+
+# ---------- login ---------- #
+
+def login_page(token, error=None):
+    alert = ""
+    if error:
+        alert = f"""<div class="oxd-alert oxd-alert--error" role="alert">
+<div class="oxd-alert-content oxd-alert-content--error">
+<i class="oxd-icon bi-exclamation-circle oxd-alert-content-icon"></i>
+<p class="oxd-text oxd-text--p oxd-alert-content-text">{escape(error)}</p>
+</div>
+</div>"""
+    body = f"""<div class="orangehrm-login-layout">
+<div class="orangehrm-login-container">
+<div class="orangehrm-login-slot-wrapper">
+<div class="orangehrm-login-slot">
+<h5 class="oxd-text oxd-text--h5 orangehrm-login-title">Login</h5>
+<div class="orangehrm-login-form">
+<div class="orangehrm-login-error">{alert}</div>
+<form class="oxd-form" method="post" action="/web/index.php/auth/validate" novalidate>
+<input type="hidden" name="_token" value="{escape(token)}">
+<div class="oxd-form-row">{input_group("Username", text_input("username", placeholder="Username"))}</div>
+<div class="oxd-form-row">{input_group("Password", text_input("password", "password", "Password"))}</div>
+<div class="oxd-form-actions orangehrm-login-action">
+<button type="submit" class="oxd-button oxd-button--medium oxd-button--main orangehrm-login-button">Login</button>
+</div>
+</form>
+</div>
+</div>
+</div>
+</div>
+</div>"""
+    return document("OrangeHRM", body, {"page": "login"})
+
+
+# ---------- authenticated layout ---------- #
+
+def sidebar():
+    items = "\n".join(
+        f'<li class="oxd-main-menu-item-wrapper"><a class="oxd-main-menu-item" href="{href}">'
+        f'<span class="oxd-text oxd-text--span oxd-main-menu-item--name">{escape(name)}</span></a></li>'
+        for name, href in SIDEBAR_ITEMS
+    )
+    return f"""<aside class="oxd-sidepanel">
+<nav class="oxd-navbar-nav" role="navigation" aria-label="Sidepanel">
+<div class="oxd-sidepanel-body">
+<div class="oxd-main-menu-search"><input class="oxd-input oxd-input--active" placeholder="Search"></div>
+<ul class="oxd-main-menu">
+{items}
+</ul>
+</div>
+</nav>
+</aside>"""
+
+
+def admin_tabs():
+    tabs = []
+    for name, target in ADMIN_TABS:
+        if isinstance(target, str):
+            tabs.append(
+                f'<li class="oxd-topbar-body-nav-tab"><a class="oxd-topbar-body-nav-tab-item" href="{target}">{escape(name)}</a></li>'
+            )
+            continue
+        links = "".join(
+            f'<li><a href="{href}" class="oxd-topbar-body-nav-tab-link" role="menuitem">{escape(text)}</a></li>'
+            for text, href in target
+        )
+        tabs.append(
+            f'<li class="oxd-topbar-body-nav-tab --parent"><span class="oxd-topbar-body-nav-tab-item">{escape(name)} '
+            f'<i class="oxd-icon bi-chevron-down"></i></span>'
+            f'<ul class="oxd-dropdown-menu" role="menu">{links}</ul></li>'
+        )
+    return f'<nav class="oxd-topbar-body-nav" aria-label="Topbar Menu"><ul>{"".join(tabs)}</ul></nav>'
+
+
+def layout(title, module, content, user_name, page_state=None, level=None):
+    """Sidebar, top bar (breadcrumb, upgrade button, user menu) and page content"""
+    breadcrumb = f'<h6 class="oxd-text oxd-text--h6 oxd-topbar-header-breadcrumb-module">{escape(module)}</h6>'
+    if level:
+        breadcrumb += f'<span class="oxd-text oxd-text--span oxd-topbar-header-breadcrumb-level">/ {escape(level)}</span>'
+    nav = admin_tabs() if module == "Admin" else ""
+    body = f"""<div class="oxd-layout">
+<div class="oxd-layout-navigation">{sidebar()}</div>
+<div class="oxd-layout-container">
+<header class="oxd-topbar">
+<div class="oxd-topbar-header">
+<div class="oxd-topbar-header-title"><span class="oxd-topbar-header-breadcrumb">{breadcrumb}</span></div>
+<div class="oxd-topbar-header-userarea">
+<a href="{UPGRADE_PATH}" target="_blank" class="orangehrm-upgrade-link">
+<button type="button" class="oxd-glass-button orangehrm-upgrade-button"><i class="oxd-icon bi-stars oxd-button-icon"></i> Upgrade</button>
+</a>
+<ul>
+<li class="oxd-userdropdown">
+<span class="oxd-userdropdown-tab">
+<img alt="profile picture" class="oxd-userdropdown-img" src="data:image/gif;base64,R0lGODlhAQABAAAAACw=">
+<p class="oxd-userdropdown-name">{escape(user_name)}</p>
+<i class="oxd-icon bi-caret-down-fill oxd-userdropdown-icon"></i>
+</span>
+<ul class="oxd-dropdown-menu oxd-userdropdown-menu" role="menu">
+<li><a href="#" class="oxd-userdropdown-link" role="menuitem" data-action="about">About</a></li>
+<li><a href="/web/index.php/help/support" class="oxd-userdropdown-link" role="menuitem">Support</a></li>
+<li><a href="/web/index.php/pim/updatePassword" class="oxd-userdropdown-link" role="menuitem">Change Password</a></li>
+<li><a href="/web/index.php/auth/logout" class="oxd-userdropdown-link" role="menuitem">Logout</a></li>
+</ul>
+</li>
+</ul>
+</div>
+</div>
+<div class="oxd-topbar-body">{nav}</div>
+</header>
+<div class="oxd-layout-context">{content}</div>
+</div>
+</div>"""
+    return document(title, body, page_state)
+
+
+def card(title, text):
+    return f"""<div class="orangehrm-card-container">
+<h6 class="oxd-text oxd-text--h6 orangehrm-main-title">{escape(title)}</h6>
+<hr class="oxd-divider">
+<p class="oxd-text oxd-text--p">{escape(text)}</p>
+</div>"""
+
+
+def dashboard_page(user_name, state):
+    widgets = "".join(
+        f'<div class="oxd-grid-item oxd-grid-item--gutters orangehrm-dashboard-widget">{card(name, "Stand-in widget")}</div>'
+        for name in ("Time at Work", "My Actions", "Quick Launch", "Buzz Latest Posts")
+    )
+    content = f'<div class="oxd-grid-3 orangehrm-dashboard-grid">{widgets}</div>'
+    return layout("Dashboard", "Dashboard", content, user_name, state)
+
+
+def system_users_page(user_name, state):
+    form_fields = "".join([
+        grid_item(input_group("Username", text_input())),
+        grid_item(input_group("User Role", select_control("userRole"))),
+        grid_item(input_group("Employee Name", autocomplete_control("employee"))),
+        grid_item(input_group("Status", select_control("status"))),
+    ])
+    content = f"""<div class="oxd-table-filter">
+<div class="oxd-table-filter-header"><div class="oxd-table-filter-header-title"><h5 class="oxd-text oxd-text--h5 oxd-table-filter-title">System Users</h5></div></div>
+<hr class="oxd-divider">
+<form class="oxd-form" novalidate>
+<div class="oxd-form-row"><div class="oxd-grid-4 orangehrm-full-width-grid">{form_fields}</div></div>
+<hr class="oxd-divider">
+<div class="oxd-form-actions">
+<button type="button" class="oxd-button oxd-button--medium oxd-button--ghost">Reset</button>
+<button type="submit" class="oxd-button oxd-button--medium oxd-button--secondary orangehrm-left-space">Search</button>
+</div>
+</form>
+</div>
+<div class="orangehrm-paper-container">
+<div class="orangehrm-header-container">
+<button type="button" class="oxd-button oxd-button--medium oxd-button--secondary"><i class="oxd-icon bi-plus oxd-button-icon"></i> Add </button>
+</div>
+<hr class="oxd-divider">
+<div class="orangehrm-horizontal-padding orangehrm-vertical-padding"><span class="oxd-text oxd-text--span orangehrm-records-found"></span></div>
+<div class="orangehrm-container">
+<div class="oxd-table orangehrm-employee-list" role="table">
+<div class="oxd-table-header" role="rowgroup">
+<div class="oxd-table-header-row" role="row">
+<div class="oxd-table-header-cell oxd-padding-cell" role="columnheader"></div>
+<div class="oxd-table-header-cell oxd-padding-cell" role="columnheader">Username</div>
+<div class="oxd-table-header-cell oxd-padding-cell" role="columnheader">User Role</div>
+<div class="oxd-table-header-cell oxd-padding-cell" role="columnheader">Employee Name</div>
+<div class="oxd-table-header-cell oxd-padding-cell" role="columnheader">Status</div>
+<div class="oxd-table-header-cell oxd-padding-cell" role="columnheader">Actions</div>
+</div>
+</div>
+<div class="oxd-table-body" role="rowgroup"></div>
+</div>
+</div>
+</div>"""
+    return layout("Admin", "Admin", content, user_name, state, level="User Management")
+
+
+def save_user_page(user_name, state):
+    editing = state.get("userId") is not None
+    title = "Edit User" if editing else "Add User"
+    fields = "".join([
+        grid_item(input_group("User Role", select_control("userRole"), required=True)),
+        grid_item(input_group("Employee Name", autocomplete_control("employee"), required=True)),
+        grid_item(input_group("Status", select_control("status"), required=True)),
+        grid_item(input_group("Username", text_input(), required=True)),
+    ])
+    password_row = ""
+    if not editing:
+        password_row = f"""<div class="oxd-form-row user-password-row"><div class="oxd-grid-2 orangehrm-full-width-grid">
+{grid_item(input_group("Password", text_input(input_type="password"), required=True))}
+{grid_item(input_group("Confirm Password", text_input(input_type="password"), required=True))}
+</div></div>"""
+    content = f"""<div class="orangehrm-card-container">
+<h6 class="oxd-text oxd-text--h6 orangehrm-main-title">{title}</h6>
+<hr class="oxd-divider">
+<form class="oxd-form" novalidate>
+<div class="oxd-form-row"><div class="oxd-grid-2 orangehrm-full-width-grid">{fields}</div></div>
+{password_row}
+<hr class="oxd-divider">
+<div class="oxd-form-actions">
+<p class="oxd-text oxd-text--p orangehrm-form-hint">* Required</p>
+<button type="button" class="oxd-button oxd-button--medium oxd-button--ghost">Cancel</button>
+<button type="submit" class="oxd-button oxd-button--medium oxd-button--secondary orangehrm-left-space">Save</button>
+</div>
+</form>
+</div>"""
+    return layout(title, "Admin", content, user_name, state, level="User Management")
+
+
+def module_page(module, page, user_name, state):
+    """Placeholder for modules the suite only navigates to (PIM, Leave, admin sub-pages, ...)"""
+    title = MODULE_TITLES.get(module, module.title())
+    content = card(page, f"{title} stand-in page")
+    return layout(title, title, content, user_name, state)
+
+
+def upgrade_page():
+    body = card("Upgrade to OrangeHRM Advanced", "Stand-in for the external upgrade page")
+    return document("Upgrade to Advanced", body, {"page": "upgrade"})
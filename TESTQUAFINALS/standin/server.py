@@ -0,0 +1,341 @@
+"""
+Local OrangeHRM stand-in server (standard library only)
+
+Serves the pages and v2 API endpoints the suite touches - login, dashboard,
+Admin > System Users with dropdowns, employee autocomplete and toasts,
+add/edit user, admin top tabs and the user menu - with deterministic seed
+data from standin/data.py. Run it standalone with `python -m standin` or let
+conftest.py start it with `pytest --target local`.
+"""
+from http import HTTPStatus
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+import json
+import logging
+import mimetypes
+import os
+import re
+import secrets
+import threading
+
+from standin import pages
+from standin.data import DataStore, ValidationError, employee_name
+
+logger = logging.getLogger(__name__)
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+SESSION_COOKIE = "orangehrm"
+FLASH_COOKIE = "orangehrm_flash"
+LOGIN_PATH = "/web/index.php/auth/login"
+DASHBOARD_PATH = "/web/index.php/dashboard/index"
+
+ROUTES = []
+
+
+def route(method, pattern, auth=True):
+    """Register a handler method for an HTTP method and a full-match path regex"""
+    def register(func):
+        ROUTES.append((method, re.compile(pattern), func, auth))
+        return func
+    return register
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Dispatches requests to the @route handlers below"""
+    server_version = "OrangeHRM-StandIn/1.0"
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without TCP_NODELAY a kept-alive
+    # connection waits for the client's delayed ACK (~40 ms) between them
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+    @property
+    def app(self):
+        return self.server.app
+
+    def _dispatch(self, method):
+        url = urlsplit(self.path)
+        self.query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        self.cookies = SimpleCookie(self.headers.get("Cookie", ""))
+        self.user_id = self.app.session_user(self.cookie(SESSION_COOKIE))
+
+        path_allowed = False
+        for route_method, pattern, func, auth in ROUTES:
+            match = pattern.fullmatch(url.path)
+            if not match:
+                continue
+            path_allowed = True
+            if route_method != method:
+                continue
+            if auth and self.user_id is None:
+                if "/api/" in url.path:
+                    return self.send_api_error(HTTPStatus.UNAUTHORIZED, "Session expired")
+                return self.redirect(LOGIN_PATH)
+            try:
+                return func(self, *match.groups())
+            except ValidationError as e:
+                return self.send_api_error(e.status, e.message)
+        if path_allowed:
+            return self.send_api_error(HTTPStatus.METHOD_NOT_ALLOWED, "Method Not Allowed")
+        self.send_body(HTTPStatus.NOT_FOUND, b"Not Found", "text/plain")
+
+    # ----- request/response helpers ----- #
+
+    def cookie(self, name):
+        morsel = self.cookies.get(name)
+        return morsel.value if morsel else None
+
+    def read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def read_json(self):
+        try:
+            return json.loads(self.read_body() or b"{}")
+        except ValueError:
+            raise ValidationError("Invalid JSON", status=400)
+
+    def send_body(self, status, body, content_type, headers=()):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def send_html(self, html, headers=()):
+        self.send_body(HTTPStatus.OK, html.encode("utf-8"), "text/html; charset=utf-8", headers)
+
+    def send_json(self, payload, status=HTTPStatus.OK):
+        self.send_body(status, json.dumps(payload).encode("utf-8"), "application/json")
+
+    def send_api_error(self, status, message):
+        self.send_json({"error": {"status": str(int(status)), "message": message}}, status)
+
+    def redirect(self, location, headers=()):
+        self.send_body(HTTPStatus.FOUND, b"", "text/plain", [("Location", location), *headers])
+
+    def page_state(self, page, **extra):
+        return dict(page=page, currentUserId=self.user_id, **extra)
+
+    def user_name(self):
+        user = self.app.store.get_user(self.user_id)
+        return employee_name(user["employee"], with_middle=False) if user else ""
+
+    # ----- auth ----- #
+
+    @route("GET", r"/|/web/index\.php/?", auth=False)
+    def root(self):
+        self.redirect(DASHBOARD_PATH if self.user_id else LOGIN_PATH)
+
+    @route("GET", LOGIN_PATH, auth=False)
+    def login(self):
+        if self.user_id is not None:
+            return self.redirect(DASHBOARD_PATH)
+        error = "Invalid credentials" if self.cookie(FLASH_COOKIE) else None
+        clear_flash = [("Set-Cookie", f"{FLASH_COOKIE}=; Path=/; Max-Age=0")] if error else []
+        self.send_html(pages.login_page(self.app.csrf_token, error), clear_flash)
+
+    @route("POST", r"/web/index\.php/auth/validate", auth=False)
+    def validate(self):
+        form = {k: v[-1] for k, v in parse_qs(self.read_body().decode("utf-8")).items()}
+        user_id = None
+        if form.get("_token") == self.app.csrf_token:
+            user_id = self.app.store.authenticate(form.get("username", ""), form.get("password", ""))
+        if user_id is None:
+            return self.redirect(LOGIN_PATH, [("Set-Cookie", f"{FLASH_COOKIE}=invalid; Path=/; HttpOnly")])
+        session_id = self.app.create_session(user_id)
+        self.redirect(DASHBOARD_PATH, [("Set-Cookie", f"{SESSION_COOKIE}={session_id}; Path=/; HttpOnly; SameSite=Lax")])
+
+    @route("GET", r"/web/index\.php/auth/logout", auth=False)
+    def logout(self):
+        self.app.end_session(self.cookie(SESSION_COOKIE))
+        self.redirect(LOGIN_PATH, [("Set-Cookie", f"{SESSION_COOKIE}=; Path=/; Max-Age=0")])
+
+    # ----- pages ----- #
+
+    @route("GET", DASHBOARD_PATH)
+    def dashboard(self):
+        self.send_html(pages.dashboard_page(self.user_name(), self.page_state("dashboard")))
+
+    @route("GET", r"/web/index\.php/admin/viewAdminModule")
+    def admin_module(self):
+        self.redirect("/web/index.php/admin/viewSystemUsers")
+
+    @route("GET", r"/web/index\.php/admin/viewSystemUsers")
+    def system_users(self):
+        self.send_html(pages.system_users_page(self.user_name(), self.page_state("systemUsers")))
+
+    @route("GET", r"/web/index\.php/admin/saveSystemUser(?:/(\d+))?")
+    def save_system_user(self, user_id=None):
+        user_id = int(user_id) if user_id else None
+        if user_id is not None and self.app.store.get_user(user_id) is None:
+            return self.redirect("/web/index.php/admin/viewSystemUsers")
+        self.send_html(pages.save_user_page(self.user_name(), self.page_state("saveSystemUser", userId=user_id)))
+
+    @route("GET", r"/web/index\.php/(\w+)/(\w+)")
+    def module(self, module, page):
+        self.send_html(pages.module_page(module, page, self.user_name(), self.page_state(module)))
+
+    @route("GET", re.escape(pages.UPGRADE_PATH), auth=False)
+    def upgrade(self):
+        self.send_html(pages.upgrade_page())
+
+    @route("GET", r"/web/dist/([\w.-]+)", auth=False)
+    def static(self, name):
+        path = os.path.join(STATIC_DIR, name)
+        if not os.path.isfile(path):
+            return self.send_body(HTTPStatus.NOT_FOUND, b"Not Found", "text/plain")
+        with open(path, "rb") as f:
+            body = f.read()
+        content_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+        self.send_body(HTTPStatus.OK, body, content_type)
+
+    # ----- v2 API ----- #
+
+    @route("GET", r"/web/index\.php/api/v2/admin/users")
+    def list_users(self):
+        q = self.query
+        status = {"1": True, "0": False}.get(q.get("status"))
+        users, total = self.app.store.search_users(
+            username=q.get("username"),
+            user_role_id=int(q["userRoleId"]) if q.get("userRoleId") else None,
+            emp_number=int(q["empNumber"]) if q.get("empNumber") else None,
+            status=status,
+            sort_order=q.get("sortOrder", "ASC"),
+            offset=int(q.get("offset", 0)),
+            limit=int(q.get("limit", 50)),
+        )
+        self.send_json({"data": users, "meta": {"total": total}, "rels": []})
+
+    @route("POST", r"/web/index\.php/api/v2/admin/users")
+    def create_user(self):
+        self.send_json({"data": self.app.store.create_user(self.read_json()), "meta": [], "rels": []})
+
+    @route("DELETE", r"/web/index\.php/api/v2/admin/users")
+    def delete_users(self):
+        ids = [int(i) for i in self.read_json().get("ids", [])]
+        deleted = self.app.store.delete_users(ids, current_user_id=self.user_id)
+        self.send_json({"data": [u["id"] for u in deleted], "meta": [], "rels": []})
+
+    @route("GET", r"/web/index\.php/api/v2/admin/users/(\d+)")
+    def get_user(self, user_id):
+        user = self.app.store.get_user(int(user_id))
+        if user is None:
+            raise ValidationError("Record Not Found", status=404)
+        self.send_json({"data": user, "meta": [], "rels": []})
+
+    @route("PUT", r"/web/index\.php/api/v2/admin/users/(\d+)")
+    def update_user(self, user_id):
+        self.send_json({"data": self.app.store.update_user(int(user_id), self.read_json()), "meta": [], "rels": []})
+
+    @route("GET", r"/web/index\.php/api/v2/pim/employees")
+    def list_employees(self):
+        employees, total = self.app.store.search_employees(
+            name_or_id=self.query.get("nameOrId"),
+            offset=int(self.query.get("offset", 0)),
+            limit=int(self.query.get("limit", 50)),
+        )
+        self.send_json({"data": employees, "meta": {"total": total}, "rels": []})
+
+    @route("POST", r"/web/index\.php/api/v2/pim/employees")
+    def create_employee(self):
+        self.send_json({"data": self.app.store.create_employee(self.read_json()), "meta": [], "rels": []})
+
+    @route("DELETE", r"/web/index\.php/api/v2/pim/employees")
+    def delete_employees(self):
+        ids = [int(i) for i in self.read_json().get("ids", [])]
+        deleted = self.app.store.delete_employees(ids)
+        self.send_json({"data": [e["empNumber"] for e in deleted], "meta": [], "rels": []})
+
+    # ----- stand-in control ----- #
+
+    @route("GET", r"/standin/health", auth=False)
+    def health(self):
+        self.send_json({"status": "ok"})
+
+    @route("POST", r"/standin/reset", auth=False)
+    def reset(self):
+        self.app.store.reset()
+        self.send_json({"status": "reset"})
+
+
+class StandInServer:
+    """
+    The stand-in app: seeded data store, login sessions and the HTTP server
+
+    Usage:
+        server = StandInServer()
+        base_url = server.start()   # background thread, ephemeral port
+        ...
+        server.stop()
+    """
+
+    def __init__(self, host="127.0.0.1", port=0):
+        self.store = DataStore()
+        self.csrf_token = secrets.token_hex(16)
+        self._sessions = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self.httpd = ThreadingHTTPServer((host, port), StandInHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.app = self
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def create_session(self, user_id):
+        session_id = secrets.token_hex(16)
+        with self._lock:
+            self._sessions[session_id] = user_id
+        return session_id
+
+    def session_user(self, session_id):
+        with self._lock:
+            user_id = self._sessions.get(session_id)
+        # Sessions of deleted users are dropped like an expired login
+        if user_id is not None and self.store.get_user(user_id) is None:
+            return None
+        return user_id
+
+    def end_session(self, session_id):
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def start(self):
+        """Serve in a daemon thread and return the base URL"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="orangehrm-standin", daemon=True)
+        self._thread.start()
+        logger.info(f"✓ OrangeHRM stand-in serving at {self.base_url}")
+        return self.base_url
+
+    def serve_forever(self):
+        logger.info(f"✓ OrangeHRM stand-in serving at {self.base_url}")
+        self.httpd.serve_forever()
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+        logger.info("✓ OrangeHRM stand-in stopped")
@@ -0,0 +1,449 @@
+/*
+ * Client behaviour for the local OrangeHRM stand-in
+ * Dropdowns, autocomplete, toasts, user menu, sidebar search and the
+ * System Users grid / user form, driven by the same v2 API as OrangeHRM
+ */
+(function () {
+    'use strict';
+
+    const STATE = window.STANDIN || {};
+    const API = '/web/index.php/api/v2';
+    const USERS_PATH = '/web/index.php/admin/viewSystemUsers';
+    const ROLE_OPTIONS = [{id: 1, label: 'Admin'}, {id: 2, label: 'ESS'}];
+    const STATUS_OPTIONS = [{id: 1, label: 'Enabled'}, {id: 0, label: 'Disabled'}];
+
+    function el(tag, attrs, children) {
+        const node = document.createElement(tag);
+        Object.entries(attrs || {}).forEach(([k, v]) => node.setAttribute(k, v));
+        [].concat(children || []).forEach(child => {
+            node.appendChild(typeof child === 'string' ? document.createTextNode(child) : child);
+        });
+        return node;
+    }
+
+    async function api(method, path, body) {
+        const options = {method: method, headers: {'Content-Type': 'application/json'}};
+        if (body !== undefined) options.body = JSON.stringify(body);
+        const response = await fetch(API + path, options);
+        const payload = await response.json();
+        if (!response.ok) {
+            const error = new Error(payload.error ? payload.error.message : response.statusText);
+            error.status = response.status;
+            throw error;
+        }
+        return payload;
+    }
+
+    function fullName(employee, withMiddle) {
+        const parts = [employee.firstName, withMiddle === false ? '' : employee.middleName, employee.lastName];
+        return parts.filter(Boolean).join(' ');
+    }
+
+    // ---------- toasts ---------- //
+
+    const TOAST_TITLES = {success: 'Success', error: 'Error', info: 'Info', warn: 'Warning'};
+
+    function toast(type, message) {
+        const toaster = document.getElementById('oxd-toaster_1');
+        const node = el('div', {class: 'oxd-toast oxd-toast--' + type + ' oxd-toast-container--toast'}, [
+            el('div', {class: 'oxd-toast-start'}, [
+                el('div', {class: 'oxd-toast-content oxd-toast-content--' + type}, [
+                    el('p', {class: 'oxd-text oxd-text--p oxd-text--toast-title oxd-toast-content-text'}, TOAST_TITLES[type]),
+                    el('p', {class: 'oxd-text oxd-text--p oxd-text--toast-message oxd-toast-content-text'}, message),
+                ]),
+            ]),
+        ]);
+        toaster.appendChild(node);
+        setTimeout(() => node.remove(), 4000);
+    }
+
+    // ---------- listbox widgets ---------- //
+
+    function closeListboxes() {
+        document.querySelectorAll("div[role='listbox']").forEach(lb => lb.remove());
+    }
+
+    function renderListbox(wrapper, className, options, onPick) {
+        closeListboxes();
+        const listbox = el('div', {class: className, role: 'listbox'});
+        options.forEach(option => {
+            const item = el('div', {class: option.className, role: 'option'},
+                option.plain ? option.label : [el('span', {}, option.label)]);
+            if (onPick && !option.plain) {
+                item.addEventListener('click', event => {
+                    event.stopPropagation();
+                    onPick(option);
+                    closeListboxes();
+                });
+            }
+            listbox.appendChild(item);
+        });
+        wrapper.appendChild(listbox);
+    }
+
+    // Custom select: the listbox only exists while the dropdown is open
+    function createSelect(wrapper, options) {
+        const text = wrapper.querySelector('.oxd-select-text-input');
+        const select = {value: null};
+        select.set = function (id) {
+            const option = options.find(o => o.id === id);
+            select.value = option ? option.id : null;
+            text.textContent = option ? option.label : '-- Select --';
+        };
+        wrapper.querySelector('.oxd-select-text').addEventListener('click', event => {
+            event.stopPropagation();
+            if (wrapper.querySelector("div[role='listbox']")) {
+                closeListboxes();
+                return;
+            }
+            const items = [{id: null, label: '-- Select --'}].concat(options)
+                .map(o => ({id: o.id, label: o.label, className: 'oxd-select-option'}));
+            renderListbox(wrapper, 'oxd-select-dropdown --positon-bottom', items, option => select.set(option.id));
+        });
+        return select;
+    }
+
+    // Employee autocomplete: "Searching...." while the request is in flight, then matches
+    function createAutocomplete(wrapper) {
+        const input = wrapper.querySelector('input');
+        const auto = {value: null};
+        let timer = null;
+        let sequence = 0;
+
+        auto.set = function (employee) {
+            auto.value = employee;
+            input.value = employee ? fullName(employee) : '';
+        };
+        auto.text = () => input.value.trim();
+
+        input.addEventListener('input', () => {
+            auto.value = null;
+            clearTimeout(timer);
+            const query = input.value.trim();
+            if (!query) {
+                closeListboxes();
+                return;
+            }
+            renderListbox(wrapper, 'oxd-autocomplete-dropdown --positon-bottom',
+                [{label: 'Searching....', className: 'oxd-autocomplete-option', plain: true}]);
+            const current = ++sequence;
+            timer = setTimeout(async () => {
+                const result = await api('GET', '/pim/employees?limit=50&nameOrId=' + encodeURIComponent(query));
+                if (current !== sequence) return;
+                const items = result.data.length
+                    ? result.data.map(e => ({label: fullName(e), employee: e, className: 'oxd-autocomplete-option'}))
+                    : [{label: 'No Records Found', className: 'oxd-autocomplete-option', plain: true}];
+                renderListbox(wrapper, 'oxd-autocomplete-dropdown --positon-bottom', items, option => auto.set(option.employee));
+            }, 250);
+        });
+        return auto;
+    }
+
+    function fieldGroup(control) {
+        return control.closest('.oxd-input-group');
+    }
+
+    function setFieldError(control, message) {
+        const group = fieldGroup(control);
+        const existing = group.querySelector('.oxd-input-field-error-message');
+        if (existing) existing.remove();
+        if (message) {
+            group.appendChild(el('span', {
+                class: 'oxd-text oxd-text--span oxd-input-field-error-message oxd-input-group__message',
+            }, message));
+        }
+    }
+
+    // ---------- layout: sidebar, user menu, admin tabs, about dialog ---------- //
+
+    function initSidebarSearch() {
+        const search = document.querySelector(".oxd-main-menu-search input");
+        const menu = document.querySelector('ul.oxd-main-menu');
+        if (!search || !menu) return;
+        const items = Array.from(menu.children);
+        search.addEventListener('input', () => {
+            const term = search.value.trim().toLowerCase();
+            menu.replaceChildren(...items.filter(li => li.textContent.trim().toLowerCase().includes(term)));
+        });
+    }
+
+    function initDropdownMenus() {
+        document.querySelectorAll('.oxd-userdropdown-tab, .oxd-topbar-body-nav-tab.--parent > span').forEach(trigger => {
+            trigger.addEventListener('click', event => {
+                event.stopPropagation();
+                const owner = trigger.parentElement;
+                const wasOpen = owner.classList.contains('--active');
+                document.querySelectorAll('.--active').forEach(open => open.classList.remove('--active'));
+                if (!wasOpen) owner.classList.add('--active');
+            });
+        });
+        document.addEventListener('click', () => {
+            document.querySelectorAll('.--active').forEach(open => open.classList.remove('--active'));
+            closeListboxes();
+        });
+        const about = document.querySelector("a[data-action='about']");
+        if (about) {
+            about.addEventListener('click', event => {
+                event.preventDefault();
+                showAboutDialog();
+            });
+        }
+    }
+
+    function dialog(children, className) {
+        const container = el('div', {class: 'oxd-dialog-container-default'}, [
+            el('div', {class: 'oxd-dialog-sheet oxd-dialog-sheet--shadow ' + (className || '')}, children),
+        ]);
+        const close = () => container.remove();
+        container.addEventListener('click', event => {
+            if (event.target === container) close();
+        });
+        document.body.appendChild(container);
+        return close;
+    }
+
+    function showAboutDialog() {
+        const closeButton = el('button', {type: 'button', class: 'oxd-dialog-close-button'}, '×');
+        const close = dialog([
+            closeButton,
+            el('h6', {class: 'oxd-text oxd-text--h6 orangehrm-main-title'}, 'About'),
+            el('div', {class: 'orangehrm-about'}, [
+                el('p', {class: 'oxd-text oxd-text--p'}, 'Company Name: OrangeHRM'),
+                el('p', {class: 'oxd-text oxd-text--p'}, 'Version: OrangeHRM OS 5.7 (stand-in)'),
+                el('p', {class: 'oxd-text oxd-text--p'}, 'Active Employees: 12'),
+            ]),
+        ]);
+        closeButton.addEventListener('click', close);
+    }
+
+    function confirmDelete(onConfirm) {
+        const cancel = el('button', {type: 'button', class: 'oxd-button oxd-button--medium oxd-button--ghost'}, ' No, Cancel ');
+        const confirm = el('button', {type: 'button', class: 'oxd-button oxd-button--medium oxd-button--label-danger'}, ' Yes, Delete ');
+        const close = dialog([
+            el('p', {class: 'oxd-text oxd-text--p oxd-text--card-title'}, 'Are you Sure?'),
+            el('p', {class: 'oxd-text oxd-text--p oxd-text--card-body'},
+                'The selected record will be permanently deleted. Are you sure you want to continue?'),
+            el('div', {class: 'orangehrm-modal-footer'}, [cancel, confirm]),
+        ], 'orangehrm-dialog-popup');
+        cancel.addEventListener('click', close);
+        confirm.addEventListener('click', () => {
+            close();
+            onConfirm();
+        });
+    }
+
+    // ---------- login ---------- //
+
+    function initLogin() {
+        const form = document.querySelector('form.oxd-form');
+        form.addEventListener('submit', event => {
+            let valid = true;
+            form.querySelectorAll('input.oxd-input').forEach(input => {
+                const empty = !input.value.trim();
+                setFieldError(input, empty ? 'Required' : null);
+                valid = valid && !empty;
+            });
+            if (!valid) event.preventDefault();
+        });
+    }
+
+    // ---------- Admin > System Users ---------- //
+
+    function userRow(user) {
+        const checkbox = el('div', {class: 'oxd-table-card-cell-checkbox'}, [
+            el('div', {class: 'oxd-checkbox-wrapper'}, [
+                el('label', {}, [
+                    el('input', {type: 'checkbox', value: String(user.id)}),
+                    el('span', {class: 'oxd-checkbox-input oxd-checkbox-input--active --label-right oxd-checkbox-input'}, [
+                        el('i', {class: 'oxd-icon bi-check oxd-checkbox-input-icon'}),
+                    ]),
+                ]),
+            ]),
+        ]);
+        const trash = el('button', {type: 'button', class: 'oxd-icon-button oxd-table-cell-action-space'}, [
+            el('i', {class: 'oxd-icon bi-trash'}),
+        ]);
+        const pencil = el('button', {type: 'button', class: 'oxd-icon-button oxd-table-cell-action-space'}, [
+            el('i', {class: 'oxd-icon bi-pencil-fill'}),
+        ]);
+        trash.addEventListener('click', () => deleteUser(user));
+        pencil.addEventListener('click', () => {
+            window.location.href = '/web/index.php/admin/saveSystemUser/' + user.id;
+        });
+
+        const cell = content => el('div', {class: 'oxd-table-cell oxd-padding-cell', role: 'cell'}, [content]);
+        return el('div', {class: 'oxd-table-card'}, [
+            el('div', {class: 'oxd-table-row oxd-table-row--with-border', role: 'row'}, [
+                cell(checkbox),
+                cell(el('div', {}, user.userName)),
+                cell(el('div', {}, user.userRole.displayName)),
+                cell(el('div', {}, user.employee ? fullName(user.employee, false) : '')),
+                cell(el('div', {}, user.status ? 'Enabled' : 'Disabled')),
+                cell(el('div', {class: 'oxd-table-cell-actions'}, [trash, pencil])),
+            ]),
+        ]);
+    }
+
+    let loadUsers = null;
+
+    async function deleteUser(user) {
+        // The logged-in user can never delete their own account
+        if (user.id === STATE.currentUserId) {
+            toast('error', 'Cannot be deleted');
+            return;
+        }
+        confirmDelete(async () => {
+            try {
+                await api('DELETE', '/admin/users', {ids: [user.id]});
+                toast('success', 'Successfully Deleted');
+            } catch (error) {
+                toast('error', error.message);
+            }
+            loadUsers();
+        });
+    }
+
+    function initSystemUsers() {
+        const form = document.querySelector('form.oxd-form');
+        const body = document.querySelector('div.oxd-table-body');
+        const records = document.querySelector('.orangehrm-records-found');
+        const username = form.querySelector('input.oxd-input');
+        const role = createSelect(form.querySelector("[data-select='userRole']"), ROLE_OPTIONS);
+        const status = createSelect(form.querySelector("[data-select='status']"), STATUS_OPTIONS);
+        const employee = createAutocomplete(form.querySelector("[data-autocomplete='employee']"));
+        let sequence = 0;
+
+        loadUsers = async function (filters) {
+            // Drop stale rows immediately so row-based waits see the reload
+            const current = ++sequence;
+            body.replaceChildren(el('div', {class: 'oxd-table-loader'}, [el('div', {class: 'oxd-loading-spinner'})]));
+            records.textContent = '';
+            const params = new URLSearchParams({limit: 50, offset: 0, sortField: 'u.userName', sortOrder: 'ASC'});
+            Object.entries(filters || {}).forEach(([k, v]) => {
+                if (v !== null && v !== undefined && v !== '') params.set(k, v);
+            });
+            const result = await api('GET', '/admin/users?' + params.toString());
+            if (current !== sequence) return;
+            body.replaceChildren(...result.data.map(userRow));
+            const total = result.meta.total;
+            records.textContent = total ? '(' + total + ') Record' + (total === 1 ? '' : 's') + ' Found' : 'No Records Found';
+            if (!total && filters) toast('info', 'No Records Found');
+        };
+
+        form.addEventListener('submit', event => {
+            event.preventDefault();
+            if (employee.text() && !employee.value) {
+                setFieldError(form.querySelector("[data-autocomplete='employee'] input"), 'Invalid');
+                return;
+            }
+            setFieldError(form.querySelector("[data-autocomplete='employee'] input"), null);
+            loadUsers({
+                username: username.value.trim(),
+                userRoleId: role.value,
+                empNumber: employee.value ? employee.value.empNumber : null,
+                status: status.value,
+            });
+        });
+
+        form.querySelector('button.oxd-button--ghost').addEventListener('click', () => {
+            username.value = '';
+            role.set(null);
+            status.set(null);
+            employee.set(null);
+            loadUsers();
+        });
+
+        document.querySelector('.orangehrm-header-container button').addEventListener('click', () => {
+            window.location.href = '/web/index.php/admin/saveSystemUser';
+        });
+
+        loadUsers();
+    }
+
+    // ---------- Admin > Add / Edit User ---------- //
+
+    function initSaveUser() {
+        const form = document.querySelector('form.oxd-form');
+        const editing = STATE.userId !== null && STATE.userId !== undefined;
+        const role = createSelect(form.querySelector("[data-select='userRole']"), ROLE_OPTIONS);
+        const status = createSelect(form.querySelector("[data-select='status']"), STATUS_OPTIONS);
+        const employee = createAutocomplete(form.querySelector("[data-autocomplete='employee']"));
+        const textInputs = Array.from(form.querySelectorAll('input.oxd-input'));
+        const username = textInputs[0];
+        const password = textInputs[1];
+        const confirm = textInputs[2];
+
+        if (editing) {
+            api('GET', '/admin/users/' + STATE.userId).then(result => {
+                const user = result.data;
+                role.set(user.userRole.id);
+                status.set(user.status ? 1 : 0);
+                employee.set(user.employee);
+                username.value = user.userName;
+                form.setAttribute('data-loaded', 'true');
+            });
+        } else {
+            form.setAttribute('data-loaded', 'true');
+        }
+
+        function validate() {
+            const errors = [];
+            const check = (control, message) => {
+                setFieldError(control, message);
+                if (message) errors.push(message);
+            };
+            check(form.querySelector("[data-select='userRole'] .oxd-select-text"), role.value === null ? 'Required' : null);
+            check(form.querySelector("[data-select='status'] .oxd-select-text"), status.value === null ? 'Required' : null);
+            const employeeInput = form.querySelector("[data-autocomplete='employee'] input");
+            check(employeeInput, employee.value ? null : (employee.text() ? 'Invalid' : 'Required'));
+            const name = username.value.trim();
+            check(username, !name ? 'Required' : (name.length < 5 ? 'Should be at least 5 characters' : null));
+            if (!editing) {
+                const secret = password.value;
+                check(password, !secret ? 'Required'
+                    : (secret.length < 7 || !/\d/.test(secret) ? 'Your password must contain minimum 1 number and 7 characters' : null));
+                check(confirm, confirm.value !== secret ? 'Passwords do not match' : null);
+            }
+            return errors.length === 0;
+        }
+
+        form.addEventListener('submit', async event => {
+            event.preventDefault();
+            if (!validate()) return;
+            const payload = {
+                username: username.value.trim(),
+                userRoleId: role.value,
+                empNumber: employee.value.empNumber,
+                status: status.value === 1,
+            };
+            try {
+                if (editing) {
+                    await api('PUT', '/admin/users/' + STATE.userId, Object.assign(payload, {changePassword: false}));
+                } else {
+                    await api('POST', '/admin/users', Object.assign(payload, {password: password.value}));
+                }
+            } catch (error) {
+                if (error.message === 'Already exists') {
+                    setFieldError(username, error.message);
+                } else {
+                    toast('error', error.message);
+                }
+                return;
+            }
+            toast('success', editing ? 'Successfully Updated' : 'Successfully Saved');
+            window.location.href = USERS_PATH;
+        });
+
+        form.querySelector('button.oxd-button--ghost').addEventListener('click', () => {
+            window.location.href = USERS_PATH;
+        });
+    }
+
+    const PAGES = {login: initLogin, systemUsers: initSystemUsers, saveSystemUser: initSaveUser};
+
+    document.addEventListener('DOMContentLoaded', () => {
+        initSidebarSearch();
+        initDropdownMenus();
+        if (PAGES[STATE.page]) PAGES[STATE.page]();
+    });
+})();
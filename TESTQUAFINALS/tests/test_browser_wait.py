@@ -0,0 +1,69 @@
+"""
+Unit tests for utils/browser_wait.py
+The driver is faked: execute_async_script raises the queued errors, then answers
+"""
+import logging
+
+import pytest
+from selenium.common.exceptions import JavascriptException, TimeoutException, WebDriverException
+
+from utils.browser_wait import BrowserWait, url_contains
+
+URL = "http://localhost/web/index.php/dashboard/index"
+
+
+class FakeDriver:
+    def __init__(self, *errors, session_id="session-1"):
+        self.session_id = session_id
+        self.current_url = URL
+        self.errors = list(errors)
+        self.scripts = 0
+
+    def execute_async_script(self, script, *args):
+        self.scripts += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return {"met": True, "values": [self.current_url]}
+
+
+@pytest.fixture(autouse=True)
+def fresh_sessions(monkeypatch):
+    monkeypatch.setattr(BrowserWait, "_polling_sessions", set())
+    monkeypatch.setattr(BrowserWait, "_logged_fallbacks", set())
+
+
+def wait_twice(driver):
+    for _ in range(2):
+        assert BrowserWait(driver, 1).until(url_contains("dashboard")) == [URL]
+
+
+def test_script_timeout_polls_for_that_wait_only(caplog):
+    driver = FakeDriver(TimeoutException("script timeout"), TimeoutException("script timeout"))
+    with caplog.at_level(logging.INFO, logger="utils.browser_wait"):
+        wait_twice(driver)
+        assert BrowserWait(driver, 1).until(url_contains("dashboard")) == [URL]
+    assert driver.scripts == 3
+    assert len(caplog.records) == 1
+
+
+def test_stale_context_polls_for_that_wait_only():
+    driver = FakeDriver(WebDriverException("no such window: target window already closed"))
+    wait_twice(driver)
+    assert driver.scripts == 2
+
+
+@pytest.mark.parametrize("error", [
+    WebDriverException("unknown command: session/1/execute/async"),
+    JavascriptException("EvalError: Refused to evaluate a string as JavaScript because 'unsafe-eval' "
+                        "is not an allowed source of script in the following Content Security Policy directive"),
+])
+def test_unsupported_script_polls_for_the_rest_of_the_session(error, caplog):
+    driver = FakeDriver(error)
+    with caplog.at_level(logging.INFO, logger="utils.browser_wait"):
+        wait_twice(driver)
+    assert driver.scripts == 1
+    assert [r.levelno for r in caplog.records] == [logging.WARNING]
+    # Another browser session still waits in the page
+    other = FakeDriver(session_id="session-2")
+    wait_twice(other)
+    assert other.scripts == 2
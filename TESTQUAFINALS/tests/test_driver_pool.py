@@ -0,0 +1,86 @@
+"""
+Unit tests for utils/driver_pool.py
+Browsers are faked; the factory can be told to fail the next launch
+"""
+import pytest
+
+from utils.driver_pool import DriverPool
+
+
+class FakeDriver:
+    """Answers the calls of the health check and DriverPool.reset"""
+
+    def __init__(self, number):
+        self.number = number
+        self.alive = True
+        self.quit_calls = 0
+
+    @property
+    def window_handles(self):
+        if not self.alive:
+            raise ConnectionError("browser is gone")
+        return ["main"]
+
+    @property
+    def switch_to(self):
+        return self
+
+    def window(self, handle):
+        pass
+
+    def execute_script(self, script):
+        pass
+
+    def delete_all_cookies(self):
+        pass
+
+    def get(self, url):
+        pass
+
+    def quit(self):
+        self.quit_calls += 1
+
+
+class Factory:
+    def __init__(self):
+        self.launched = []
+        self.fail_next = False
+
+    def __call__(self):
+        if self.fail_next:
+            self.fail_next = False
+            raise OSError("Chrome failed to start")
+        self.launched.append(FakeDriver(len(self.launched) + 1))
+        return self.launched[-1]
+
+
+@pytest.fixture
+def factory():
+    return Factory()
+
+
+def test_failed_relaunch_frees_the_slot(factory):
+    pool = DriverPool(factory, size=1)
+    driver = pool.acquire()
+    pool.release(driver)
+    driver.alive = False
+    factory.fail_next = True
+    with pytest.raises(OSError):
+        pool.acquire(timeout=1)
+    assert driver.quit_calls == 1
+    assert pool.acquire(timeout=1) is factory.launched[-1]
+    assert len(factory.launched) == 2
+
+
+def test_acquire_times_out_when_every_browser_is_leased(factory):
+    pool = DriverPool(factory, size=1)
+    pool.acquire()
+    with pytest.raises(TimeoutError, match="No pooled browser available"):
+        pool.acquire(timeout=0.05)
+
+
+def test_released_browser_is_reused(factory):
+    pool = DriverPool(factory, size=1)
+    driver = pool.acquire()
+    pool.release(driver)
+    assert pool.acquire(timeout=1) is driver
@@ -0,0 +1,108 @@
+"""
+Unit tests for utils/driver_resolver.py
+The lockfile lives in tmp_path; Chrome, webdriver-manager and webdriver.Chrome are faked
+"""
+import json
+import os
+
+import pytest
+from selenium.common.exceptions import SessionNotCreatedException
+
+from utils import driver_resolver
+
+
+def make_driver(directory, name):
+    path = directory / name
+    path.write_text("")
+    path.chmod(0o755)
+    return str(path)
+
+
+@pytest.fixture
+def downloads():
+    """Driver paths handed out by the fake webdriver-manager"""
+    return []
+
+
+@pytest.fixture
+def resolver(tmp_path, monkeypatch, downloads):
+    """driver_resolver with its lockfile in tmp_path and Chrome 120 installed"""
+    monkeypatch.setattr(driver_resolver, "DRIVER_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(driver_resolver, "LOCKFILE", str(tmp_path / "chromedriver.json"))
+    monkeypatch.setattr(driver_resolver, "_resolved_path", None)
+    monkeypatch.setattr(driver_resolver, "_resolve_options", {})
+    monkeypatch.setattr(driver_resolver, "_replacements", {})
+    monkeypatch.delenv(driver_resolver.ENV_DRIVER_PATH, raising=False)
+    monkeypatch.delenv(driver_resolver.ENV_OFFLINE, raising=False)
+    monkeypatch.setattr(driver_resolver, "chrome_major_version", lambda: "120")
+
+    def download():
+        downloads.append(make_driver(tmp_path, f"chromedriver-{len(downloads) + 1}"))
+        return downloads[-1]
+    monkeypatch.setattr(driver_resolver, "_download_with_webdriver_manager", download)
+    return driver_resolver
+
+
+def test_lockfile_records_chrome_major(resolver):
+    path = resolver.resolve_chromedriver_path()
+    with open(resolver.LOCKFILE) as f:
+        record = json.load(f)
+    assert record["path"] == path
+    assert record["chrome_major"] == "120"
+
+
+def test_lockfile_reused_for_same_chrome(resolver, monkeypatch, downloads):
+    path = resolver.resolve_chromedriver_path()
+    monkeypatch.setattr(resolver, "_resolved_path", None)
+    assert resolver.resolve_chromedriver_path() == path
+    assert downloads == [path]
+
+
+def test_chrome_update_resolves_again(resolver, monkeypatch):
+    """A lockfile written for an older Chrome major version is not trusted"""
+    old_path = resolver.resolve_chromedriver_path()
+    monkeypatch.setattr(resolver, "_resolved_path", None)
+    monkeypatch.setattr(resolver, "chrome_major_version", lambda: "121")
+    new_path = resolver.resolve_chromedriver_path()
+    assert new_path != old_path
+    with open(resolver.LOCKFILE) as f:
+        assert json.load(f)["chrome_major"] == "121"
+
+
+def test_unknown_chrome_version_keeps_lockfile(resolver, monkeypatch):
+    path = resolver.resolve_chromedriver_path()
+    monkeypatch.setattr(resolver, "_resolved_path", None)
+    monkeypatch.setattr(resolver, "chrome_major_version", lambda: None)
+    assert resolver.resolve_chromedriver_path() == path
+
+
+def test_session_not_created_replaces_driver(resolver, monkeypatch):
+    """The stale driver is dropped from the lockfile and every later launch uses its replacement"""
+    stale = resolver.resolve_chromedriver_path()
+    launched = []
+
+    def chrome(service, options):
+        launched.append(service.path)
+        if service.path == stale:
+            raise SessionNotCreatedException("This version of ChromeDriver only supports Chrome version 119")
+        return service.path
+    monkeypatch.setattr("selenium.webdriver.Chrome", chrome)
+
+    assert resolver.start_chrome(stale, options=None) != stale
+    assert resolver.start_chrome(stale, options=None) == launched[-1]
+    assert launched.count(stale) == 1
+    with open(resolver.LOCKFILE) as f:
+        assert json.load(f)["path"] == launched[-1]
+
+
+def test_session_not_created_with_pinned_driver_raises(resolver, tmp_path, monkeypatch):
+    pinned = make_driver(tmp_path, "pinned-chromedriver")
+    resolver.resolve_chromedriver_path(pinned_path=pinned)
+
+    def chrome(service, options):
+        raise SessionNotCreatedException("version mismatch")
+    monkeypatch.setattr("selenium.webdriver.Chrome", chrome)
+
+    with pytest.raises(SessionNotCreatedException):
+        resolver.start_chrome(pinned, options=None)
+    assert not os.path.exists(resolver.LOCKFILE)
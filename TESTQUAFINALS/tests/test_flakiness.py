@@ -0,0 +1,158 @@
+"""
+Unit tests for utils/flakiness.py
+Retries run in an inner pytest session (pytester) and scores come from a
+SQLite file under tmp_path; no browser needed
+"""
+import pytest
+
+from utils import flakiness
+
+pytest_plugins = ["pytester"]
+
+# Inner conftest: every test gets one retry for transient errors, as with --retries 1
+RETRY_CONFTEST = """
+import pytest
+from utils import flakiness
+
+def log(event):
+    with open("events.txt", "a") as f:
+        f.write(event + "\\n")
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_protocol(item, nextitem):
+    flakiness.run_with_retries(item, nextitem, retries=1)
+    return True
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    report = (yield).get_result()
+    if report.failed and report.when in ("setup", "call"):
+        error = flakiness.transient_error(call.excinfo)
+        if error:
+            report.user_properties.append(("transient_error", error))
+
+def pytest_report_teststatus(report):
+    if report.outcome == "rerun":
+        return "rerun", "R", "RERUN"
+
+@pytest.fixture(scope="session")
+def pool():
+    log("session setup")
+    yield
+    log("session teardown")
+
+@pytest.fixture(scope="module")
+def seed(pool):
+    log("module setup")
+    yield
+    log("module teardown")
+
+@pytest.fixture
+def page(seed):
+    log("function setup")
+    yield
+    log("function teardown")
+"""
+
+
+def events(pytester):
+    return (pytester.path / "events.txt").read_text().splitlines()
+
+
+def test_retry_of_last_test_keeps_module_and_session_fixtures(pytester):
+    """A retried last test of the module and the session tears down only its own fixtures"""
+    pytester.makeconftest(RETRY_CONFTEST)
+    pytester.makepyfile(test_flaky="""
+        from selenium.common.exceptions import TimeoutException
+
+        attempts = []
+
+        def test_first(page):
+            pass
+
+        def test_last(page):
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise TimeoutException("first attempt")
+    """)
+    result = pytester.runpytest_inprocess("-p", "no:cacheprovider")
+    assert result.parseoutcomes() == {"passed": 2, "rerun": 1}
+    assert events(pytester) == [
+        "session setup", "module setup",
+        "function setup", "function teardown",
+        "function setup", "function teardown",
+        "function setup", "function teardown",
+        "module teardown", "session teardown",
+    ]
+
+
+def test_retry_sets_up_failed_module_fixture_again(pytester):
+    """A module fixture that failed with a transient error is set up again by the retry"""
+    pytester.makeconftest(RETRY_CONFTEST)
+    pytester.makepyfile(test_flaky="""
+        import pytest
+        from selenium.common.exceptions import TimeoutException
+        from conftest import log
+
+        setups = []
+
+        @pytest.fixture(scope="module")
+        def flaky_seed():
+            setups.append(1)
+            if len(setups) == 1:
+                raise TimeoutException("seed request timed out")
+            log("seeded")
+
+        def test_only(pool, flaky_seed):
+            pass
+    """)
+    result = pytester.runpytest_inprocess("-p", "no:cacheprovider")
+    assert result.parseoutcomes() == {"passed": 1, "rerun": 1}
+    assert events(pytester) == ["session setup", "seeded", "session teardown"]
+
+
+def test_assertion_failure_is_not_retried(pytester):
+    pytester.makeconftest(RETRY_CONFTEST)
+    pytester.makepyfile(test_wrong="""
+        def test_wrong(page):
+            assert 1 == 2
+    """)
+    result = pytester.runpytest_inprocess("-p", "no:cacheprovider")
+    result.assert_outcomes(failed=1)
+    assert events(pytester).count("function setup") == 1
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(flakiness, "current_git_sha", lambda: None)
+    store = flakiness.FlakinessStore(str(tmp_path / "flakiness.sqlite"))
+    yield store
+    store.close()
+
+
+def run(outcome="passed", attempts=1, errors=(), js_fallbacks=0):
+    return {"outcome": outcome, "attempts": attempts, "transient_errors": list(errors), "js_fallbacks": js_fallbacks}
+
+
+def test_score_is_share_of_runs_that_needed_a_retry(store):
+    store.record_run({"t::a": run(attempts=2, errors=["TimeoutException"]), "t::b": run()})
+    store.record_run({"t::a": run(), "t::b": run()})
+    store.record_run({"t::a": run(outcome="failed", errors=["StaleElementReferenceException"]), "t::b": run()})
+    store.record_run({"t::a": run(), "t::b": run(js_fallbacks=1)})
+    a, b = store.scores()
+    assert (a.nodeid, a.runs, a.retried, a.failed, a.score) == ("t::a", 4, 2, 1, 0.5)
+    assert a.last_errors == "StaleElementReferenceException"
+    assert (b.nodeid, b.score, b.js_fallback_runs) == ("t::b", 0.0, 1)
+
+
+def test_scores_only_count_the_last_window_runs(store):
+    store.record_run({"t::a": run(attempts=2, errors=["TimeoutException"])})
+    for _ in range(3):
+        store.record_run({"t::a": run()})
+    score, = store.scores(window=3)
+    assert (score.runs, score.retried) == (3, 0)
+
+
+def test_scores_of_selected_tests(store):
+    store.record_run({"t::a": run(attempts=2, errors=["TimeoutException"]), "t::b": run()})
+    assert [s.nodeid for s in store.scores({"t::b"})] == ["t::b"]
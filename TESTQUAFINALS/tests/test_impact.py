@@ -0,0 +1,119 @@
+"""
+Unit tests for utils/impact.py
+Diffs are literal strings; select() runs on a small tree under tmp_path with fake items
+"""
+import pytest
+
+from utils.impact import ImpactMap, parse_diff, select
+
+HELPERS = '''"""Helpers"""
+from utils.impact import TrackedAttributes
+
+
+class SeleniumHelpers(metaclass=TrackedAttributes):
+    def click(driver):
+        return 1
+
+    def type_text(driver):
+        return 2
+'''
+
+TESTS = '''def test_click():
+    pass
+
+
+class TestGroup:
+    def test_type(self):
+        pass
+'''
+
+DIFF = """diff --git a/utils/helpers.py b/utils/helpers.py
+index 1111111..2222222 100644
+--- a/utils/helpers.py
++++ b/utils/helpers.py
+@@ -7 +7 @@ class SeleniumHelpers(metaclass=TrackedAttributes):
+-        return 0
++        return 1
+@@ -12,2 +11,0 @@ class SeleniumHelpers(metaclass=TrackedAttributes):
+-    def gone(driver):
+-        return 3
+diff --git a/README.md b/README.md
+--- a/README.md
++++ b/README.md
+@@ -1 +1 @@
+-old
++new
+diff --git a/utils/old.py b/utils/old.py
+deleted file mode 100644
+--- a/utils/old.py
++++ /dev/null
+@@ -1 +0,0 @@
+-x = 1
+"""
+
+
+class FakeItem:
+    def __init__(self, rootdir, nodeid):
+        path, *names = nodeid.split("::")
+        self.path = rootdir / path
+        self.nodeid = nodeid
+        self.name = self.originalname = names[-1]
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / "utils").mkdir()
+    (tmp_path / "utils" / "helpers.py").write_text(HELPERS)
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_a.py").write_text(TESTS)
+    impact_map = ImpactMap(str(tmp_path / "impact_map.json"))
+    impact_map.update({
+        "tests/test_a.py::test_click": ["SeleniumHelpers.click"],
+        "tests/test_a.py::TestGroup::test_type": ["SeleniumHelpers.type_text"],
+    })
+    items = [FakeItem(tmp_path, nodeid) for nodeid in (
+        "tests/test_a.py::test_click", "tests/test_a.py::TestGroup::test_type", "tests/test_a.py::test_new",
+    )]
+    return tmp_path, impact_map, items
+
+
+def selected(tree, changes):
+    rootdir, impact_map, items = tree
+    chosen, _ = select(items, impact_map, changes, rootdir=str(rootdir))
+    return [item.nodeid.split("::")[-1] for item in chosen]
+
+
+def test_parse_diff():
+    assert parse_diff(DIFF, untracked=["utils/new.py"]) == {
+        "utils/new.py": None,
+        "utils/helpers.py": {7, 11},
+        "utils/old.py": None,
+    }
+
+
+def test_helper_change_selects_its_users_and_unrecorded_tests(tree):
+    assert selected(tree, {"utils/helpers.py": {7}}) == ["test_click", "test_new"]
+
+
+def test_removed_helper_selects_its_users(tree):
+    """A helper the last run used but the file no longer defines counts as changed"""
+    tree[1].update({"tests/test_a.py::test_old": ["SeleniumHelpers.gone"]})
+    tree[2].insert(2, FakeItem(tree[0], "tests/test_a.py::test_old"))
+    assert selected(tree, {"utils/helpers.py": {7}}) == ["test_click", "test_old", "test_new"]
+
+
+@pytest.mark.parametrize("changes", [
+    {"utils/helpers.py": {2}},
+    {"utils/old.py": None},
+    {"pytest.ini": {3}},
+])
+def test_other_change_selects_everything(tree, changes):
+    assert selected(tree, changes) == ["test_click", "test_type", "test_new"]
+
+
+def test_changed_test_method_selects_that_test(tree):
+    assert selected(tree, {"tests/test_a.py": {7}}) == ["test_type", "test_new"]
+
+
+def test_changed_module_code_of_test_file_selects_the_whole_file(tree):
+    assert selected(tree, {"tests/test_a.py": {4}}) == ["test_click", "test_type", "test_new"]
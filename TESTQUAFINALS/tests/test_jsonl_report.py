@@ -0,0 +1,48 @@
+"""
+Unit tests for utils/jsonl_report.py
+Reports are built with pytest's TestReport; no browser needed
+"""
+import json
+
+from _pytest.reports import TestReport
+
+from utils.jsonl_report import JsonlReporter
+
+
+def report(when, outcome="passed"):
+    return TestReport("tests/test_x.py::test_x", ("tests/test_x.py", 1, "test_x"), {}, outcome, None, when)
+
+
+def records(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_run_without_tests_keeps_previous_report(tmp_path):
+    path = tmp_path / "results.jsonl"
+    path.write_text("previous run\n")
+    reporter = JsonlReporter(str(path))
+    reporter.session_start(target="local")
+    assert reporter.close(0) is False
+    assert path.read_text() == "previous run\n"
+
+
+def test_file_opened_on_first_test(tmp_path):
+    path = tmp_path / "reports" / "results.jsonl"
+    reporter = JsonlReporter(str(path))
+    reporter.session_start(target="local")
+    assert not path.exists()
+    for when in ("setup", "call", "teardown"):
+        reporter.add_report(report(when))
+    assert reporter.close(0) is True
+    assert [(r["type"], r.get("outcome")) for r in records(path)] == [
+        ("session", None), ("test", "passed"), ("session_finish", None),
+    ]
+
+
+def test_interrupted_test_is_reported(tmp_path):
+    path = tmp_path / "results.jsonl"
+    reporter = JsonlReporter(str(path))
+    reporter.session_start(target="local")
+    reporter.add_report(report("setup"))
+    assert reporter.close(2) is True
+    assert records(path)[-1]["unfinished"] == ["tests/test_x.py::test_x"]
@@ -0,0 +1,75 @@
+"""
+Unit tests for the LocatorRegistry cache in utils/locators.py
+The driver is faked: the page is the set of strategies that currently match
+"""
+from selenium.webdriver.common.by import By
+
+from utils.helpers import SeleniumHelpers
+from utils.locators import FIND_FIRST_MATCH_JS, PROBE_STRATEGIES_JS, Locator, LocatorRegistry, registry, to_probe
+
+CSS = (By.CSS_SELECTOR, "div.oxd-table")
+XPATH = (By.XPATH, "//div[contains(@class, 'oxd-table')]")
+TABLE = Locator(CSS, XPATH, name="TABLE")
+
+
+class FakeDriver:
+    session_id = "session-1"
+
+    def __init__(self, *matching):
+        self.show(*matching)
+        self.scripts = 0
+
+    def show(self, *matching):
+        """Strategies that match the page from now on"""
+        self.page = {tuple(to_probe(s)): [f"element for {s[1]}"] for s in matching}
+
+    def execute_script(self, script, strategies):
+        self.scripts += 1
+        if script == PROBE_STRATEGIES_JS:
+            return [next((i for i, s in enumerate(probes) if tuple(s) in self.page), -1) for probes in strategies]
+        assert script == FIND_FIRST_MATCH_JS
+        for index, kind, expr in strategies:
+            if (kind, expr) in self.page:
+                return [index, self.page[(kind, expr)]]
+        return [-1, []]
+
+    def execute_async_script(self, script, args, timeout_ms, poll_ms):
+        element = self.page.get(tuple(args[0][0]))
+        return {"met": True, "values": element} if element else {"met": False}
+
+
+def test_find_elements_replaces_winner_that_no_longer_matches():
+    cache = LocatorRegistry()
+    driver = FakeDriver(CSS)
+    assert cache.resolve(driver, TABLE) == CSS
+    driver.show(XPATH)
+    assert cache.find_elements(driver, TABLE) == [f"element for {XPATH[1]}"]
+    assert cache.cached_strategy(driver, TABLE) == XPATH
+    assert driver.scripts == 2
+
+
+def test_find_elements_of_absent_element_keeps_winner():
+    cache = LocatorRegistry()
+    driver = FakeDriver(XPATH)
+    cache.resolve(driver, TABLE)
+    driver.show()
+    assert cache.find_elements(driver, TABLE) == []
+    assert cache.cached_strategy(driver, TABLE) == XPATH
+
+
+def test_re_resolve_probes_again():
+    cache = LocatorRegistry()
+    driver = FakeDriver(CSS)
+    cache.resolve(driver, TABLE)
+    driver.show(XPATH)
+    assert cache.resolve(driver, TABLE) == CSS
+    assert cache.re_resolve(driver, TABLE) == XPATH
+
+
+def test_helper_wait_goes_on_with_strategy_that_matches_now(monkeypatch):
+    monkeypatch.setattr(registry, "_winners", {})
+    driver = FakeDriver(CSS)
+    registry.resolve(driver, TABLE)
+    driver.show(XPATH)
+    assert SeleniumHelpers.wait_for_element_clickable(driver, TABLE, timeout=0) == f"element for {XPATH[1]}"
+    assert registry.cached_strategy(driver, TABLE) == XPATH
@@ -0,0 +1,58 @@
+"""
+Unit tests for the table reload waits of utils/pages.py
+The driver is faked: the reload a click starts reaches the table only on the second in-page check
+"""
+import pytest
+
+from utils.helpers import TABLE_WATCH_JS, SeleniumHelpers
+from utils.locators import PROBE_STRATEGIES_JS, registry
+from utils.pages import AdminUsersPage
+
+
+class FakeDriver:
+    session_id = "pages-session"
+
+    def __init__(self, events):
+        self.events = events
+        self.checks = 0
+
+    def execute_script(self, script, *args):
+        if script == PROBE_STRATEGIES_JS:
+            return [0 for _ in args[0]]
+        assert script == TABLE_WATCH_JS
+        self.events.append("watch")
+        return True
+
+    def execute_async_script(self, script, args, timeout_ms, poll_ms):
+        # Body present and loader absent hold throughout; the table changes from the second check on
+        self.checks += 1
+        met = "__qaTableChanged" not in script or self.checks > 1
+        return {"met": met, "values": [True] * len(args)} if met else {"met": False}
+
+
+@pytest.fixture
+def page(monkeypatch):
+    monkeypatch.setattr(registry, "_winners", {})
+    monkeypatch.setattr(SeleniumHelpers, "fill_form", staticmethod(lambda *args, **kwargs: None))
+    events = []
+    page = AdminUsersPage(FakeDriver(events), base_url="http://127.0.0.1")
+    monkeypatch.setattr(page, "click", lambda locator: events.append(locator.name))
+    return page
+
+
+@pytest.mark.parametrize("wait", ["loaded", "rows"])
+def test_search_waits_for_the_reload_it_started(page, wait):
+    page.search(username="Admin", wait=wait)
+    assert page.driver.events == ["watch", "AdminLocators.SEARCH_BUTTON"]
+    assert page.driver.checks == 2
+
+
+def test_reset_state_waits_for_the_reload_it_started(page):
+    page.reset_state()
+    assert page.driver.events == ["watch", "AdminLocators.RESET_BUTTON"]
+    assert page.driver.checks == 2
+
+
+def test_search_without_wait_does_not_watch(page):
+    page.search(username="Admin", wait=None)
+    assert page.driver.events == ["AdminLocators.SEARCH_BUTTON"]
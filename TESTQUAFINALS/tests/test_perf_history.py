@@ -0,0 +1,77 @@
+"""
+Unit tests for utils/perf_history.py
+Runs are recorded in a SQLite file under tmp_path; no browser needed
+"""
+import pytest
+
+from utils import perf_history
+
+FAST = "tests/test_admin.py::test_fast"
+SLOW = "tests/test_admin.py::test_slow"
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(perf_history, "current_git_sha", lambda: None)
+    store = perf_history.HistoryStore(str(tmp_path / "perf_history.sqlite"))
+    yield store
+    store.close()
+
+
+def record(store, durations, outcome="passed", target="local", browser_profile="headless"):
+    """One run with the given call duration per test"""
+    return store.record_run(
+        {nodeid: {"outcome": outcome, "call_s": seconds} for nodeid, seconds in durations.items()},
+        target=target, browser_profile=browser_profile,
+    )
+
+
+def test_baseline_is_median_of_last_passing_runs(store):
+    for seconds in (9.0, 1.0, 2.0, 3.0):
+        record(store, {FAST: seconds})
+    record(store, {FAST: 50.0}, outcome="failed")
+    assert store.baseline(FAST, "local", "headless", window=3) == (2.0, 3)
+
+
+def test_baseline_only_counts_same_target_and_profile(store):
+    record(store, {FAST: 1.0})
+    record(store, {FAST: 5.0}, target="demo")
+    record(store, {FAST: 7.0}, browser_profile="default")
+    assert store.baseline(FAST, "local", "headless") == (1.0, 1)
+    assert store.baseline(FAST, "demo", "default") == (None, 0)
+
+
+def test_baseline_before_run_excludes_that_run(store):
+    record(store, {FAST: 1.0})
+    run_id = record(store, {FAST: 3.0})
+    assert store.baseline(FAST, "local", "headless", before_run=run_id) == (1.0, 1)
+
+
+def test_check_budgets_flags_slowdown_over_budget(store):
+    for _ in range(3):
+        record(store, {FAST: 2.0, SLOW: 10.0})
+    run_id = record(store, {FAST: 2.4, SLOW: 14.0})
+    regressions = store.check_budgets(run_id, budget_pct=25, min_delta=0.1)
+    assert [(r.nodeid, r.baseline, r.samples) for r in regressions] == [(SLOW, 10.0, 3)]
+    assert regressions[0].pct == pytest.approx(40)
+
+
+def test_check_budgets_ignores_slowdown_below_min_delta(store):
+    record(store, {FAST: 0.2})
+    run_id = record(store, {FAST: 0.6})
+    assert store.check_budgets(run_id, budget_pct=25, min_delta=0.5) == []
+    assert len(store.check_budgets(run_id, budget_pct=25, min_delta=0.3)) == 1
+
+
+def test_check_budgets_uses_per_test_budget_and_orders_worst_first(store):
+    record(store, {FAST: 2.0, SLOW: 10.0})
+    run_id = record(store, {FAST: 4.0, SLOW: 13.0})
+    regressions = store.check_budgets(run_id, budget_pct=25, min_delta=0.1)
+    assert [r.nodeid for r in regressions] == [SLOW, FAST]
+    regressions = store.check_budgets(run_id, budget_pct=25, min_delta=0.1, test_budgets={SLOW: 50})
+    assert [r.nodeid for r in regressions] == [FAST]
+
+
+def test_check_budgets_skips_tests_without_history(store):
+    run_id = record(store, {FAST: 100.0})
+    assert store.check_budgets(run_id) == []
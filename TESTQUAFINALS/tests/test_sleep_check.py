@@ -0,0 +1,48 @@
+"""
+Unit tests for utils/sleep_check.py
+Sources are written to tmp_path; only calls count, so this module can name them in strings
+"""
+from utils.sleep_check import find_bare_sleeps
+
+
+def check(tmp_path, source):
+    path = tmp_path / "test_module.py"
+    path.write_text(source)
+    return find_bare_sleeps(path)
+
+
+def test_finds_module_and_aliased_sleeps(tmp_path):
+    source = (
+        "import time\n"
+        "import time as t\n"
+        "def test_a():\n"
+        "    time.sleep(1)\n"
+        "    t.sleep(0.5)\n"
+    )
+    assert check(tmp_path, source) == [(4, "time.sleep(1)"), (5, "t.sleep(0.5)")]
+
+
+def test_finds_imported_sleep_under_any_name(tmp_path):
+    source = (
+        "from time import sleep, sleep as pause\n"
+        "def test_a():\n"
+        "    pause(2)\n"
+        "    sleep(1)\n"
+    )
+    assert check(tmp_path, source) == [(3, "pause(2)"), (4, "sleep(1)")]
+
+
+def test_ignores_other_sleeps(tmp_path):
+    source = (
+        "import asyncio\n"
+        "import time\n"
+        "def sleep(seconds):\n"
+        "    pass\n"
+        "def test_a(driver):\n"
+        "    asyncio.sleep(1)\n"
+        "    driver.sleep(1)\n"
+        "    sleep(1)\n"
+        "    time.monotonic()\n"
+        "    message = 'time.sleep(1)'\n"
+    )
+    assert check(tmp_path, source) == []
@@ -0,0 +1,293 @@
+"""
+HTTP client for the OrangeHRM v2 REST API
+Lets tests cross-check what the System Users table shows, or create and delete
+records, over /web/index.php/api/v2 in milliseconds instead of through the UI.
+Connections are pooled (urllib3) and the session cookie
+comes from a logged-in browser or from a form login over HTTP
+"""
+from http.cookies import SimpleCookie
+from urllib.parse import urlencode, urlsplit
+import json
+import logging
+import re
+import threading
+
+import urllib3
+
+from utils.helpers import UserRow
+from utils.session import DASHBOARD_PATH, LOGIN_PATH
+
+logger = logging.getLogger(__name__)
+
+API_PATH = "/web/index.php/api/v2"
+VALIDATE_PATH = "/web/index.php/auth/validate"
+LOGOUT_PATH = "/web/index.php/auth/logout"
+
+# OrangeHRM v2 API values behind the dropdown options
+ROLE_IDS = {"Admin": 1, "ESS": 2}
+STATUS_VALUES = {"Enabled": 1, "Disabled": 0}
+
+# CSRF token of the login form (stand-in hidden input, OrangeHRM 5 component prop)
+TOKEN_RE = re.compile(r'name="_token" value="([^"]+)"|:token="&quot;([^&]+)&quot;"')
+
+REQUEST_TIMEOUT = 30
+MAX_REDIRECTS = 5
+# Page size of the System Users table
+PAGE_SIZE = 50
+
+
+class ApiError(RuntimeError):
+    """Non-2xx API response; status and message come from the OrangeHRM error body when present"""
+
+    def __init__(self, status, message):
+        super().__init__(f"{status}: {message}")
+        self.status = status
+        self.message = message
+
+
+class OrangeHrmApi:
+    """
+    Session on the OrangeHRM REST API
+
+    Usage:
+        api = OrangeHrmApi.from_driver(driver, base_url, "Admin", "admin123")
+        api.user_rows(role="Admin")       # same UserRow records as read_table()
+        user = api.create_user("qa.user1", "QaPass123", emp_number=6)
+        api.delete_users([user["id"]])
+
+    With cookies from a logged-in browser no login request is made; a 401
+    (expired or missing session) logs in over HTTP once and retries.
+    """
+
+    def __init__(self, base_url, username, password, cookies=(), pool_size=4):
+        """
+        Args:
+            cookies: Cookie dicts as returned by driver.get_cookies()
+            pool_size: Connections kept open to the host
+        """
+        self.base_url = base_url.rstrip("/")
+        self.username = username
+        self.password = password
+        self._cookies = {c["name"]: c["value"] for c in cookies}
+        self._lock = threading.Lock()
+        self._http = urllib3.PoolManager(
+            maxsize=pool_size, retries=False, timeout=urllib3.Timeout(total=REQUEST_TIMEOUT),
+        )
+
+    @classmethod
+    def from_driver(cls, driver, base_url, username, password):
+        """Client sharing the authenticated session of a browser"""
+        return cls(base_url, username, password, cookies=driver.get_cookies())
+
+    def close(self):
+        self._http.clear()
+
+    # ---------- session ---------- #
+
+    def login(self):
+        """Log in through the login form over HTTP (token, then validate)"""
+        with self._lock:
+            self._cookies.clear()
+        page = self._send("GET", LOGIN_PATH).data.decode("utf-8", "replace")
+        match = TOKEN_RE.search(page)
+        if not match:
+            raise ApiError(0, "No CSRF token on the login page")
+        form = {"_token": match.group(1) or match.group(2), "username": self.username, "password": self.password}
+        response = self._send(
+            "POST", VALIDATE_PATH, body=urlencode(form),
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+        location = response.headers.get("Location", "")
+        if DASHBOARD_PATH not in location:
+            raise ApiError(401, f"Login rejected for {self.username}")
+        logger.info(f"✓ API session for {self.username}")
+        return self
+
+    def logout(self):
+        self._send("GET", LOGOUT_PATH)
+        with self._lock:
+            self._cookies.clear()
+
+    def page(self, path):
+        """
+        HTML of an app page, following same-site redirects
+
+        Raises:
+            ApiError: when the app redirects to the login page (no session) or fails
+        """
+        url = path
+        for _ in range(MAX_REDIRECTS):
+            response = self._send("GET", url)
+            location = response.get_redirect_location()
+            if not location:
+                break
+            url = urlsplit(location)._replace(scheme="", netloc="").geturl()
+            if url.startswith(LOGIN_PATH):
+                raise ApiError(401, f"Redirected to login from {path}")
+        if not 200 <= response.status < 300:
+            raise ApiError(response.status, f"{response.reason} for {path}")
+        return response.data.decode("utf-8", "replace")
+
+    # ---------- requests ---------- #
+
+    def _send(self, method, path, body=None, headers=None):
+        """One request with the session cookies; redirects are returned, not followed"""
+        with self._lock:
+            cookie = "; ".join(f"{name}={value}" for name, value in self._cookies.items())
+        headers = dict(headers or {})
+        if cookie:
+            headers["Cookie"] = cookie
+        response = self._http.request(method, self.base_url + path, body=body, headers=headers, redirect=False)
+        set_cookies = response.headers.getlist("Set-Cookie")
+        if set_cookies:
+            with self._lock:
+                for header in set_cookies:
+                    for name, morsel in SimpleCookie(header).items():
+                        if morsel["max-age"] == "0":
+                            self._cookies.pop(name, None)
+                        else:
+                            self._cookies[name] = morsel.value
+        return response
+
+    def request(self, method, path, params=None, payload=None):
+        """
+        Call an endpoint under /api/v2 and return the decoded JSON body
+
+        Raises:
+            ApiError: for non-2xx responses (after one re-login on 401)
+        """
+        url = API_PATH + path + (f"?{urlencode(params)}" if params else "")
+        body = json.dumps(payload) if payload is not None else None
+        headers = {"Accept": "application/json"}
+        if body is not None:
+            headers["Content-Type"] = "application/json"
+        response = self._send(method, url, body=body, headers=headers)
+        if response.status == 401:
+            self.login()
+            response = self._send(method, url, body=body, headers=headers)
+        if not 200 <= response.status < 300:
+            try:
+                message = json.loads(response.data)["error"]["message"]
+            except (ValueError, KeyError, TypeError):
+                message = response.reason
+            raise ApiError(response.status, message)
+        return json.loads(response.data)
+
+    # ---------- System Users ---------- #
+
+    def search_users(self, username=None, role=None, status=None, emp_number=None, limit=PAGE_SIZE):
+        """
+        GET /admin/users with the System Users search filters
+
+        Args:
+            role: Dropdown text ("Admin", "ESS")
+            status: Dropdown text ("Enabled", "Disabled")
+
+        Returns:
+            list: user records as the API returns them
+        """
+        params = {"limit": limit, "offset": 0, "sortField": "u.userName", "sortOrder": "ASC"}
+        if username:
+            params["username"] = username
+        if role:
+            params["userRoleId"] = ROLE_IDS[role]
+        if status:
+            params["status"] = STATUS_VALUES[status]
+        if emp_number:
+            params["empNumber"] = emp_number
+        return self.request("GET", "/admin/users", params)["data"]
+
+    def user_rows(self, **filters):
+        """search_users() as the UserRow records SeleniumHelpers.read_table() returns"""
+        return [user_row(user) for user in self.search_users(**filters)]
+
+    def get_user(self, user_id):
+        return self.request("GET", f"/admin/users/{user_id}")["data"]
+
+    def create_user(self, username, password, emp_number, role="ESS", status="Enabled"):
+        """Create a system user; returns the new record"""
+        return self.request("POST", "/admin/users", payload={
+            "username": username,
+            "password": password,
+            "userRoleId": ROLE_IDS[role],
+            "empNumber": emp_number,
+            "status": bool(STATUS_VALUES[status]),
+        })["data"]
+
+    def delete_users(self, ids):
+        """Delete system users by id; returns the deleted ids"""
+        return self.request("DELETE", "/admin/users", payload={"ids": list(ids)})["data"]
+
+    # ---------- PIM ---------- #
+
+    def search_employees(self, name_or_id=None, limit=PAGE_SIZE):
+        params = {"limit": limit, "offset": 0}
+        if name_or_id:
+            params["nameOrId"] = name_or_id
+        return self.request("GET", "/pim/employees", params)["data"]
+
+    def create_employee(self, first_name, last_name, middle_name=""):
+        """Create an employee; returns the new record (empNumber is its id)"""
+        return self.request("POST", "/pim/employees", payload={
+            "firstName": first_name, "middleName": middle_name, "lastName": last_name,
+        })["data"]
+
+    def delete_employees(self, emp_numbers):
+        """Delete employees (and their system users); returns the deleted empNumbers"""
+        return self.request("DELETE", "/pim/employees", payload={"ids": list(emp_numbers)})["data"]
+
+
+def employee_display_name(employee):
+    """Employee column text of the System Users table"""
+    if not employee:
+        return ""
+    name = " ".join(p for p in (employee.get("firstName"), employee.get("lastName")) if p)
+    return f"{name} (Past Employee)" if employee.get("terminationId") else name
+
+
+def user_row(user):
+    """UserRow for an API user record"""
+    return UserRow(
+        user["userName"],
+        user["userRole"]["displayName"],
+        employee_display_name(user.get("employee")),
+        "Enabled" if user["status"] else "Disabled",
+    )
+
+
+class ApiUsersSearch:
+    """
+    The search side of AdminUsersPage answered by the API
+    Used by the data_check tests under --data-via api, which then need no
+    browser: search() runs the query, rows() and row_count() read its result
+    """
+
+    def __init__(self, api):
+        self.api = api
+        self._rows = None
+
+    def search(self, username=None, role=None, status=None, employee=None, wait="rows", fill_mode=None):
+        """Same arguments as AdminUsersPage.search (wait and fill_mode have nothing to wait for or fill)"""
+        emp_number = None
+        if employee:
+            _, option_text = employee
+            # Autocomplete options show the middle name as well
+            matches = [e for e in self.api.search_employees(option_text)
+                       if " ".join(p for p in (e["firstName"], e["middleName"], e["lastName"]) if p) == option_text]
+            if not matches:
+                raise ApiError(404, f"No employee named {option_text}")
+            emp_number = matches[0]["empNumber"]
+        self._rows = self.api.user_rows(username=username, role=role, status=status, emp_number=emp_number)
+        return self
+
+    def reset(self, wait="rows", previous_count=None):
+        return self.search()
+
+    def rows(self):
+        if self._rows is None:
+            # The page loads unfiltered
+            self.search()
+        return list(self._rows)
+
+    def row_count(self):
+        return len(self.rows())
@@ -0,0 +1,159 @@
+"""
+Failure artifacts (screenshot, DOM snapshot, browser console) written off the test thread
+Only the WebDriver round-trips happen in the hook; decoding, optional
+re-encoding and disk writes run on a small thread pool, and the artifact
+directory is pruned to a retention cap
+"""
+from concurrent.futures import ThreadPoolExecutor
+import base64
+import io
+import json
+import logging
+import os
+import threading
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional: screenshots are then written as the PNG Chrome returns
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+IMAGE_FORMATS = ("png", "webp")
+DEFAULT_RETENTION = 50
+WEBP_QUALITY = 80
+
+
+class ArtifactWriter:
+    """
+    Background writer for failure artifacts
+
+    capture() grabs the screenshot as base64 (plus page source and console
+    log when enabled) and returns the planned file paths immediately; the
+    files appear once the pool has written them. close() waits for pending writes.
+    """
+
+    def __init__(self, directory="screenshots", image_format="png", max_width=0,
+                 retention=DEFAULT_RETENTION, dom=False, console=False, workers=2):
+        """
+        Args:
+            directory: Where artifacts are written
+            image_format: "png" or "webp" (webp needs Pillow)
+            max_width: Downscale screenshots wider than this many pixels (0 = keep size, needs Pillow)
+            retention: Max number of files kept in the directory, oldest removed first (0 = unlimited)
+            dom: Also save the page source as .html
+            console: Also save the browser console log as .log
+        """
+        if image_format not in IMAGE_FORMATS:
+            raise ValueError(f"Unknown screenshot format '{image_format}', choose from: {', '.join(IMAGE_FORMATS)}")
+        if Image is None and (image_format != "png" or max_width):
+            logger.warning("⚠ Pillow is not installed, screenshots are saved as full-size PNG")
+            image_format, max_width = "png", 0
+        self.directory = directory
+        self.image_format = image_format
+        self.max_width = max_width
+        self.retention = retention
+        self.dom = dom
+        self.console = console
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="artifacts")
+        self._prune_lock = threading.Lock()
+        self._pending = []
+
+    def capture(self, driver, basename, since=None):
+        """
+        Queue the failure artifacts of a test
+
+        Args:
+            driver: WebDriver of the failed test
+            basename: File name without extension
+            since: Epoch seconds; console entries logged before it are skipped
+                (a pooled browser keeps the log of earlier tests)
+
+        Returns:
+            list: Paths that will be written
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        base = os.path.join(self.directory, basename)
+        jobs = [(f"{base}.{self.image_format}", self._write_screenshot, driver.get_screenshot_as_base64())]
+        if self.dom:
+            jobs.append((f"{base}.html", _write_text, driver.page_source))
+        if self.console:
+            entries = _browser_log(driver)
+            if since is not None:
+                entries = [e for e in entries if e.get("timestamp", 0) >= since * 1000]
+            jobs.append((f"{base}.log", _write_text, "\n".join(json.dumps(e) for e in entries)))
+
+        for path, writer, payload in jobs:
+            self._pending.append(self._executor.submit(self._run, writer, path, payload))
+        return [path for path, _writer, _payload in jobs]
+
+    def close(self):
+        """Wait for queued writes and stop the pool"""
+        for future in self._pending:
+            future.result()
+        self._pending = []
+        self._executor.shutdown(wait=True)
+
+    def _run(self, writer, path, payload):
+        try:
+            writer(path, payload)
+        except Exception as e:
+            logger.warning(f"⚠ Could not write artifact {path}: {e}")
+            return
+        self._prune()
+
+    def _write_screenshot(self, path, b64):
+        data = base64.b64decode(b64)
+        if Image is not None and (self.image_format != "png" or self.max_width):
+            image = Image.open(io.BytesIO(data))
+            if self.max_width and image.width > self.max_width:
+                height = round(image.height * self.max_width / image.width)
+                image = image.resize((self.max_width, height), Image.LANCZOS)
+            buffer = io.BytesIO()
+            if self.image_format == "webp":
+                image.save(buffer, "WEBP", quality=WEBP_QUALITY)
+            else:
+                image.save(buffer, "PNG", optimize=True)
+            data = buffer.getvalue()
+        with open(path, "wb") as f:
+            f.write(data)
+
+    def _prune(self):
+        """Remove the oldest files beyond the retention cap"""
+        if not self.retention:
+            return
+        with self._prune_lock:
+            try:
+                entries = [(_mtime(e), e.path) for e in os.scandir(self.directory) if e.is_file()]
+            except OSError:
+                return
+            if len(entries) <= self.retention:
+                return
+            entries.sort()
+            for _modified, path in entries[:len(entries) - self.retention]:
+                try:
+                    os.remove(path)
+                except OSError:
+                    # Already removed by another xdist worker
+                    pass
+
+
+def _mtime(entry):
+    try:
+        return entry.stat().st_mtime
+    except OSError:
+        return 0
+
+
+def _write_text(path, text):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def _browser_log(driver):
+    """Console entries (needs the goog:loggingPrefs capability set in utils/browser_profiles.py)"""
+    try:
+        return driver.get_log("browser")
+    except Exception as e:
+        logger.warning(f"⚠ Browser console log unavailable: {e}")
+        return []
@@ -0,0 +1,229 @@
+"""
+Browser-side performance metrics for the functional tests
+Collects Navigation Timing, Resource Timing, long tasks and Chrome DevTools
+Protocol Performance.getMetrics after each navigation and search action,
+so the regular suite doubles as a performance probe of the Login and Admin pages
+"""
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Long-task observer; registered through CDP so it is in place before the page's own scripts run
+OBSERVER_JS = """
+if (!window.__qaPerf) {
+    const perf = window.__qaPerf = {longTasks: [], resourceIndex: 0, longTaskIndex: 0, longTaskSupport: true};
+    try { performance.setResourceTimingBufferSize(1000); } catch (e) {}
+    try {
+        new PerformanceObserver(list => {
+            for (const e of list.getEntries()) {
+                perf.longTasks.push([Math.round(e.startTime), Math.round(e.duration)]);
+            }
+        }).observe({type: 'longtask', buffered: true});
+    } catch (e) {
+        perf.longTaskSupport = false;
+    }
+}
+"""
+
+# Snapshot of the current document; resources and long tasks are only
+# returned once (the page remembers how far the previous snapshot read)
+COLLECT_JS = OBSERVER_JS + """
+const perf = window.__qaPerf;
+const ms = v => Math.round(v * 10) / 10;
+const resources = performance.getEntriesByType('resource');
+const fresh = resources.slice(perf.resourceIndex);
+const tasks = perf.longTasks.slice(perf.longTaskIndex);
+perf.resourceIndex = resources.length;
+perf.longTaskIndex = perf.longTasks.length;
+const nav = performance.getEntriesByType('navigation')[0];
+const paint = {};
+for (const e of performance.getEntriesByType('paint')) paint[e.name] = ms(e.startTime);
+return {
+    url: location.href,
+    time_origin: performance.timeOrigin,
+    navigation: nav ? {
+        type: nav.type,
+        ttfb_ms: ms(nav.responseStart),
+        response_end_ms: ms(nav.responseEnd),
+        dom_interactive_ms: ms(nav.domInteractive),
+        dom_content_loaded_ms: ms(nav.domContentLoadedEventEnd),
+        load_event_ms: ms(nav.loadEventEnd),
+        transfer_bytes: nav.transferSize || 0,
+    } : null,
+    paint: paint,
+    resources: fresh.map(e => [e.name, e.initiatorType, ms(e.startTime), ms(e.duration), e.transferSize || 0]),
+    long_tasks: tasks,
+    long_task_support: perf.longTaskSupport,
+};
+"""
+
+# Performance.getMetrics values kept in the report; *Count / *Duration are cumulative per page
+CDP_METRICS = (
+    "Nodes", "JSEventListeners", "JSHeapUsedSize",
+    "LayoutCount", "RecalcStyleCount", "LayoutDuration", "RecalcStyleDuration",
+    "ScriptDuration", "TaskDuration",
+)
+
+# Helpers (and page object actions) that start an action; metrics are read after the helper that completes it
+TRIGGER_HELPERS = ("safe_click", "safe_send_keys", "select_dropdown_option", "select_autocomplete_option", "click", "type")
+
+# Initiator types of the XHR/fetch calls issued by searches
+API_INITIATORS = ("xmlhttprequest", "fetch")
+
+# Slowest resources listed per sample
+SLOWEST_RESOURCES = 5
+
+
+class BrowserMetrics:
+    """
+    Per-test collector of browser performance samples
+
+    A sample is taken after every top-level SeleniumHelpers call that is not
+    an action trigger (click, typing, dropdown selection) and kept when it
+    sees a new document (navigation) or new XHR/fetch requests (search and
+    other API-backed actions). capture() takes a sample explicitly.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.samples = []
+        self.cdp = True
+        self._script_id = None
+        self._documents = {}
+        self._pages = {}
+        self._last_trigger = None
+
+    def install(self):
+        """Register the long-task observer and enable the CDP Performance domain"""
+        try:
+            self._script_id = self.driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument", {"source": OBSERVER_JS}
+            ).get("identifier")
+            self.driver.execute_cdp_cmd("Performance.enable", {})
+        except Exception as e:
+            # Non-Chromium drivers: Navigation/Resource Timing only, observer per document
+            logger.warning(f"⚠ CDP performance metrics unavailable: {e}")
+            self.cdp = False
+        try:
+            self.driver.execute_script(OBSERVER_JS)
+        except Exception:
+            pass
+        return self
+
+    def uninstall(self):
+        """Remove the CDP registrations so a pooled browser is returned unchanged"""
+        if not self.cdp:
+            return
+        try:
+            if self._script_id:
+                self.driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": self._script_id})
+            self.driver.execute_cdp_cmd("Performance.disable", {})
+        except Exception as e:
+            logger.warning(f"⚠ Could not remove browser metrics instrumentation: {e}")
+
+    def on_step(self, step, driver):
+        """Step listener for utils.step_timing.recorder"""
+        if driver is not self.driver:
+            return
+        if step.helper in TRIGGER_HELPERS:
+            self._last_trigger = f"{step.helper}({step.locator})" if step.locator else step.helper
+            return
+        label = f"{step.helper}({step.locator})" if step.locator else step.helper
+        if self._last_trigger:
+            label = f"{self._last_trigger} -> {label}"
+        if self.capture(label, force=False) is not None:
+            self._last_trigger = None
+
+    def capture(self, label, force=True):
+        """
+        Take a sample of the current page
+
+        Args:
+            label: Name of the action shown in the report
+            force: Keep the sample even without a navigation or new API requests
+
+        Returns:
+            dict: The sample, or None when it was dropped or the page could not be read
+        """
+        try:
+            data = self.driver.execute_script(COLLECT_JS)
+        except Exception as e:
+            logger.warning(f"⚠ Could not read browser metrics: {e}")
+            return None
+        if not data or not str(data.get("url", "")).startswith("http"):
+            return None
+
+        new_document = data["time_origin"] not in self._documents
+        if data["navigation"]:
+            # Refreshed on every read: the load event may fire after the first sample of a page
+            self._pages[data["time_origin"]] = dict(data["navigation"], paint=data["paint"], url=data["url"])
+        api_calls = [r for r in data["resources"] if r[1] in API_INITIATORS]
+        if not (force or new_document or api_calls):
+            return None
+
+        kind = "navigation" if new_document else ("search" if api_calls else "action")
+        sample = {
+            "label": label,
+            "kind": kind,
+            "url": data["url"],
+            "resources": _summarize_resources(data["resources"]),
+            "long_tasks": _summarize_long_tasks(data["long_tasks"], data["long_task_support"]),
+        }
+        cdp = self._cdp_metrics()
+        if cdp is not None:
+            previous = self._documents.get(data["time_origin"])
+            sample["cdp"] = cdp
+            if previous:
+                sample["cdp_delta"] = {
+                    name: round(cdp[name] - previous[name], 4)
+                    for name in cdp if name.endswith(("Count", "Duration")) and name in previous
+                }
+        if new_document and data["navigation"]:
+            sample["navigation"] = dict(data["navigation"], paint=data["paint"])
+        self._documents[data["time_origin"]] = cdp or {}
+        self.samples.append(sample)
+        return sample
+
+    def _cdp_metrics(self):
+        if not self.cdp:
+            return None
+        try:
+            metrics = self.driver.execute_cdp_cmd("Performance.getMetrics", {}).get("metrics", [])
+        except Exception as e:
+            logger.warning(f"⚠ Performance.getMetrics failed: {e}")
+            return None
+        values = {m["name"]: m["value"] for m in metrics}
+        return {name: round(values[name], 4) for name in CDP_METRICS if name in values}
+
+    def report(self):
+        """
+        Report attached to the test: Navigation Timing of every page visited
+        (as last read), search and long-task totals and every sample
+        """
+        return {
+            "pages": list(self._pages.values()),
+            "searches": sum(s["kind"] == "search" for s in self.samples),
+            "long_tasks_ms": sum(s["long_tasks"]["total_ms"] for s in self.samples),
+            "samples": self.samples,
+        }
+
+
+def _summarize_resources(entries):
+    """entries: [name, initiatorType, startTime, duration, transferSize] rows from COLLECT_JS"""
+    slowest = sorted(entries, key=lambda e: e[3], reverse=True)[:SLOWEST_RESOURCES]
+    return {
+        "count": len(entries),
+        "api_calls": sum(e[1] in API_INITIATORS for e in entries),
+        "transfer_bytes": sum(e[4] for e in entries),
+        "slowest": [{"url": e[0], "type": e[1], "start_ms": e[2], "duration_ms": e[3]} for e in slowest],
+    }
+
+
+def _summarize_long_tasks(tasks, supported):
+    durations = [duration for _start, duration in tasks]
+    return {
+        "supported": supported,
+        "count": len(durations),
+        "total_ms": sum(durations),
+        "max_ms": max(durations, default=0),
+    }
@@ -0,0 +1,317 @@
+"""
+Explicit waits evaluated inside the page
+BrowserWait sends its conditions in one execute_async_script call: the page
+checks them on every DOM mutation (at most once per animation frame) and on a
+short timer, and answers as soon as all of them hold. A wait costs one
+round-trip instead of one WebDriver command per poll. Where the script cannot
+run (scripts blocked, unsupported driver) it polls like WebDriverWait
+"""
+from collections import namedtuple
+import logging
+import time
+
+from selenium.common.exceptions import (
+    JavascriptException,
+    StaleElementReferenceException,
+    TimeoutException,
+    UnknownMethodException,
+    WebDriverException,
+)
+from selenium.webdriver.support import expected_conditions as EC
+
+from utils.locators import to_probe
+from utils.step_timing import TimedWait, recorder
+
+logger = logging.getLogger(__name__)
+
+# Timer check for conditions no mutation announces (URL, quiet periods, hidden tabs without frames)
+BROWSER_POLL_MS = 50
+
+# Longest single in-page wait; stays under the 30 s default script timeout
+BROWSER_WAIT_CHUNK = 20
+
+# Error messages meaning the session can never run the wait script:
+# no async script support, or a Content-Security-Policy that blocks eval
+UNSUPPORTED_SCRIPT_ERRORS = (
+    "unknown command", "not implemented", "unsupported operation",
+    "content security policy", "unsafe-eval", "evalerror",
+)
+
+# Condition of a BrowserWait
+# js: JS function source (args) => value, or None when it can only be polled
+# args: JSON arguments of the JS function
+# check: callable(driver) -> value, the same condition for polling
+# A condition holds when its value is neither false, null nor undefined (0 counts)
+Condition = namedtuple("Condition", ["name", "js", "args", "check"])
+
+WAIT_ENGINE_JS = """
+const [args, timeoutMs, pollMs, done] = arguments;
+const find = ([kind, expr]) => kind === 'css' ? document.querySelector(expr)
+    : document.evaluate(expr, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+const findAll = ([kind, expr]) => {
+    if (kind === 'css') return Array.from(document.querySelectorAll(expr));
+    const found = document.evaluate(expr, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    return Array.from({length: found.snapshotLength}, (_, i) => found.snapshotItem(i));
+};
+const shown = el => {
+    if (!el || !el.isConnected || el.getClientRects().length === 0) return false;
+    const style = getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.opacity !== '0';
+};
+const conditions = [%s];
+const deadline = performance.now() + timeoutMs;
+let finished = false, frame = null, observer = null, timer = null;
+const finish = result => {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearInterval(timer);
+    if (frame !== null) cancelAnimationFrame(frame);
+    done(result);
+};
+const check = () => {
+    frame = null;
+    if (finished) return;
+    const values = [];
+    try {
+        for (let i = 0; i < conditions.length; i++) {
+            const value = conditions[i](args[i]);
+            if (value === false || value === null || value === undefined) {
+                if (performance.now() >= deadline) finish({met: false});
+                return;
+            }
+            values.push(value);
+        }
+    } catch (e) {
+        return finish({error: String(e)});
+    }
+    finish({met: true, values: values});
+};
+const schedule = () => { if (!finished && frame === null) frame = requestAnimationFrame(check); };
+observer = new MutationObserver(schedule);
+observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+timer = setInterval(check, pollMs);
+check();
+"""
+
+
+def _probe(strategy):
+    """("css" | "xpath", expression) for a (By, value) strategy, None when the page script cannot look it up"""
+    try:
+        return to_probe(strategy)
+    except ValueError:
+        return None
+
+
+def _element_condition(name, strategy, js, check, *args):
+    """Condition on the elements of a locator; polled only when the page script cannot look it up"""
+    probe = _probe(strategy)
+    return Condition(f"{name} {strategy[1][:50]}", js if probe else None, [probe, *args], check)
+
+
+def element_present(strategy):
+    """The first matching element is in the DOM; value: the element"""
+    def check(driver):
+        return driver.find_element(*strategy)
+    return _element_condition("present", strategy, "([s]) => find(s)", check)
+
+
+def element_visible(strategy):
+    """The first matching element is displayed; value: the element"""
+    return _element_condition(
+        "visible", strategy, "([s]) => { const el = find(s); return shown(el) ? el : null; }",
+        EC.visibility_of_element_located(strategy),
+    )
+
+
+def element_clickable(strategy):
+    """The first matching element is displayed and enabled; value: the element"""
+    return _element_condition(
+        "clickable", strategy, "([s]) => { const el = find(s); return shown(el) && !el.disabled ? el : null; }",
+        EC.element_to_be_clickable(strategy),
+    )
+
+
+def element_absent(strategy):
+    """No matching element is displayed"""
+    def check(driver):
+        try:
+            return not any(e.is_displayed() for e in driver.find_elements(*strategy))
+        except StaleElementReferenceException:
+            # Element was removed between lookup and check - poll again
+            return False
+    return _element_condition("absent", strategy, "([s]) => !findAll(s).some(shown)", check)
+
+
+def count_above(strategy, minimum):
+    """More than `minimum` elements match; value: the count"""
+    def check(driver):
+        count = len(driver.find_elements(*strategy))
+        return count if count > minimum else None
+    return _element_condition(
+        f"more than {minimum}", strategy,
+        "([s, minimum]) => { const count = findAll(s).length; return count > minimum ? count : null; }",
+        check, minimum,
+    )
+
+
+def count_changed(strategy, previous):
+    """The number of matching elements differs from `previous`; value: the count"""
+    def check(driver):
+        count = len(driver.find_elements(*strategy))
+        return count if count != previous else None
+    return _element_condition(
+        f"other than {previous}", strategy,
+        "([s, previous]) => { const count = findAll(s).length; return count !== previous ? count : null; }",
+        check, previous,
+    )
+
+
+def url_contains(fragment):
+    """The URL contains `fragment`; value: the URL"""
+    def check(driver):
+        url = driver.current_url
+        return url if fragment in url else None
+    return Condition(
+        f"url contains {fragment}", "fragment => location.href.includes(fragment) ? location.href : null",
+        fragment, check,
+    )
+
+
+def url_changes(old_url):
+    """The URL differs from `old_url`; value: the URL"""
+    def check(driver):
+        url = driver.current_url
+        return url if url != old_url else None
+    return Condition(
+        f"url changes from {old_url}", "old => location.href !== old ? location.href : null", old_url, check,
+    )
+
+
+def script_true(body, *args):
+    """An execute_script body (reading arguments[i]) returns a truthy value"""
+    def check(driver):
+        return driver.execute_script(body, *args) or None
+    return Condition(
+        "script", f"a => (function () {{ {body} }}).apply(null, a) || null", list(args), check,
+    )
+
+
+class BrowserWait:
+    """
+    Wait until every condition holds (AND), checked inside the page
+
+    Usage:
+        wait = BrowserWait(driver, 10)
+        element, = wait.until(element_clickable(locator))
+        wait.until(element_present(body), count_above(rows, 0), element_absent(loader))
+
+    A navigation during the wait unloads the script; the wait then goes on
+    in the new document. Time spent waiting and the number of round-trips
+    go to the current step like TimedWait polls.
+    """
+
+    # Sessions that cannot run the wait script; they poll from then on
+    _polling_sessions = set()
+    # (session, permanent) pairs whose fallback was already logged
+    _logged_fallbacks = set()
+
+    def __init__(self, driver, timeout, poll_frequency=0.1, in_browser=True):
+        self.driver = driver
+        self.timeout = timeout
+        self.poll_frequency = poll_frequency
+        self.in_browser = in_browser
+
+    def until(self, *conditions, message=""):
+        """
+        Returns:
+            list: the value of each condition
+
+        Raises:
+            TimeoutException: when the conditions do not all hold in time
+        """
+        message = message or f"Timed out after {self.timeout}s waiting for " + " and ".join(c.name for c in conditions)
+        deadline = time.monotonic() + self.timeout
+        if self._runs_in_browser(conditions):
+            values = self._until_in_browser(conditions, deadline, message)
+            if values is not None:
+                return values
+        return self._until_polled(conditions, deadline, message)
+
+    def _runs_in_browser(self, conditions):
+        return (
+            self.in_browser
+            and getattr(self.driver, "session_id", None) not in self._polling_sessions
+            and all(c.js is not None for c in conditions)
+        )
+
+    def _until_in_browser(self, conditions, deadline, message):
+        """Values once all conditions hold, None to fall back to polling"""
+        script = WAIT_ENGINE_JS % ", ".join(c.js for c in conditions)
+        args = [c.args for c in conditions]
+        start = time.perf_counter()
+        calls = 0
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                calls += 1
+                try:
+                    result = self.driver.execute_async_script(
+                        script, args, int(max(0.0, min(remaining, BROWSER_WAIT_CHUNK)) * 1000), BROWSER_POLL_MS,
+                    )
+                except WebDriverException as e:
+                    # The page navigated away while the script waited
+                    if isinstance(e, JavascriptException) and "unloaded" in str(e) and deadline > time.monotonic():
+                        continue
+                    # A script timeout set below BROWSER_WAIT_CHUNK or a stale context
+                    # only affects this wait; the next one tries the page again
+                    self._fall_back(e, permanent=self._unsupported(e))
+                    return None
+                if not isinstance(result, dict):
+                    # The driver does not run async scripts
+                    self._fall_back(f"unexpected result {result!r}", permanent=True)
+                    return None
+                if result.get("met"):
+                    return result["values"]
+                if "error" in result:
+                    # A condition threw (e.g. an invalid selector); polling reports it the WebDriver way
+                    logger.info(f"In-page wait failed ({result['error']}), polling instead")
+                    return None
+                if time.monotonic() >= deadline:
+                    raise TimeoutException(message)
+        finally:
+            recorder.add_wait(time.perf_counter() - start, calls)
+
+    @staticmethod
+    def _unsupported(error):
+        if isinstance(error, UnknownMethodException):
+            return True
+        text = str(error).lower()
+        return any(marker in text for marker in UNSUPPORTED_SCRIPT_ERRORS)
+
+    def _fall_back(self, reason, permanent):
+        """Poll for this wait; for every later wait of the session too when `permanent`"""
+        session = getattr(self.driver, "session_id", None)
+        if permanent:
+            self._polling_sessions.add(session)
+        if (session, permanent) in self._logged_fallbacks:
+            return
+        self._logged_fallbacks.add((session, permanent))
+        reason = str(reason).strip()
+        if permanent:
+            logger.warning(f"⚠ In-page waits unavailable, polling instead: {reason}")
+        else:
+            logger.info(f"In-page wait failed ({reason}), polling for this wait")
+
+    def _until_polled(self, conditions, deadline, message):
+        def all_hold(driver):
+            values = []
+            for condition in conditions:
+                value = condition.check(driver)
+                if value is False or value is None:
+                    return False
+                values.append(value)
+            return values
+
+        wait = TimedWait(self.driver, max(0.0, deadline - time.monotonic()), poll_frequency=self.poll_frequency)
+        return wait.until(all_hold, message)
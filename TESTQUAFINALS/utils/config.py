@@ -0,0 +1,14 @@
+"""
+Target application URL shared by conftest.py, the fixtures and the test modules
+conftest.py exports the selected URL in ORANGEHRM_BASE_URL before collection
+(pytest-xdist workers inherit it), so modules can build page URLs at import time
+"""
+import os
+
+DEMO_BASE_URL = "https://opensource-demo.orangehrmlive.com"
+BASE_URL_ENV = "ORANGEHRM_BASE_URL"
+
+
+def get_base_url():
+    """Base URL of the OrangeHRM instance under test (the public demo unless overridden)"""
+    return os.environ.get(BASE_URL_ENV, DEMO_BASE_URL).rstrip("/")
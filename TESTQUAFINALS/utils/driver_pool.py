@@ -0,0 +1,165 @@
+"""
+WebDriver pool for reusing warm browser instances across tests
+Browsers are reset between tests instead of being relaunched
+"""
+import logging
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Longest acquire() wait for a browser to be released (seconds)
+ACQUIRE_TIMEOUT = 120
+# How often a waiting acquire() checks for a slot freed by a failed relaunch
+ACQUIRE_POLL = 1.0
+
+
+class DriverPool:
+    """
+    Session-scoped pool of warm WebDriver instances
+
+    Drivers are created lazily by the factory up to `size`, handed out with
+    acquire() and returned with release(). Returned drivers are reset
+    (extra windows, cookies, storage, about:blank) so the next test starts
+    from a clean browser. Drivers that fail the health check or the reset
+    are quit and replaced with a fresh instance.
+    """
+
+    def __init__(self, factory, size=1):
+        """
+        Args:
+            factory: Callable returning a new, configured WebDriver
+            size: Max number of live browsers kept by the pool
+        """
+        if size < 1:
+            raise ValueError(f"Driver pool size must be >= 1, got {size}")
+        self._factory = factory
+        self._size = size
+        self._idle = queue.LifoQueue()
+        self._drivers = []
+        self._lock = threading.Lock()
+
+    @property
+    def size(self):
+        return self._size
+
+    def acquire(self, timeout=ACQUIRE_TIMEOUT):
+        """
+        Lease a healthy driver from the pool
+
+        Reuses an idle driver when available, launches a new one while the
+        pool is below its size, otherwise waits until one is released or a
+        slot frees up.
+
+        Raises:
+            TimeoutError: when no browser becomes available within `timeout` seconds
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+                break
+            except queue.Empty:
+                pass
+            driver = self._create_if_allowed()
+            if driver is not None:
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"No pooled browser available after {timeout}s ({self._size} leased) - "
+                    f"raise --driver-pool-size or check for tests that never release their browser"
+                )
+            try:
+                driver = self._idle.get(timeout=min(remaining, ACQUIRE_POLL))
+                break
+            except queue.Empty:
+                continue
+
+        if not self._is_healthy(driver):
+            logger.warning("⚠ Pooled browser failed health check, recycling")
+            driver = self._recycle(driver)
+        return driver
+
+    def release(self, driver):
+        """Reset a leased driver and return it to the pool"""
+        try:
+            self.reset(driver)
+        except Exception as e:
+            logger.warning(f"⚠ Browser reset failed, recycling: {e}")
+            driver = self._recycle(driver)
+        self._idle.put(driver)
+
+    def close(self):
+        """Quit every browser owned by the pool"""
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            self._quit(driver)
+        while not self._idle.empty():
+            self._idle.get_nowait()
+        logger.info(f"✓ Driver pool closed ({len(drivers)} browser(s))")
+
+    @staticmethod
+    def reset(driver):
+        """
+        Bring a browser back to a clean state without relaunching it
+        1. Close every window except the first one
+        2. Clear web storage for the current origin
+        3. Delete all cookies
+        4. Navigate to about:blank
+        """
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        try:
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        except Exception:
+            # about:blank and data: pages have no storage to clear
+            pass
+
+        driver.delete_all_cookies()
+        driver.get("about:blank")
+
+    @staticmethod
+    def _is_healthy(driver):
+        """Cheap round-trip to confirm the browser session is still alive"""
+        try:
+            driver.window_handles
+            return True
+        except Exception:
+            return False
+
+    def _create_if_allowed(self):
+        with self._lock:
+            if len(self._drivers) >= self._size:
+                return None
+            driver = self._factory()
+            self._drivers.append(driver)
+        logger.info(f"✓ Launched pooled browser {len(self._drivers)}/{self._size}")
+        return driver
+
+    def _recycle(self, driver):
+        """
+        Replace a broken driver with a freshly launched one
+        Its slot is freed first, so a failed relaunch leaves room for the next acquire()
+        """
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+        self._quit(driver)
+        replacement = self._factory()
+        with self._lock:
+            self._drivers.append(replacement)
+        return replacement
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"⚠ Browser quit failed: {e}")
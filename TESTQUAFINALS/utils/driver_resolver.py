@@ -0,0 +1,240 @@
+"""
+ChromeDriver binary resolution with per-session caching
+Resolves the driver path once and shares it between pytest-xdist workers
+through a lockfile, so only the first browser pays for webdriver-manager.
+The lockfile records the Chrome major version it was resolved for; after a
+Chrome update, or when the driver cannot start a session, it is resolved again
+"""
+from datetime import datetime
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+
+from selenium.common.exceptions import SessionNotCreatedException
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DRIVER_CACHE_DIR = os.path.join(PROJECT_ROOT, ".driver_cache")
+LOCKFILE = os.path.join(DRIVER_CACHE_DIR, "chromedriver.json")
+
+# Environment overrides
+ENV_DRIVER_PATH = "CHROMEDRIVER_PATH"
+ENV_OFFLINE = "CHROMEDRIVER_OFFLINE"
+
+_resolved_path = None
+# Arguments of the first resolution, reused when a driver has to be replaced
+_resolve_options = {}
+# Failed driver path -> the path resolved to replace it
+_replacements = {}
+_replace_lock = threading.Lock()
+
+
+class DriverResolutionError(RuntimeError):
+    """Raised when no usable ChromeDriver binary can be found"""
+
+
+class FileLock:
+    """
+    Minimal cross-process lock based on exclusive file creation
+    Works on Windows and POSIX without extra dependencies
+    """
+
+    def __init__(self, path, timeout=120, stale_after=300):
+        self.path = path
+        self.timeout = timeout
+        self.stale_after = stale_after
+        self._fd = None
+
+    def __enter__(self):
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                self._fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(self._fd, str(os.getpid()).encode())
+                return self
+            except FileExistsError:
+                self._break_if_stale()
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Timed out waiting for lock: {self.path}")
+                time.sleep(0.1)
+
+    def __exit__(self, *exc):
+        os.close(self._fd)
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def _break_if_stale(self):
+        """Remove a lock left behind by a crashed process"""
+        try:
+            if time.time() - os.path.getmtime(self.path) > self.stale_after:
+                os.remove(self.path)
+                logger.warning(f"⚠ Removed stale driver lock: {self.path}")
+        except FileNotFoundError:
+            pass
+
+
+def _is_executable(path):
+    return bool(path) and os.path.isfile(path) and os.access(path, os.X_OK)
+
+
+def chrome_major_version():
+    """Major version of the installed Chrome (None when it cannot be determined)"""
+    try:
+        from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+        version = OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+    except Exception:
+        return None
+    return version.split(".")[0] if version else None
+
+
+def _read_lockfile(chrome_major=None):
+    """
+    Return the driver path recorded in the lockfile if it is still valid:
+    executable and resolved for the installed Chrome major version (when both are known)
+    """
+    try:
+        with open(LOCKFILE) as f:
+            record = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+    path = record.get("path")
+    if not _is_executable(path):
+        return None
+    recorded_major = record.get("chrome_major")
+    if chrome_major and recorded_major and recorded_major != chrome_major:
+        logger.info(f"Chrome {recorded_major} -> {chrome_major} since the last run, resolving ChromeDriver again")
+        return None
+    return path
+
+
+def _write_lockfile(path, source, chrome_major=None):
+    record = {
+        "path": path,
+        "source": source,
+        "chrome_major": chrome_major,
+        "resolved_at": datetime.now().isoformat(timespec="seconds"),
+    }
+    tmp_path = f"{LOCKFILE}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(record, f, indent=2)
+    os.replace(tmp_path, LOCKFILE)
+
+
+def _download_with_webdriver_manager():
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+
+
+def resolve_chromedriver_path(pinned_path=None, offline=False):
+    """
+    Resolve the ChromeDriver binary once per process
+
+    Resolution order:
+    1. pinned_path argument (--chromedriver-path) or CHROMEDRIVER_PATH
+    2. .driver_cache/chromedriver.json lockfile written by an earlier run
+       or by another xdist worker for the same Chrome major version
+    3. chromedriver found on PATH (offline mode only)
+    4. webdriver-manager download (skipped in offline mode)
+
+    Args:
+        pinned_path: Explicit driver binary to use
+        offline: Never touch the network (also enabled by CHROMEDRIVER_OFFLINE=1)
+
+    Returns:
+        str: Absolute path to the ChromeDriver binary
+    """
+    global _resolved_path
+    if _resolved_path:
+        return _resolved_path
+    _resolve_options.setdefault("pinned_path", pinned_path)
+    _resolve_options.setdefault("offline", offline)
+
+    offline = offline or os.environ.get(ENV_OFFLINE, "").lower() in ("1", "true", "yes")
+    pinned_path = pinned_path or os.environ.get(ENV_DRIVER_PATH)
+
+    if pinned_path:
+        if not _is_executable(pinned_path):
+            raise DriverResolutionError(f"Pinned ChromeDriver is not executable: {pinned_path}")
+        _resolved_path = os.path.abspath(pinned_path)
+        logger.info(f"✓ Using pinned ChromeDriver: {_resolved_path}")
+        return _resolved_path
+
+    os.makedirs(DRIVER_CACHE_DIR, exist_ok=True)
+    chrome_major = chrome_major_version()
+
+    # Only one worker resolves; the others block on the lock and read its result
+    with FileLock(f"{LOCKFILE}.lock"):
+        path = _read_lockfile(chrome_major)
+        source = "lockfile"
+
+        if not path and offline:
+            path = shutil.which("chromedriver")
+            source = "PATH"
+            if not path:
+                raise DriverResolutionError(
+                    "Offline mode: no ChromeDriver in CHROMEDRIVER_PATH, "
+                    f"{LOCKFILE} or on PATH"
+                )
+            _write_lockfile(path, source, chrome_major)
+        elif not path:
+            path = _download_with_webdriver_manager()
+            source = "webdriver-manager"
+            _write_lockfile(path, source, chrome_major)
+
+    _resolved_path = path
+    logger.info(f"✓ ChromeDriver resolved from {source}: {path}")
+    return _resolved_path
+
+
+def _replace_driver(failed_path):
+    """
+    Resolve a new driver for one that could not start a session (once per
+    failed path): drops the lockfile entry and the process cache first
+
+    Returns:
+        str: The new driver path, or None when there is nothing to replace
+        (pinned driver, or resolution found the same binary again)
+    """
+    global _resolved_path
+    with _replace_lock:
+        if failed_path in _replacements:
+            return _replacements[failed_path]
+        if _resolve_options.get("pinned_path") or os.environ.get(ENV_DRIVER_PATH):
+            return None
+        with FileLock(f"{LOCKFILE}.lock"):
+            if _read_lockfile() == failed_path:
+                os.remove(LOCKFILE)
+        if _resolved_path == failed_path:
+            _resolved_path = None
+        path = resolve_chromedriver_path(**_resolve_options)
+        if path == failed_path:
+            return None
+        _replacements[failed_path] = path
+        return path
+
+
+def start_chrome(driver_path, options):
+    """
+    webdriver.Chrome on a resolved driver
+    A SessionNotCreatedException (usually a driver older than an updated
+    Chrome) resolves the driver again and retries once; later launches with
+    the old path go straight to its replacement
+    """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+
+    driver_path = _replacements.get(driver_path, driver_path)
+    try:
+        return webdriver.Chrome(service=Service(driver_path), options=options)
+    except SessionNotCreatedException as e:
+        new_path = _replace_driver(driver_path)
+        if new_path is None:
+            raise
+        logger.warning(f"⚠ ChromeDriver {driver_path} could not start a session, retrying with {new_path}: {e.msg}")
+        return webdriver.Chrome(service=Service(new_path), options=options)
@@ -0,0 +1,269 @@
+"""
+Transient-failure retries and run-to-run flakiness scores
+Failures caused by timing (wait timeouts, stale elements, intercepted clicks)
+are rerun by run_with_retries (from conftest.py); every run records per test
+how many attempts it needed and how many JavaScript click fallbacks it hit,
+and a test's flakiness score is the share of its recent runs that needed a retry
+
+CLI:
+    python -m utils.flakiness report [--top 20] [--window 20]
+"""
+from datetime import datetime
+import argparse
+import os
+import sqlite3
+
+# The retry path relies on private pytest internals, checked with pytest 7.4 to 9.1:
+# _pytest.runner.call_and_report, Function._initrequest/_request/funcargs,
+# session._setupstate.stack and teardown_exact, session._fixturemanager._arg2fixturedefs,
+# FixtureDef.cached_result[2] and FixtureDef.finish. Run tests/test_flakiness.py
+# before raising the pytest range in requirements.txt
+from _pytest.runner import call_and_report
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+
+from utils.perf_history import current_git_sha
+
+DEFAULT_DB = "reports/flakiness.sqlite"
+DEFAULT_RETRIES = 1
+DEFAULT_WINDOW = 20
+
+# Exceptions that point at timing rather than a wrong result
+TRANSIENT_ERRORS = (
+    TimeoutException,
+    StaleElementReferenceException,
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started TEXT NOT NULL,
+    git_sha TEXT,
+    target TEXT
+);
+CREATE TABLE IF NOT EXISTS test_runs (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    nodeid TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    attempts INTEGER NOT NULL,
+    transient_errors TEXT,
+    js_fallbacks INTEGER NOT NULL,
+    PRIMARY KEY (run_id, nodeid)
+);
+CREATE INDEX IF NOT EXISTS idx_test_runs_nodeid ON test_runs (nodeid, run_id);
+"""
+
+
+def transient_error(excinfo):
+    """Name of the exception if it is a transient (timing) failure, else None"""
+    if excinfo is not None and excinfo.errisinstance(TRANSIENT_ERRORS):
+        return excinfo.type.__name__
+    return None
+
+
+def run_with_retries(item, nextitem, retries):
+    """
+    Run a test, rerunning it while setup or call fails with a transient error
+
+    A failed attempt that will be retried tears down only the test's own
+    fixtures (as pytest-rerunfailures does): a pooled driver goes back to the
+    pool and the retry leases the warm browser again, while session, module
+    and class fixtures (driver pools, seed data, a shared page) stay up, even
+    for the last test of its module or of the session. A higher-scoped
+    fixture whose own setup failed is set up again. The teardown up to
+    nextitem runs after the final attempt only. Failed attempts are reported
+    once with outcome "rerun", the final attempt reports normally
+
+    Returns:
+        list: Reports of the final attempt
+    """
+    item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+    for attempt in range(1, retries + 2):
+        reports, retry = _run_attempt(item, nextitem, may_retry=attempt <= retries)
+        if retry is None:
+            break
+        retry.outcome = "rerun"
+        item.ihook.pytest_runtest_logreport(report=retry)
+
+    reports[-1].user_properties.append(("attempts", attempt))
+    for report in reports:
+        item.ihook.pytest_runtest_logreport(report=report)
+    item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+    return reports
+
+
+def _run_attempt(item, nextitem, may_retry):
+    """
+    Setup, call and teardown of one attempt (runtestprotocol without logging)
+
+    Returns:
+        tuple: (reports, the failed setup/call report if the test is retried, else None)
+    """
+    hasrequest = hasattr(item, "_request")
+    if hasrequest and not item._request:
+        # Every attempt after the first
+        item._initrequest()
+    try:
+        reports = [call_and_report(item, "setup", log=False)]
+        if reports[0].passed and not item.config.getoption("setuponly", False):
+            reports.append(call_and_report(item, "call", log=False))
+        failed = next((r for r in reports if r.failed), None)
+        retry = None
+        if item.session.shouldfail or item.session.shouldstop:
+            nextitem = None
+        elif may_retry and failed is not None and dict(failed.user_properties).get("transient_error"):
+            retry = failed
+        # A retry keeps everything above the test: tear down as if the next test were a sibling
+        reports.append(call_and_report(item, "teardown", log=False, nextitem=item.parent if retry else nextitem))
+        if retry:
+            _drop_failed_setups(item)
+    finally:
+        if hasrequest:
+            item._request = False
+            item.funcargs = None
+    return reports, retry
+
+
+def _drop_failed_setups(item):
+    """Forget collector setups and higher-scoped fixtures that failed, so the retry runs them again"""
+    setup_state = item.session._setupstate
+    failed = next((node for node, (_, exc) in setup_state.stack.items() if exc), None)
+    if failed is not None:
+        setup_state.teardown_exact(failed.parent)
+    for fixturedefs in item.session._fixturemanager._arg2fixturedefs.values():
+        for fixturedef in fixturedefs:
+            if fixturedef.cached_result is not None and fixturedef.cached_result[2] is not None:
+                fixturedef.finish(item._request)
+
+
+class FlakyScore:
+    """Retry history of one test over its recent runs"""
+
+    def __init__(self, nodeid, runs, retried, failed, js_fallback_runs, last_errors):
+        self.nodeid = nodeid
+        self.runs = runs
+        self.retried = retried
+        self.failed = failed
+        self.js_fallback_runs = js_fallback_runs
+        self.last_errors = last_errors
+
+    @property
+    def score(self):
+        return self.retried / self.runs if self.runs else 0.0
+
+    def __str__(self):
+        text = f"{self.nodeid}: score {self.score:.2f} ({self.retried}/{self.runs} runs retried, {self.failed} failed"
+        if self.js_fallback_runs:
+            text += f", JS click fallback in {self.js_fallback_runs}"
+        if self.last_errors:
+            text += f"; last: {self.last_errors}"
+        return text + ")"
+
+
+class FlakinessStore:
+    """SQLite store of per-test attempts across runs"""
+
+    def __init__(self, path=DEFAULT_DB):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def record_run(self, tests, target=None):
+        """
+        Store one run
+
+        Args:
+            tests: dict nodeid -> {"outcome", "attempts", "transient_errors" (list), "js_fallbacks"}
+
+        Returns:
+            int: The new run id
+        """
+        with self.conn:
+            run_id = self.conn.execute(
+                "INSERT INTO runs (started, git_sha, target) VALUES (?, ?, ?)",
+                (datetime.now().isoformat(timespec="seconds"), current_git_sha(), target),
+            ).lastrowid
+            self.conn.executemany(
+                "INSERT INTO test_runs (run_id, nodeid, outcome, attempts, transient_errors, js_fallbacks) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (run_id, nodeid, t["outcome"], t["attempts"],
+                     ", ".join(t["transient_errors"]) or None, t["js_fallbacks"])
+                    for nodeid, t in tests.items()
+                ],
+            )
+        return run_id
+
+    def scores(self, nodeids=None, window=DEFAULT_WINDOW):
+        """
+        Flakiness of each test over its last `window` runs
+
+        A run counts as retried when the test needed more than one attempt
+        or failed with a transient error on its only attempt
+
+        Returns:
+            list: FlakyScore objects, flakiest first
+        """
+        rows = self.conn.execute(
+            "SELECT nodeid, outcome, attempts, transient_errors, js_fallbacks FROM ("
+            "  SELECT *, ROW_NUMBER() OVER (PARTITION BY nodeid ORDER BY run_id DESC) AS age FROM test_runs"
+            ") WHERE age <= ? ORDER BY nodeid, age",
+            (window,),
+        ).fetchall()
+        history = {}
+        for row in rows:
+            if nodeids is None or row["nodeid"] in nodeids:
+                history.setdefault(row["nodeid"], []).append(row)
+
+        scores = []
+        for nodeid, runs in history.items():
+            retried = [r for r in runs if r["attempts"] > 1 or r["transient_errors"]]
+            scores.append(FlakyScore(
+                nodeid,
+                runs=len(runs),
+                retried=len(retried),
+                failed=sum(r["outcome"] in ("failed", "error") for r in runs),
+                js_fallback_runs=sum(r["js_fallbacks"] > 0 for r in runs),
+                last_errors=retried[0]["transient_errors"] if retried else None,
+            ))
+        return sorted(scores, key=lambda s: (s.score, s.js_fallback_runs), reverse=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m utils.flakiness", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--db", default=DEFAULT_DB, help=f"Flakiness database (default {DEFAULT_DB})")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    report = commands.add_parser("report", help="List the flakiest tests")
+    report.add_argument("--top", type=int, default=20)
+    report.add_argument("--window", type=int, default=DEFAULT_WINDOW, help="Number of recent runs per test")
+    report.add_argument("--all", action="store_true", help="Also list tests that never needed a retry")
+
+    args = parser.parse_args(argv)
+    if not os.path.exists(args.db):
+        parser.error(f"No flakiness database at {args.db} - run pytest first")
+    store = FlakinessStore(args.db)
+    try:
+        scores = [s for s in store.scores(window=args.window) if args.all or s.retried or s.js_fallback_runs]
+        if not scores:
+            print("No test needed a retry or a JavaScript click fallback")
+        for score in scores[:args.top]:
+            print(score)
+        return 0
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
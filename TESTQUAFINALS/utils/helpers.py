@@ -2,11 +2,26 @@
 Selenium helper utilities for improved test stability and reusability
 Contains wrapper functions for common Selenium operations
 """
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
+from collections import namedtuple
+from contextlib import contextmanager
 import logging
-import time
+
+from utils.browser_wait import (
+    BrowserWait,
+    count_above,
+    count_changed,
+    element_absent,
+    element_clickable,
+    element_present,
+    element_visible,
+    script_true,
+    url_changes,
+    url_contains,
+)
+from utils.impact import TrackedAttributes
+from utils.locators import registry, listbox_option, to_probe, LISTBOX, AdminLocators
+from utils.step_timing import TimedWait, recorder, timed_step
 
 # Configure logging
 logging.basicConfig(
@@ -15,33 +30,282 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Page-side instrumentation injected by the event-driven waits
+NETWORK_HOOK_JS = """
+if (!window.__qaNetwork) {
+    const hook = window.__qaNetwork = {pending: 0, last: performance.now()};
+    const done = () => { hook.pending = Math.max(0, hook.pending - 1); hook.last = performance.now(); };
+    const send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        hook.pending++; hook.last = performance.now();
+        this.addEventListener('loadend', done);
+        return send.apply(this, arguments);
+    };
+    if (window.fetch) {
+        const fetch = window.fetch;
+        window.fetch = function () {
+            hook.pending++; hook.last = performance.now();
+            return fetch.apply(this, arguments).finally(done);
+        };
+    }
+}
+"""
+
+NETWORK_IDLE_JS = NETWORK_HOOK_JS + """
+const hook = window.__qaNetwork;
+return hook.pending === 0 && performance.now() - hook.last >= arguments[0];
+"""
+
+DOM_SETTLED_JS = """
+if (!window.__qaMutations) {
+    const state = window.__qaMutations = {last: performance.now()};
+    new MutationObserver(() => { state.last = performance.now(); }).observe(
+        document.documentElement,
+        {childList: true, subtree: true, attributes: true, characterData: true}
+    );
+}
+return performance.now() - window.__qaMutations.last >= arguments[0];
+"""
+
+LISTBOX_POPULATED_JS = """
+const options = document.querySelectorAll("div[role='listbox'] div[role='option']");
+return options.length > 0 &&
+    !Array.from(options).some(o => o.textContent.includes('Searching'));
+"""
+
+# Sets window.__qaTableChanged on the next change inside the result table
+# (rows replaced, loader shown); a search or reset reload always makes one
+TABLE_WATCH_JS = """
+let table = null;
+for (const [kind, expr] of arguments[0]) {
+    try {
+        table = kind === 'css' ? document.querySelector(expr)
+            : document.evaluate(expr, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    } catch (e) {}
+    if (table) break;
+}
+if (window.__qaTableWatch) window.__qaTableWatch.disconnect();
+window.__qaTableChanged = false;
+if (!table) return false;
+const watch = window.__qaTableWatch = new MutationObserver(() => {
+    window.__qaTableChanged = true;
+    watch.disconnect();
+});
+watch.observe(table, {childList: true, subtree: true});
+return true;
+"""
+
+TABLE_CHANGED_JS = "return window.__qaTableChanged === true;"
+
+TABLE_EXTRACT_JS = """
+const rows = document.querySelectorAll("div.oxd-table-body div[role='row']");
+return Array.from(rows, row =>
+    Array.from(row.querySelectorAll("div[role='cell']"), cell => cell.innerText.trim())
+);
+"""
+
+# Fills text inputs and custom selects in one async call; resolves one
+# boolean per field (false = not found or not applied, the caller falls back to the UI)
+FILL_FORM_JS = """
+const [fields, timeoutMs, done] = arguments;
+const find = strategies => {
+    for (const [kind, expr] of strategies) {
+        try {
+            const el = kind === 'css' ? document.querySelector(expr)
+                : document.evaluate(expr, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+            if (el) return el;
+        } catch (e) {}
+    }
+    return null;
+};
+const tick = () => new Promise(resolve => setTimeout(resolve, 20));
+const openListbox = () => document.querySelector("div[role='listbox']");
+const setText = (input, value) => {
+    if (input.disabled || input.readOnly) return false;
+    Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set.call(input, value);
+    input.dispatchEvent(new Event('input', {bubbles: true}));
+    input.dispatchEvent(new Event('change', {bubbles: true}));
+    return input.value === value;
+};
+const pickOption = async (select, text) => {
+    select.click();
+    const deadline = performance.now() + timeoutMs;
+    while (performance.now() < deadline) {
+        const listbox = openListbox();
+        const option = listbox && Array.from(listbox.querySelectorAll("[role='option']"))
+            .find(o => o.textContent.trim() === text);
+        if (option) {
+            option.click();
+            await tick();
+            return select.textContent.trim() === text;
+        }
+        await tick();
+    }
+    // Leave the dropdown closed for the UI fallback
+    if (openListbox()) select.click();
+    return false;
+};
+(async () => {
+    const applied = [];
+    for (const [strategies, kind, value] of fields) {
+        const el = find(strategies);
+        try {
+            applied.push(!!el && (kind === 'text' ? setText(el, value) : await pickOption(el, value)));
+        } catch (e) {
+            applied.push(false);
+        }
+    }
+    return applied;
+})().then(done, () => done(fields.map(() => false)));
+"""
+
+# One record per row of the Admin > System Users table
+# (cell 0 is the checkbox and the last cell holds the action buttons)
+UserRow = namedtuple("UserRow", ["username", "role", "employee", "status"])
+
+# One control of a form filled by SeleniumHelpers.fill_form
+# kind: "text" (plain input), "select" (custom dropdown) or "autocomplete"
+FormField = namedtuple("FormField", ["locator", "kind"])
+
+
+class WaitPolicy:
+    """
+    Central wait configuration shared by the driver fixtures and SeleniumHelpers
+
+    explicit (default): implicit wait is 0 and every wait is explicit,
+    so negative lookups return immediately and polling is predictable
+    mixed: legacy behaviour with a browser-level implicit wait
+
+    The SeleniumHelpers waits run in the page (engine "browser", one
+    round-trip per wait, see utils/browser_wait.py) or poll over WebDriver
+    every poll_frequency seconds (engine "poll")
+    """
+    mode = "explicit"
+    engine = "browser"
+    implicit_wait = 0
+    poll_frequency = 0.1
+    # Per-helper overrides of poll_frequency, keyed by helper method name
+    helper_poll_frequency = {
+        "wait_for_network_idle": 0.2,
+        "wait_for_dom_settled": 0.2,
+    }
+
+    @classmethod
+    def configure(cls, mode="explicit", implicit_wait=5, poll_frequency=None, engine="browser", **helper_poll_frequency):
+        """
+        Args:
+            mode: "explicit" or "mixed"
+            implicit_wait: Browser implicit wait used in mixed mode
+            poll_frequency: Default seconds between explicit-wait polls
+            engine: "browser" or "poll"
+            **helper_poll_frequency: Per-helper poll interval overrides
+        """
+        if mode not in ("explicit", "mixed"):
+            raise ValueError(f"Unknown wait policy: {mode}")
+        if engine not in ("browser", "poll"):
+            raise ValueError(f"Unknown wait engine: {engine}")
+        cls.mode = mode
+        cls.engine = engine
+        cls.implicit_wait = implicit_wait if mode == "mixed" else 0
+        if poll_frequency is not None:
+            cls.poll_frequency = poll_frequency
+        cls.helper_poll_frequency.update(helper_poll_frequency)
+
+    @classmethod
+    def poll_for(cls, helper=None):
+        return cls.helper_poll_frequency.get(helper, cls.poll_frequency)
+
+    @classmethod
+    def wait(cls, driver, timeout, helper=None):
+        """
+        WebDriverWait using the poll interval configured for the helper
+        Time spent waiting is attributed to the current step in utils/step_timing.py
+        """
+        return TimedWait(driver, timeout, poll_frequency=cls.poll_for(helper))
+
+    @classmethod
+    def browser_wait(cls, driver, timeout, helper=None):
+        """BrowserWait for composite conditions, polling at the helper's interval under the poll engine"""
+        return BrowserWait(driver, timeout, poll_frequency=cls.poll_for(helper), in_browser=cls.engine == "browser")
 
-class SeleniumHelpers:
-    """Collection of reusable Selenium helper methods for robust test automation"""
+
+class FormFillPolicy:
+    """
+    How SeleniumHelpers.fill_form applies values
+
+    batched (default): text inputs and custom selects are set in one script
+    call; autocompletes (which need real typing to trigger their search) and
+    any control the script could not set are filled through the UI
+    ui: every field is filled with real clicks and keystrokes (full event fidelity)
+    """
+    mode = "batched"
+    # Kinds the batched script can set; the rest always go through the UI
+    batchable = ("text", "select")
+
+    @classmethod
+    def configure(cls, mode="batched"):
+        if mode not in ("batched", "ui"):
+            raise ValueError(f"Unknown form fill mode: {mode}")
+        cls.mode = mode
+
+
+def _wait_for_locator(driver, locator, timeout, helper, condition):
+    """
+    Wait for condition(strategy) on the registry's strategy of locator
+
+    A cached strategy that times out may no longer match the page: it is
+    resolved again, and when another strategy matches now the wait goes
+    on with that one.
+
+    Returns:
+        tuple: (value of the condition, strategy used)
+    """
+    strategy = registry.resolve(driver, locator)
+    try:
+        value, = WaitPolicy.browser_wait(driver, timeout, helper).until(condition(strategy))
+        return value, strategy
+    except TimeoutException:
+        if len(getattr(locator, "strategies", ())) < 2:
+            raise
+        retry = registry.re_resolve(driver, locator)
+        if retry == strategy:
+            raise
+        logger.info(f"⚠ {locator.name}: {strategy[1][:50]} no longer matches, waiting on {retry[1][:50]}")
+        value, = WaitPolicy.browser_wait(driver, timeout, helper).until(condition(retry))
+        return value, retry
+
+
+class SeleniumHelpers(metaclass=TrackedAttributes):
+    """
+    Collection of reusable Selenium helper methods for robust test automation
+    Browser-facing helpers are wrapped in @timed_step for per-step timing;
+    the metaclass records which helpers each test uses (test impact selection)
+    """
 
     @staticmethod
+    @timed_step
     def safe_click(driver, locator, timeout=10):
         """
         Safely click an element with proper wait and fallback
 
         Args:
             driver: WebDriver instance
-            locator: Tuple (By.XPATH, "path")
+            locator: Tuple (By.XPATH, "path") or Locator with fallbacks
             timeout: Max wait time in seconds
 
         Returns:
             bool: True if successful, False otherwise
         """
         try:
-            wait = WebDriverWait(driver, timeout)
-            element = wait.until(EC.element_to_be_clickable(locator))
+            element, strategy = _wait_for_locator(driver, locator, timeout, "safe_click", element_clickable)
             element.click()
-            logger.info(f"✓ Clicked element: {locator[1][:50]}")
+            logger.info(f"✓ Clicked element: {strategy[1][:50]}")
             return True
         except TimeoutException:
             logger.warning(f"⚠ Element not clickable, trying JavaScript: {locator[1][:50]}")
+            recorder.count_js_fallback()
             try:
-                element = driver.find_element(*locator)
+                element = driver.find_element(*registry.resolve(driver, locator))
                 driver.execute_script("arguments[0].click();", element)
                 logger.info(f"✓ JavaScript click successful")
                 return True
@@ -53,20 +317,20 @@ class SeleniumHelpers:
             return False
 
     @staticmethod
+    @timed_step
     def safe_send_keys(driver, locator, text, timeout=10, clear_first=True):
         """
         Safely send keys to element with proper wait
 
         Args:
             driver: WebDriver instance
-            locator: Tuple (By.XPATH, "path")
+            locator: Tuple (By.XPATH, "path") or Locator with fallbacks
             text: Text to enter
             timeout: Max wait time
             clear_first: Clear field before typing
         """
         try:
-            wait = WebDriverWait(driver, timeout)
-            element = wait.until(EC.element_to_be_clickable(locator))
+            element, _ = _wait_for_locator(driver, locator, timeout, "safe_send_keys", element_clickable)
             if clear_first:
                 element.clear()
             element.send_keys(text)
@@ -76,43 +340,82 @@ class SeleniumHelpers:
             raise
 
     @staticmethod
+    @timed_step
     def wait_for_element_visible(driver, locator, timeout=10):
         """Wait for element to be visible and return it"""
-        wait = WebDriverWait(driver, timeout)
-        element = wait.until(EC.visibility_of_element_located(locator))
-        logger.info(f"✓ Element visible: {locator[1][:50]}")
+        element, strategy = _wait_for_locator(driver, locator, timeout, "wait_for_element_visible", element_visible)
+        logger.info(f"✓ Element visible: {strategy[1][:50]}")
         return element
 
     @staticmethod
+    @timed_step
     def wait_for_element_clickable(driver, locator, timeout=10):
         """Wait for element to be clickable and return it"""
-        wait = WebDriverWait(driver, timeout)
-        element = wait.until(EC.element_to_be_clickable(locator))
-        logger.info(f"✓ Element clickable: {locator[1][:50]}")
+        element, strategy = _wait_for_locator(driver, locator, timeout, "wait_for_element_clickable", element_clickable)
+        logger.info(f"✓ Element clickable: {strategy[1][:50]}")
         return element
 
     @staticmethod
+    @timed_step
     def get_element_text(driver, locator, timeout=10):
         """Get text from element with wait"""
         element = SeleniumHelpers.wait_for_element_visible(driver, locator, timeout)
         return element.text
 
     @staticmethod
-    def wait_for_table_to_update(driver, timeout=10):
+    @timed_step
+    def watch_table(driver):
+        """
+        Start watching the result table before clicking Search or Reset
+        Until the click reloads it the old rows still look loaded; waits
+        given watched=True also wait for the table to change after this call
+
+        Returns:
+            bool: False when the page has no result table to watch
+        """
+        strategies = getattr(AdminLocators.TABLE, "strategies", (tuple(AdminLocators.TABLE),))
+        return bool(driver.execute_script(TABLE_WATCH_JS, [to_probe(s) for s in strategies]))
+
+    @staticmethod
+    @timed_step
+    def wait_for_table_to_update(driver, timeout=10, watched=False):
         """
         Wait for table body to be present and contain rows
-        Specific to OrangeHRM tables
-        """
-        from selenium.webdriver.common.by import By
-        wait = WebDriverWait(driver, timeout)
-        wait.until(EC.presence_of_element_located((By.CLASS_NAME, "oxd-table-body")))
-        # Wait for at least one row to appear
-        wait.until(
-            lambda d: len(d.find_elements(By.XPATH, "//div[@class='oxd-table-body']//div[@role='row']")) > 0
-        )
+        Specific to OrangeHRM tables; with watched, only after the table
+        changed since watch_table()
+        """
+        table_body = registry.resolve(driver, AdminLocators.TABLE_BODY)
+        rows = registry.resolve(driver, AdminLocators.TABLE_ROWS)
+        loader = registry.resolve(driver, AdminLocators.TABLE_LOADER)
+        conditions = [element_present(table_body), count_above(rows, 0), element_absent(loader)]
+        if watched:
+            conditions.insert(0, script_true(TABLE_CHANGED_JS))
+        wait = WaitPolicy.browser_wait(driver, timeout, "wait_for_table_to_update")
+        # Body present, at least one row and no loading spinner, checked together
+        wait.until(*conditions)
         logger.info(f"✓ Table updated with results")
 
     @staticmethod
+    @timed_step
+    def wait_for_table_loaded(driver, timeout=10, watched=False):
+        """
+        Wait for the table reload started by a search or reset to finish
+        Unlike wait_for_table_to_update this also returns for searches with
+        no results. Pass watched=True after watch_table(): body present and
+        loader absent already hold before the reload starts
+        """
+        table_body = registry.resolve(driver, AdminLocators.TABLE_BODY)
+        loader = registry.resolve(driver, AdminLocators.TABLE_LOADER)
+        conditions = [element_present(table_body), element_absent(loader)]
+        if watched:
+            conditions.insert(0, script_true(TABLE_CHANGED_JS))
+        with SeleniumHelpers.implicit_wait_disabled(driver):
+            wait = WaitPolicy.browser_wait(driver, timeout, "wait_for_table_loaded")
+            wait.until(*conditions)
+        logger.info(f"✓ Table loaded")
+
+    @staticmethod
+    @timed_step
     def select_dropdown_option(driver, dropdown_locator, option_text, timeout=10):
         """
         Handle custom dropdowns (non-select elements)
@@ -120,22 +423,19 @@ class SeleniumHelpers:
         2. Wait for listbox
         3. Click option
         """
-        from selenium.webdriver.common.by import By
-
         # Click dropdown to open
         SeleniumHelpers.safe_click(driver, dropdown_locator, timeout)
 
         # Wait for listbox to appear
-        listbox = (By.XPATH, "//div[@role='listbox']")
-        SeleniumHelpers.wait_for_element_visible(driver, listbox, timeout)
+        SeleniumHelpers.wait_for_element_visible(driver, LISTBOX, timeout)
 
-        # Click the option
-        option = (By.XPATH, f"//div[@role='listbox']//span[text()='{option_text}']")
-        SeleniumHelpers.safe_click(driver, option, timeout)
+        # Click the option (compiled locator cached per option text)
+        SeleniumHelpers.safe_click(driver, listbox_option(option_text), timeout)
 
         logger.info(f"✓ Selected dropdown option: {option_text}")
 
     @staticmethod
+    @timed_step
     def select_autocomplete_option(driver, input_locator, search_text, option_text, timeout=10):
         """
         Handle autocomplete fields
@@ -143,20 +443,223 @@ class SeleniumHelpers:
         2. Wait for suggestions
         3. Click matching option
         """
-        from selenium.webdriver.common.by import By
-
         # Type in autocomplete field
         SeleniumHelpers.safe_send_keys(driver, input_locator, search_text, timeout)
 
         # Wait for autocomplete listbox
-        listbox = (By.XPATH, "//div[@role='listbox']")
-        SeleniumHelpers.wait_for_element_visible(driver, listbox, timeout)
+        SeleniumHelpers.wait_for_element_visible(driver, LISTBOX, timeout)
 
-        # Small delay for autocomplete to populate
-        time.sleep(1)
+        # Wait for autocomplete results to replace the "Searching...." placeholder
+        SeleniumHelpers.wait_for_listbox_populated(driver, timeout)
 
         # Click matching option
-        option = (By.XPATH, f"//div[@role='listbox']//span[contains(text(),'{option_text}')]")
-        SeleniumHelpers.safe_click(driver, option, timeout)
+        SeleniumHelpers.safe_click(driver, listbox_option(option_text, partial=True), timeout)
 
         logger.info(f"✓ Selected autocomplete: {option_text}")
+
+    @staticmethod
+    @timed_step
+    def fill_form(driver, fields, values, mode=None, timeout=10):
+        """
+        Fill several form controls with as few round-trips as possible
+
+        Args:
+            driver: WebDriver instance
+            fields: Dict field name -> FormField
+            values: Dict field name -> value (None leaves the field untouched);
+                autocomplete values are (search text, option text) or the option text
+            mode: "batched" or "ui" (default FormFillPolicy.mode)
+            timeout: Max wait per control
+
+        Returns:
+            list: Names of the fields filled through the UI
+        """
+        mode = mode or FormFillPolicy.mode
+        unknown = set(values) - set(fields)
+        if unknown:
+            raise KeyError(f"Unknown form fields: {sorted(unknown)}")
+        pending = {name: value for name, value in values.items() if value is not None}
+        count = len(pending)
+
+        batch = [name for name in pending if fields[name].kind in FormFillPolicy.batchable] if mode == "batched" else []
+        if batch:
+            specs = [
+                [[to_probe(s) for s in getattr(fields[name].locator, "strategies", (tuple(fields[name].locator),))],
+                 fields[name].kind, pending[name]]
+                for name in batch
+            ]
+            applied = driver.execute_async_script(FILL_FORM_JS, specs, int(timeout * 1000))
+            for name, ok in zip(batch, applied):
+                if ok:
+                    del pending[name]
+                else:
+                    logger.info(f"⚠ Could not set '{name}' by script, filling it through the UI")
+
+        for name, value in pending.items():
+            field = fields[name]
+            if field.kind == "text":
+                SeleniumHelpers.safe_send_keys(driver, field.locator, value, timeout)
+            elif field.kind == "select":
+                SeleniumHelpers.select_dropdown_option(driver, field.locator, value, timeout)
+            elif field.kind == "autocomplete":
+                search_text, option_text = value if isinstance(value, tuple) else (value.split()[0], value)
+                SeleniumHelpers.select_autocomplete_option(driver, field.locator, search_text, option_text, timeout)
+            else:
+                raise ValueError(f"Unknown form field kind: {field.kind}")
+        logger.info(f"✓ Filled {count} form fields ({len(pending)} through the UI)")
+        return list(pending)
+
+    @staticmethod
+    @timed_step
+    def wait_for_url_contains(driver, fragment, timeout=10):
+        """Wait until the current URL contains the given fragment and return it"""
+        wait = WaitPolicy.browser_wait(driver, timeout, "wait_for_url_contains")
+        url, = wait.until(url_contains(fragment))
+        logger.info(f"✓ URL contains: {fragment}")
+        return url
+
+    @staticmethod
+    @timed_step
+    def wait_for_url_change(driver, old_url, timeout=10):
+        """Wait until the browser navigates away from old_url and return the new URL"""
+        wait = WaitPolicy.browser_wait(driver, timeout, "wait_for_url_change")
+        url, = wait.until(url_changes(old_url))
+        logger.info(f"✓ URL changed: {url}")
+        return url
+
+    @staticmethod
+    @timed_step
+    def wait_for_row_count_change(driver, previous_count, timeout=10):
+        """
+        Wait until the OrangeHRM table row count differs from previous_count
+        Used after actions that reload the table (search, reset)
+
+        Returns:
+            int: New row count
+        """
+        rows = registry.resolve(driver, AdminLocators.TABLE_ROWS)
+        wait = WaitPolicy.browser_wait(driver, timeout, "wait_for_row_count_change")
+        count, = wait.until(count_changed(rows, previous_count))
+        logger.info(f"✓ Table row count changed: {previous_count} -> {count}")
+        return count
+
+    @staticmethod
+    @timed_step
+    def wait_for_listbox_populated(driver, timeout=10):
+        """
+        Wait for a dropdown/autocomplete listbox to show real options
+        Autocomplete fields show a "Searching...." option while the request is in flight
+        """
+        wait = WaitPolicy.browser_wait(driver, timeout, "wait_for_listbox_populated")
+        wait.until(script_true(LISTBOX_POPULATED_JS))
+        logger.info(f"✓ Listbox populated")
+
+    @staticmethod
+    def install_network_hook(driver):
+        """
+        Track in-flight XHR/fetch requests in the page
+        Registered through CDP so it survives navigations; also applied to the current document
+        """
+        try:
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": NETWORK_HOOK_JS})
+        except Exception:
+            # Non-Chromium drivers: hook only the current document
+            pass
+        driver.execute_script(NETWORK_HOOK_JS)
+
+    @staticmethod
+    @timed_step
+    def wait_for_network_idle(driver, idle_ms=300, timeout=10):
+        """
+        Wait until no XHR/fetch request has been in flight for idle_ms
+        Installs the network hook on the current page if it is missing;
+        requests started before the hook existed are not tracked
+        """
+        wait = WaitPolicy.browser_wait(driver, timeout, "wait_for_network_idle")
+        wait.until(script_true(NETWORK_IDLE_JS, idle_ms))
+        logger.info(f"✓ Network idle for {idle_ms} ms")
+
+    @staticmethod
+    @timed_step
+    def wait_for_dom_settled(driver, quiet_ms=300, timeout=10):
+        """
+        Wait until the DOM has not mutated for quiet_ms
+        Uses a MutationObserver installed on first call
+        """
+        wait = WaitPolicy.browser_wait(driver, timeout, "wait_for_dom_settled")
+        wait.until(script_true(DOM_SETTLED_JS, quiet_ms))
+        logger.info(f"✓ DOM settled for {quiet_ms} ms")
+
+    @staticmethod
+    @contextmanager
+    def implicit_wait_disabled(driver):
+        """
+        Temporarily set the implicit wait to 0 for absence checks
+        No-op under the explicit wait policy, where it is already 0
+        """
+        previous = WaitPolicy.implicit_wait
+        if not previous:
+            yield driver
+            return
+        driver.implicitly_wait(0)
+        try:
+            yield driver
+        finally:
+            driver.implicitly_wait(previous)
+
+    @staticmethod
+    @timed_step
+    def find_elements_now(driver, locator):
+        """find_elements that never blocks on the implicit wait (empty list if absent)"""
+        with SeleniumHelpers.implicit_wait_disabled(driver):
+            return registry.find_elements(driver, locator)
+
+    @staticmethod
+    @timed_step
+    def wait_for_element_absent(driver, locator, timeout=10):
+        """
+        Wait until no element matching locator is displayed
+        Checked in the page, or polled without the implicit wait so each check is a single quick lookup
+        """
+        locator = registry.resolve(driver, locator)
+        with SeleniumHelpers.implicit_wait_disabled(driver):
+            wait = WaitPolicy.browser_wait(driver, timeout, "wait_for_element_absent")
+            wait.until(element_absent(locator))
+        logger.info(f"✓ Element absent: {locator[1][:50]}")
+
+    @staticmethod
+    @timed_step
+    def read_table(driver):
+        """
+        Read the whole System Users table in a single execute_script call
+
+        Returns:
+            list: UserRow records in table order (empty list if no rows)
+        """
+        cells = driver.execute_script(TABLE_EXTRACT_JS) or []
+        rows = [UserRow(*row[1:5]) for row in cells if len(row) >= 5]
+        logger.info(f"✓ Read {len(rows)} table rows")
+        return rows
+
+    @staticmethod
+    def filter_rows(rows, **criteria):
+        """
+        Return the rows whose fields equal every given criterion
+        Example: filter_rows(rows, role="Admin", status="Enabled")
+        """
+        return [row for row in rows if all(getattr(row, k) == v for k, v in criteria.items())]
+
+    @staticmethod
+    def assert_all_rows(rows, **criteria):
+        """
+        Assert that there is at least one row and every row matches the criteria
+
+        Raises:
+            AssertionError: listing the rows that do not match
+        """
+        assert rows, f"No table rows to check against {criteria}"
+        matching = SeleniumHelpers.filter_rows(rows, **criteria)
+        mismatched = [row for row in rows if row not in matching]
+        assert not mismatched, (
+            f"{len(mismatched)} of {len(rows)} rows do not match {criteria}: {mismatched[:5]}"
+        )
@@ -0,0 +1,222 @@
+"""
+Test impact selection
+Every run records, per test, which SeleniumHelpers methods and locator class
+attributes it read. With pytest --impact only the tests that touched a helper
+or locator changed since a git revision (plus new or unrecorded tests and tests
+whose own code changed) are run; any other code change selects the full suite
+"""
+from datetime import datetime
+import ast
+import json
+import os
+import re
+import subprocess
+
+DEFAULT_MAP = "reports/impact_map.json"
+
+# Changes that never affect test behaviour
+IGNORED_SUFFIXES = (".md",)
+IGNORED_DIRS = ("reports/", "screenshots/")
+
+HUNK_RE = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+
+
+class TrackedAttributes(type):
+    """
+    Metaclass of SeleniumHelpers and the locator classes
+    Records "Class.attribute" for every public class attribute read while
+    tracking is on (accessed is a set), including reads inside other helpers
+    """
+    accessed = None
+
+    def __getattribute__(cls, name):
+        accessed = TrackedAttributes.accessed
+        if accessed is not None and not name.startswith("_"):
+            accessed.add(f"{type.__getattribute__(cls, '__name__')}.{name}")
+        return type.__getattribute__(cls, name)
+
+
+def begin_tracking():
+    """Start collecting attribute reads for a new test"""
+    TrackedAttributes.accessed = set()
+
+
+def end_tracking():
+    """Stop collecting and return the sorted "Class.attribute" names read"""
+    accessed, TrackedAttributes.accessed = TrackedAttributes.accessed or set(), None
+    return sorted(accessed)
+
+
+class ImpactMap:
+    """nodeid -> names read by the test in its last recorded run, stored as JSON"""
+
+    def __init__(self, path=DEFAULT_MAP):
+        self.path = path
+        self.tests = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.tests = json.load(f).get("tests", {})
+
+    def update(self, usage):
+        """Merge this run's usage (nodeid -> list of names) into the map"""
+        self.tests.update(usage)
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"updated": datetime.now().isoformat(timespec="seconds"), "tests": self.tests}, f, indent=1)
+        return self.path
+
+
+def changed_lines(base="HEAD", cwd=None):
+    """
+    Lines changed in the working tree since `base`, per path relative to cwd
+
+    Returns:
+        dict: path -> set of line numbers in the current file (None for
+        untracked files), or None when git is not available
+    """
+    try:
+        diff = subprocess.run(
+            ["git", "diff", "--unified=0", "--relative", "--no-color", base, "--"],
+            cwd=cwd, capture_output=True, text=True, timeout=30, check=True,
+        ).stdout
+        untracked = subprocess.run(
+            ["git", "ls-files", "--others", "--exclude-standard"],
+            cwd=cwd, capture_output=True, text=True, timeout=30, check=True,
+        ).stdout.splitlines()
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return parse_diff(diff, untracked)
+
+
+def parse_diff(diff, untracked=()):
+    """
+    Changed lines of `git diff --unified=0` output, per path
+
+    Returns:
+        dict: path -> set of line numbers in the current file (None for
+        untracked and deleted files), ignored paths left out
+    """
+    changes = {path: None for path in untracked}
+    old_path = path = None
+    for line in diff.splitlines():
+        if line.startswith("--- "):
+            old_path = line[6:]
+        elif line.startswith("+++ "):
+            if line == "+++ /dev/null":
+                # Deleted file
+                changes[old_path] = None
+                path = None
+            else:
+                path = line[6:]
+                changes.setdefault(path, set())
+        elif path is not None:
+            match = HUNK_RE.match(line)
+            if match:
+                start, count = int(match.group(1)), int(match.group(2) or 1)
+                # Pure deletions (count 0) mark the line they were removed after
+                changes[path].update(range(start, start + count) if count else {start})
+    return {p: lines for p, lines in changes.items() if not p.endswith(IGNORED_SUFFIXES)
+            and not p.startswith(IGNORED_DIRS)}
+
+
+def _statement_ranges(body, prefix):
+    """(name, first line, last line) for every function and assignment in a class or module body"""
+    ranges = []
+    for node in body:
+        first = min([d.lineno for d in getattr(node, "decorator_list", [])] + [node.lineno])
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            ranges.append((f"{prefix}{node.name}", first, node.end_lineno))
+        elif isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    ranges.append((f"{prefix}{target.id}", first, node.end_lineno))
+    return ranges
+
+
+def _test_ranges(body):
+    """_statement_ranges of a test module, plus the methods of its test classes under their own names"""
+    ranges = _statement_ranges(body, "")
+    for node in body:
+        if isinstance(node, ast.ClassDef):
+            ranges.extend(_statement_ranges(node.body, ""))
+    return ranges
+
+
+def tracked_definitions(source):
+    """
+    Line ranges of the attributes of TrackedAttributes classes in a module
+
+    Returns:
+        list: (name, first line, last line) tuples
+    """
+    ranges = []
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.ClassDef) and any(
+            isinstance(k.value, ast.Name) and k.value.id == TrackedAttributes.__name__ for k in node.keywords
+        ):
+            ranges.extend(_statement_ranges(node.body, f"{node.name}."))
+    return ranges
+
+
+def select(items, impact_map, changes, rootdir="."):
+    """
+    Pick the tests affected by the changes
+
+    Args:
+        items: collected pytest items
+        impact_map: ImpactMap from previous runs
+        changes: result of changed_lines()
+
+    Returns:
+        tuple: (selected items, human-readable reason)
+    """
+    test_paths = {os.path.relpath(str(item.path), rootdir).replace(os.sep, "/") for item in items}
+    changed_names = set()
+    changed_tests = set()
+    for path, lines in changes.items():
+        full = os.path.join(rootdir, path)
+        if lines is None or not path.endswith(".py") or not os.path.exists(full):
+            if path in test_paths and lines is None:
+                changed_tests.add((path, None))
+                continue
+            return list(items), f"{path} changed"
+        with open(full, encoding="utf-8") as f:
+            source = f.read()
+
+        if path in test_paths:
+            functions = _test_ranges(ast.parse(source).body)
+            hit = {name for name, first, last in functions if any(first <= n <= last for n in lines)}
+            if lines - {n for _, first, last in functions for n in range(first, last + 1)}:
+                changed_tests.add((path, None))
+            changed_tests.update((path, name) for name in hit)
+            continue
+
+        ranges = tracked_definitions(source)
+        attribute_lines = {n for _, first, last in ranges for n in range(first, last + 1)}
+        # Module-level code, class headers and docstrings can affect every attribute
+        if not ranges or lines - attribute_lines:
+            return list(items), f"{path} changed outside helper/locator definitions"
+        changed_names.update(name for name, first, last in ranges if any(first <= n <= last for n in lines))
+        # Attributes that no longer exist count as changed
+        defined = {name for name, _, _ in ranges}
+        prefixes = {name.split(".")[0] + "." for name in defined}
+        changed_names.update(
+            name for usage in impact_map.tests.values() for name in usage
+            if name.startswith(tuple(prefixes)) and name not in defined
+        )
+
+    selected = []
+    for item in items:
+        path = os.path.relpath(str(item.path), rootdir).replace(os.sep, "/")
+        usage = impact_map.tests.get(item.nodeid)
+        if (
+            usage is None
+            or (path, None) in changed_tests
+            or (path, getattr(item, "originalname", item.name)) in changed_tests
+            or changed_names.intersection(usage)
+        ):
+            selected.append(item)
+    names = ", ".join(sorted(changed_names)[:5]) + ("..." if len(changed_names) > 5 else "")
+    return selected, f"changed: {names or 'no tracked helper or locator'}"
@@ -0,0 +1,133 @@
+"""
+Streaming test report: one JSON record per line, flushed as each test finishes
+Only tests still in flight are held in memory, and a crashed run keeps every
+record written so far. The file is opened when the first test reports, so a
+run without tests keeps the previous report. reports/viewer.html renders the file.
+
+Record types:
+    session        - run metadata, first line
+    test           - one finished test (outcome, durations, steps, artifacts, reruns)
+    session_finish - exit status and outcome counts, last line of a complete run
+"""
+from datetime import datetime
+import json
+import os
+
+# Failure text kept per record
+MAX_TRACEBACK_CHARS = 4000
+
+
+class JsonlReporter:
+    """Writes report records to a JSON-lines file (controller process only under xdist)"""
+
+    def __init__(self, path):
+        self.path = path
+        self.counts = {}
+        self._file = None
+        self._session = None
+        self._running = {}
+
+    def write(self, record):
+        if self._file is None:
+            self._open()
+        self._file.write(json.dumps(record, default=str) + "\n")
+        self._file.flush()
+
+    def session_start(self, **info):
+        """Run metadata, written as the first line once a test reports"""
+        self._session = dict(type="session", started=datetime.now().isoformat(timespec="seconds"), **info)
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._file = open(self.path, "w", encoding="utf-8")
+        if self._session:
+            self._file.write(json.dumps(self._session, default=str) + "\n")
+
+    def add_report(self, report):
+        """Collect one phase report; the test record is written after its teardown"""
+        test = self._running.setdefault(report.nodeid, {
+            "type": "test",
+            "nodeid": report.nodeid,
+            "outcome": "passed",
+            "phases": {},
+            "worker": _worker_id(report),
+        })
+        if report.outcome == "rerun":
+            # Failed attempt of a retried test; the final attempt fills in the rest
+            test.setdefault("reruns", []).append({
+                "phase": report.when,
+                "duration_s": round(report.duration, 4),
+                "message": _crash_message(report),
+                "artifacts": dict(report.user_properties).get("artifacts", []),
+            })
+            return
+        test["phases"][report.when] = round(report.duration, 4)
+        outcome = _outcome(report)
+        if outcome != "passed" and test["outcome"] == "passed":
+            test["outcome"] = outcome
+        if report.failed:
+            test.setdefault("failures", []).append({
+                "phase": report.when,
+                "message": _crash_message(report),
+                "traceback": report.longreprtext[-MAX_TRACEBACK_CHARS:],
+            })
+        elif report.skipped and report.when != "teardown":
+            test["skip_reason"] = _crash_message(report)
+        for name, value in report.user_properties:
+            if name == "step_timings":
+                top = [s for s in value if s["depth"] == 0]
+                test["steps"] = [
+                    {key: s[key] for key in ("helper", "locator", "phase", "wall_s", "wait_s", "polls", "error")}
+                    for s in top
+                ]
+            elif name in ("artifacts", "browser_metrics", "network", "attempts"):
+                test[name] = value
+
+        if report.when == "teardown":
+            del self._running[report.nodeid]
+            test["duration_s"] = round(sum(test["phases"].values()), 4)
+            test["finished"] = datetime.now().isoformat(timespec="seconds")
+            self.counts[test["outcome"]] = self.counts.get(test["outcome"], 0) + 1
+            self.write(test)
+
+    def close(self, exitstatus):
+        """
+        Returns:
+            bool: whether the report was written (False when no test ran)
+        """
+        if self._file is None and not self._running:
+            return False
+        self.write({
+            "type": "session_finish",
+            "finished": datetime.now().isoformat(timespec="seconds"),
+            "exitstatus": int(exitstatus),
+            "counts": self.counts,
+            # Tests interrupted mid-run (no teardown report) are listed by id only
+            "unfinished": sorted(self._running),
+        })
+        self._file.close()
+        return True
+
+
+def _outcome(report):
+    if hasattr(report, "wasxfail"):
+        return "xfailed" if report.skipped else "xpassed"
+    if report.failed:
+        return "failed" if report.when == "call" else "error"
+    return report.outcome
+
+
+def _crash_message(report):
+    crash = getattr(report.longrepr, "reprcrash", None)
+    if crash is not None:
+        return crash.message
+    if isinstance(report.longrepr, tuple):
+        # Skips are reported as (path, lineno, reason)
+        return report.longrepr[2]
+    return str(report.longrepr or "")
+
+
+def _worker_id(report):
+    node = getattr(report, "node", None)
+    gateway = getattr(node, "gateway", None)
+    return getattr(gateway, "id", None) or "master"
@@ -0,0 +1,334 @@
+"""
+Load generation with the Admin > System Users flows of tests/test_admin.py
+Virtual users log in, open System Users, search by username, role and status
+(resetting the filters after each search) in a loop, with a ramp-up, think
+time and fixed duration; the report gives throughput and latency percentiles
+per step. HTTP users replay the requests the browser makes; browser users
+drive Chrome through the page objects
+
+Loads the local stand-in unless a remote host is asked for explicitly
+(--target demo or --orangehrm-url)
+
+CLI:
+    python -m utils.load --users 20 --ramp-up 5 --duration 60
+    python -m utils.load --mode browser --users 3 --orangehrm-url http://127.0.0.1:8080
+"""
+import argparse
+import json
+import logging
+import os
+import random
+import threading
+import time
+
+from utils.api import LOGOUT_PATH, OrangeHrmApi
+from utils.config import DEMO_BASE_URL, get_base_url
+from utils.pages import SYSTEM_USERS_PATH, AdminUsersPage, LoginPage
+from utils.session import DASHBOARD_PATH
+
+logger = logging.getLogger(__name__)
+
+# Same searches as the Admin tests, each followed by a reset
+SEARCHES = [
+    ("search_username", {"username": "Admin"}),
+    ("search_role", {"role": "Admin"}),
+    ("search_status", {"status": "Enabled"}),
+]
+STEPS = ["login", "open_users"] + [name for name, _ in SEARCHES] + ["reset"]
+
+PERCENTILES = (50, 90, 95, 99)
+
+DEFAULT_OUTPUT = "reports/load_report.json"
+# Seconds to wait for busy virtual users after Ctrl+C
+STOP_TIMEOUT = 30
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a sorted list"""
+    if not values:
+        return None
+    rank = max(1, -(-len(values) * pct // 100))
+    return values[int(rank) - 1]
+
+
+class LoadStats:
+    """Step latencies and errors from every virtual user (thread-safe)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latencies = {}
+        self._errors = {}
+        self.iterations = 0
+
+    def record(self, step, seconds, error=None):
+        with self._lock:
+            if error is None:
+                self._latencies.setdefault(step, []).append(seconds)
+            else:
+                self._errors.setdefault(step, []).append(error)
+
+    def iteration_done(self):
+        with self._lock:
+            self.iterations += 1
+
+    def summary(self, elapsed):
+        """
+        Returns:
+            dict: step -> ok, errors, per-second throughput and p50/p90/p95/p99
+            and max latency in seconds (successful calls only), plus the first
+            error message of the step
+        """
+        with self._lock:
+            steps = {}
+            for step in STEPS:
+                latencies = sorted(self._latencies.get(step, []))
+                errors = self._errors.get(step, [])
+                if not latencies and not errors:
+                    continue
+                steps[step] = {
+                    "ok": len(latencies),
+                    "errors": len(errors),
+                    "throughput": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+                    **{f"p{pct}": _round(percentile(latencies, pct)) for pct in PERCENTILES},
+                    "max": _round(latencies[-1] if latencies else None),
+                    "first_error": errors[0] if errors else None,
+                }
+            return steps
+
+
+def _round(seconds):
+    return round(seconds, 4) if seconds is not None else None
+
+
+class HttpUser:
+    """
+    Virtual user at the HTTP level: the page loads and /api/v2 calls the
+    browser makes for each step, on its own OrangeHrmApi session (one login
+    per iteration)
+    """
+
+    def __init__(self, base_url, username, password):
+        self.api = OrangeHrmApi(base_url, username, password, pool_size=1)
+
+    def login(self):
+        self.api.login()
+        self.api.page(DASHBOARD_PATH)
+
+    def open_users(self):
+        self.api.page(SYSTEM_USERS_PATH)
+        self.api.search_users()
+
+    def search(self, **filters):
+        if not self.api.search_users(**filters):
+            raise RuntimeError(f"No results for {filters}")
+
+    def reset(self):
+        self.api.search_users()
+
+    def logout(self):
+        self.api.logout()
+
+    def close(self):
+        self.api.close()
+
+
+class BrowserUser:
+    """Virtual user driving its own Chrome through LoginPage and AdminUsersPage"""
+
+    def __init__(self, base_url, username, password, driver):
+        self.driver = driver
+        self.username = username
+        self.password = password
+        self.login_page = LoginPage(driver, base_url)
+        self.users_page = AdminUsersPage(driver, base_url)
+
+    def login(self):
+        self.driver.delete_all_cookies()
+        self.login_page.open().login(self.username, self.password)
+        self.login_page.dashboard_header()
+
+    def open_users(self):
+        self.users_page.open()
+
+    def search(self, **filters):
+        self.users_page.search(**filters)
+
+    def reset(self):
+        self.users_page.reset()
+
+    def logout(self):
+        self.driver.get(self.users_page.base_url + LOGOUT_PATH)
+
+    def close(self):
+        self.driver.quit()
+
+
+def browser_user_factory(base_url, username, password, profile="default", chromedriver_path=None):
+    """Factory for run_load that starts one Chrome per virtual user"""
+    from utils.browser_profiles import apply_runtime_settings, build_chrome_options
+    from utils.driver_resolver import resolve_chromedriver_path, start_chrome
+
+    driver_path = resolve_chromedriver_path(pinned_path=chromedriver_path)
+
+    def factory():
+        driver = start_chrome(driver_path, build_chrome_options(profile))
+        apply_runtime_settings(driver, profile)
+        driver.implicitly_wait(0)
+        return BrowserUser(base_url, username, password, driver)
+    return factory
+
+
+def run_load(user_factory, users, ramp_up, think_time, duration):
+    """
+    Run `users` virtual users for `duration` seconds
+
+    Users start evenly spread over `ramp_up` seconds and pause a random
+    0.5x-1.5x `think_time` after every step. A failed step ends the user's
+    iteration; the next one starts with a new login.
+
+    Returns:
+        dict: settings, elapsed seconds, iterations and per-step summary
+    """
+    stats = LoadStats()
+    started = time.monotonic()
+    deadline = started + duration
+    stop = threading.Event()
+
+    def think():
+        if think_time:
+            stop.wait(random.uniform(0.5, 1.5) * think_time)
+
+    def step(name, action, **kwargs):
+        begin = time.perf_counter()
+        try:
+            action(**kwargs)
+        except Exception as e:
+            stats.record(name, time.perf_counter() - begin, f"{type(e).__name__}: {e}")
+            raise
+        stats.record(name, time.perf_counter() - begin)
+        think()
+
+    def virtual_user(index):
+        stop.wait(ramp_up * index / users)
+        try:
+            user = user_factory()
+        except Exception as e:
+            stats.record("login", 0.0, f"{type(e).__name__}: {e}")
+            logger.warning(f"⚠ Virtual user {index} could not start: {e}")
+            return
+        try:
+            while time.monotonic() < deadline and not stop.is_set():
+                try:
+                    step("login", user.login)
+                    step("open_users", user.open_users)
+                    for name, filters in SEARCHES:
+                        if time.monotonic() >= deadline:
+                            break
+                        step(name, user.search, **filters)
+                        step("reset", user.reset)
+                    else:
+                        stats.iteration_done()
+                    user.logout()
+                except Exception:
+                    think()
+        finally:
+            user.close()
+
+    threads = [threading.Thread(target=virtual_user, args=(i,), name=f"vu-{i}", daemon=True) for i in range(users)]
+    for thread in threads:
+        thread.start()
+    try:
+        for thread in threads:
+            thread.join()
+    except KeyboardInterrupt:
+        stop.set()
+        for thread in threads:
+            thread.join(STOP_TIMEOUT)
+    elapsed = time.monotonic() - started
+    return {
+        "users": users,
+        "ramp_up_s": ramp_up,
+        "think_time_s": think_time,
+        "duration_s": duration,
+        "elapsed_s": round(elapsed, 2),
+        "iterations": stats.iterations,
+        "steps": stats.summary(elapsed),
+    }
+
+
+def _print_report(report):
+    print(
+        f"{report['users']} virtual users, {report['elapsed_s']:.1f}s, "
+        f"{report['iterations']} complete iterations ({report['mode']} @ {report['base_url']})"
+    )
+    print(f"{'step':16}  {'ok':>6}  {'errors':>6}  {'req/s':>7}  "
+          + "  ".join(f"{'p' + str(p) + ' ms':>8}" for p in PERCENTILES) + f"  {'max ms':>8}")
+    for name, s in report["steps"].items():
+        latencies = "  ".join(_ms(s[key]) for key in [f"p{p}" for p in PERCENTILES] + ["max"])
+        print(f"{name:16}  {s['ok']:>6}  {s['errors']:>6}  {s['throughput']:>7.2f}  {latencies}")
+        if s["first_error"]:
+            print(f"{'':16}  first error: {s['first_error']}")
+
+
+def _ms(seconds):
+    return f"{seconds * 1000:>8.1f}" if seconds is not None else f"{'-':>8}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m utils.load", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--mode", choices=("http", "browser"), default="http",
+                        help="HTTP-level users (default) or one Chrome per user")
+    parser.add_argument("--users", type=int, default=10, help="Concurrent virtual users (default 10)")
+    parser.add_argument("--ramp-up", type=float, default=10.0, help="Seconds over which users start (default 10)")
+    parser.add_argument("--think-time", type=float, default=1.0,
+                        help="Mean pause after each step in seconds (default 1)")
+    parser.add_argument("--duration", type=float, default=60.0, help="Seconds to run, ramp-up included (default 60)")
+    parser.add_argument("--target", choices=("local", "demo"), default="local",
+                        help="local (default) starts the stand-in server in this process; "
+                             "demo loads the public shared demo")
+    parser.add_argument("--orangehrm-url", help="Base URL of the instance to load (overrides --target)")
+    parser.add_argument("--username", default="Admin")
+    parser.add_argument("--password", default="admin123")
+    parser.add_argument("--browser-profile", default="default", help="Browser profile for --mode browser")
+    parser.add_argument("--chromedriver-path", help="ChromeDriver binary for --mode browser")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help=f"JSON report (default {DEFAULT_OUTPUT})")
+    args = parser.parse_args(argv)
+    if args.users < 1:
+        parser.error("--users must be at least 1")
+
+    # utils.helpers configured the root logger at INFO on import; per-request lines would drown the summary
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s - %(levelname)s - %(message)s", force=True)
+    server = None
+    if args.target == "local" and not args.orangehrm_url:
+        from standin import StandInServer
+        server = StandInServer()
+        base_url = server.start()
+    else:
+        base_url = (args.orangehrm_url or get_base_url()).rstrip("/")
+    if base_url == DEMO_BASE_URL:
+        print(f"Loading the public demo at {base_url} - keep --users small")
+
+    if args.mode == "browser":
+        factory = browser_user_factory(base_url, args.username, args.password,
+                                       args.browser_profile, args.chromedriver_path)
+    else:
+        def factory():
+            return HttpUser(base_url, args.username, args.password)
+
+    try:
+        report = run_load(factory, args.users, args.ramp_up, args.think_time, args.duration)
+    finally:
+        if server is not None:
+            server.stop()
+    report = {"mode": args.mode, "base_url": base_url, **report}
+    _print_report(report)
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=1)
+        print(f"Report: {args.output}")
+    return 0 if report["steps"] and not any(s["errors"] for s in report["steps"].values()) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,401 @@
+"""
+Centralized locator constants for the OrangeHRM pages under test
+Shared by the test modules, fixtures and helper utilities
+
+Each locator is a Locator: a regular (By, value) tuple for its preferred
+strategy (CSS where possible) that also carries ordered fallbacks. The
+module-level `registry` probes all strategies in one browser round-trip,
+remembers which one matched per browser session until it stops matching and
+records lookup timing.
+The page locator classes record which attributes each test reads, for
+test impact selection (utils/impact.py).
+"""
+from selenium.webdriver.common.by import By
+import functools
+import logging
+import time
+
+from utils.impact import TrackedAttributes
+
+logger = logging.getLogger(__name__)
+
+# Checks every strategy of every requested locator in a single round-trip
+# and returns, per locator, the index of the first strategy that matches (-1 if none)
+PROBE_STRATEGIES_JS = """
+const found = (kind, expr) => kind === 'css'
+    ? document.querySelector(expr) !== null
+    : document.evaluate(expr, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null)
+        .singleNodeValue !== null;
+return arguments[0].map(strategies => strategies.findIndex(([kind, expr]) => {
+    try { return found(kind, expr); } catch (e) { return false; }
+}));
+"""
+
+# Returns [index, elements] for the first of the given [index, kind, expr]
+# strategies that matches anything, [-1, []] when none does
+FIND_FIRST_MATCH_JS = """
+const findAll = (kind, expr) => {
+    if (kind === 'css') return Array.from(document.querySelectorAll(expr));
+    const found = document.evaluate(expr, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    return Array.from({length: found.snapshotLength}, (_, i) => found.snapshotItem(i));
+};
+for (const [index, kind, expr] of arguments[0]) {
+    let elements = [];
+    try { elements = findAll(kind, expr); } catch (e) {}
+    if (elements.length) return [index, elements];
+}
+return [-1, []];
+"""
+
+
+class Locator(tuple):
+    """
+    (By, value) tuple of the preferred strategy plus ordered fallbacks
+
+    Behaves exactly like the plain tuples used before, so
+    driver.find_element(*locator) and expected_conditions keep working.
+    The qualified name (e.g. "AdminLocators.TABLE") is set automatically
+    when the locator is assigned as a class attribute.
+    """
+
+    def __new__(cls, *strategies, name=None):
+        if not strategies:
+            raise ValueError("Locator needs at least one (By, value) strategy")
+        locator = super().__new__(cls, strategies[0])
+        locator.strategies = tuple(tuple(s) for s in strategies)
+        locator.name = name
+        return locator
+
+    def __set_name__(self, owner, attr_name):
+        if self.name is None:
+            self.name = f"{owner.__name__}.{attr_name}"
+
+    def __repr__(self):
+        return f"Locator({self.name or tuple(self)!r})"
+
+
+def to_probe(strategy):
+    """Translate a (By, value) strategy into a ("css" | "xpath", expression) pair for the probe script"""
+    by, value = strategy
+    if by == By.CSS_SELECTOR:
+        return ["css", value]
+    if by == By.XPATH:
+        return ["xpath", value]
+    if by == By.ID:
+        return ["css", f'[id="{value}"]']
+    if by == By.NAME:
+        return ["css", f'[name="{value}"]']
+    if by == By.CLASS_NAME:
+        return ["css", f".{value}"]
+    if by == By.TAG_NAME:
+        return ["css", value]
+    if by == By.LINK_TEXT:
+        return ["xpath", f'//a[normalize-space(.)="{value}"]']
+    if by == By.PARTIAL_LINK_TEXT:
+        return ["xpath", f'//a[contains(., "{value}")]']
+    raise ValueError(f"Unsupported locator strategy: {by}")
+
+
+class LocatorRegistry:
+    """
+    Resolves Locator fallbacks and caches the winning strategy per browser session
+
+    Locators with a single strategy are returned as-is with no browser call.
+    For locators with fallbacks the first resolve() probes all strategies
+    in one script call; once a strategy matches it is reused by the browser
+    session until it no longer matches: find_elements() then switches to the
+    strategy that does, and re_resolve() drops it and probes again.
+    """
+
+    def __init__(self):
+        self._winners = {}
+        self._stats = {}
+
+    def validate(self, driver, *locator_classes):
+        """
+        Pre-validate every Locator of the given classes with one round-trip
+        Call after a page load to warm the cache for that page
+
+        Returns:
+            dict: locator name -> winning (By, value), for locators that matched
+        """
+        locators = [
+            value for cls in locator_classes for value in vars(cls).values()
+            if isinstance(value, Locator) and len(value.strategies) > 1
+        ]
+        self._probe(driver, locators)
+        return {
+            loc.name: self._winners[(driver.session_id, loc.name)]
+            for loc in locators if (driver.session_id, loc.name) in self._winners
+        }
+
+    def resolve(self, driver, locator):
+        """
+        Return the (By, value) strategy to use for a locator
+
+        Falls back to the preferred strategy (without caching) when no
+        strategy matches yet, e.g. before the element has rendered.
+        """
+        if not isinstance(locator, Locator) or len(locator.strategies) == 1:
+            return tuple(locator)
+        key = (driver.session_id, locator.name)
+        if key not in self._winners:
+            self._probe(driver, [locator])
+        return self._winners.get(key, locator.strategies[0])
+
+    def cached_strategy(self, driver, locator):
+        """Strategy already known to match in this browser session (no browser call), or None"""
+        if not isinstance(locator, Locator) or len(locator.strategies) == 1:
+            return tuple(locator)
+        return self._winners.get((driver.session_id, locator.name))
+
+    def re_resolve(self, driver, locator):
+        """resolve() without the cached winner, e.g. after it stopped matching the page"""
+        if isinstance(locator, Locator):
+            self._winners.pop((driver.session_id, locator.name), None)
+        return self.resolve(driver, locator)
+
+    def find_elements(self, driver, locator):
+        """
+        find_elements with the resolved strategy, recording lookup time
+
+        For locators with fallbacks one script call tries the cached winner
+        first and then the other strategies, so a winner that no longer
+        matches the page is replaced in the same round-trip. The script
+        does not apply the implicit wait.
+        """
+        start = time.perf_counter()
+        if not isinstance(locator, Locator) or len(locator.strategies) == 1:
+            elements = driver.find_elements(*locator)
+        else:
+            elements = self._find_first_match(driver, locator)
+        self._record(locator, time.perf_counter() - start)
+        return elements
+
+    def invalidate(self, driver=None):
+        """Forget cached winners for one browser session (or all sessions)"""
+        if driver is None:
+            self._winners.clear()
+            return
+        for key in [k for k in self._winners if k[0] == driver.session_id]:
+            del self._winners[key]
+
+    def lookup_timings(self):
+        """
+        Returns:
+            dict: locator name -> {"lookups", "seconds", "strategy"}
+        """
+        return {name: dict(stats) for name, stats in self._stats.items()}
+
+    def _probe(self, driver, locators):
+        if not locators:
+            return
+        start = time.perf_counter()
+        winners = driver.execute_script(
+            PROBE_STRATEGIES_JS, [[to_probe(s) for s in loc.strategies] for loc in locators]
+        )
+        elapsed = time.perf_counter() - start
+        for locator, index in zip(locators, winners):
+            self._record(locator, elapsed / len(locators))
+            if index is None or index < 0:
+                continue
+            self._remember(driver, locator, index)
+
+    def _find_first_match(self, driver, locator):
+        cached = self._winners.get((driver.session_id, locator.name))
+        # Cached winner first, then the others in order of preference
+        order = sorted(range(len(locator.strategies)), key=lambda i: locator.strategies[i] != cached)
+        index, elements = driver.execute_script(
+            FIND_FIRST_MATCH_JS, [[i, *to_probe(locator.strategies[i])] for i in order]
+        )
+        # Nothing matching says nothing about the cached winner (the element may just be absent)
+        if index >= 0 and locator.strategies[index] != cached:
+            if cached is not None:
+                logger.info(f"⚠ {locator.name}: cached strategy no longer matches, switching")
+            self._remember(driver, locator, index)
+        return elements
+
+    def _remember(self, driver, locator, index):
+        strategy = locator.strategies[index]
+        self._winners[(driver.session_id, locator.name)] = strategy
+        self._stats.setdefault(locator.name, {"lookups": 0, "seconds": 0.0, "strategy": None})["strategy"] = index
+        if index > 0:
+            logger.info(f"⚠ {locator.name}: fallback strategy {index} matched ({strategy[1][:50]})")
+
+    def _record(self, locator, seconds):
+        name = getattr(locator, "name", None) or str(tuple(locator))
+        stats = self._stats.setdefault(name, {"lookups": 0, "seconds": 0.0, "strategy": None})
+        stats["lookups"] += 1
+        stats["seconds"] += seconds
+
+
+registry = LocatorRegistry()
+
+
+@functools.lru_cache(maxsize=None)
+def listbox_option(option_text, partial=False):
+    """
+    Compiled locator for an option in the open dropdown/autocomplete listbox
+    Cached so repeated selections reuse the same Locator object
+    """
+    match = f"contains(text(),'{option_text}')" if partial else f"text()='{option_text}'"
+    return Locator(
+        (By.XPATH, f"//div[@role='listbox']//span[{match}]"),
+        name=f"listbox_option[{option_text}]",
+    )
+
+
+LISTBOX = Locator((By.CSS_SELECTOR, "div[role='listbox']"), (By.XPATH, "//div[@role='listbox']"), name="LISTBOX")
+
+
+@functools.lru_cache(maxsize=None)
+def admin_tab(tab_text):
+    """Compiled locator for an Admin top bar tab (a link, or the toggle of a tab with a menu)"""
+    return Locator(
+        (By.XPATH, f"//nav[@aria-label='Topbar Menu']//*[contains(@class,'oxd-topbar-body-nav-tab-item')][contains(normalize-space(.),'{tab_text}')]"),
+        (By.XPATH, f"//span[contains(text(), '{tab_text}')]"),
+        (By.LINK_TEXT, tab_text),
+        name=f"admin_tab[{tab_text}]",
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def admin_tab_link(link_text):
+    """Compiled locator for a link in an open Admin top bar menu"""
+    return Locator((By.LINK_TEXT, link_text), name=f"admin_tab_link[{link_text}]")
+
+
+class LoginLocators(metaclass=TrackedAttributes):
+    """Login page locators"""
+    USERNAME_INPUT = Locator((By.CSS_SELECTOR, "input[name='username']"), (By.NAME, 'username'))
+    PASSWORD_INPUT = Locator((By.CSS_SELECTOR, "input[name='password']"), (By.NAME, 'password'))
+    LOGIN_BUTTON = Locator((By.CSS_SELECTOR, "button[type='submit']"), (By.XPATH, '//button[@type="submit"]'))
+    DASHBOARD_HEADER = Locator((By.CSS_SELECTOR, "h6.oxd-topbar-header-breadcrumb-module"), (By.TAG_NAME, "h6"))
+    ERROR_MESSAGE = Locator(
+        (By.CSS_SELECTOR, "p.oxd-alert-content-text"),
+        (By.XPATH, "/html/body/div/div[1]/div/div[1]/div/div[2]/div[2]/div/div[1]/div[1]/p"),
+    )
+
+
+class AdminLocators(metaclass=TrackedAttributes):
+    """Admin page locators"""
+    ADMIN_MENU = Locator((By.CSS_SELECTOR, "a[href*='/admin/viewAdminModule']"), (By.XPATH, "//span[text()='Admin']"))
+    TABLE = Locator((By.CSS_SELECTOR, "div.oxd-table"), (By.CLASS_NAME, "oxd-table"))
+    FORM = Locator((By.CSS_SELECTOR, "form.oxd-form"), (By.CLASS_NAME, "oxd-form"))
+    TABLE_BODY = Locator((By.CSS_SELECTOR, "div.oxd-table-body"), (By.CLASS_NAME, "oxd-table-body"))
+    TABLE_ROWS = Locator(
+        (By.CSS_SELECTOR, "div.oxd-table-body div[role='row']"),
+        (By.XPATH, "//div[@class='oxd-table-body']//div[@role='row']"),
+    )
+    TABLE_LOADER = Locator((By.CSS_SELECTOR, "div.oxd-table-loader"))
+
+    # Search form
+    USERNAME_INPUT = Locator(
+        (By.CSS_SELECTOR, "form.oxd-form .oxd-grid-item:nth-child(1) input.oxd-input"),
+        (By.XPATH, "(//label[text()='Username']/parent::div/following-sibling::div/input)[1]"),
+    )
+    USER_ROLE_DROPDOWN = Locator(
+        (By.CSS_SELECTOR, "form.oxd-form .oxd-grid-item:nth-child(2) div.oxd-select-text-input"),
+        (By.XPATH, "(//label[text()='User Role']/parent::div/following-sibling::div//div[@class='oxd-select-text-input'])[1]"),
+    )
+    EMPLOYEE_NAME_INPUT = Locator(
+        (By.CSS_SELECTOR, "input[placeholder='Type for hints...']"),
+        (By.XPATH, "//input[@placeholder='Type for hints...']"),
+    )
+    STATUS_DROPDOWN = Locator(
+        (By.CSS_SELECTOR, "form.oxd-form .oxd-grid-item:nth-child(4) div.oxd-select-text-input"),
+        (By.XPATH, "(//label[text()='Status']/parent::div/following-sibling::div//div[@class='oxd-select-text-input'])[1]"),
+    )
+
+    # Buttons
+    SEARCH_BUTTON = Locator((By.CSS_SELECTOR, "button[type='submit']"), (By.XPATH, "//button[@type='submit']"))
+    RESET_BUTTON = Locator(
+        (By.CSS_SELECTOR, "form.oxd-form button.oxd-button--ghost"),
+        (By.XPATH, "//button[normalize-space()='Reset']"),
+    )
+    ADD_BUTTON = Locator(
+        (By.CSS_SELECTOR, "div.orangehrm-header-container button"),
+        (By.XPATH, "//button[normalize-space()='Add']"),
+    )
+
+    # Table cells (find_element returns the first row)
+    FIRST_ROW_USERNAME = Locator(
+        (By.CSS_SELECTOR, "div.oxd-table-body div[role='row'] > div[role='cell']:nth-child(2)"),
+        (By.XPATH, "//div[@class='oxd-table-body']//div[@role='row'][1]//div[@role='cell'][2]"),
+    )
+    FIRST_ROW_ROLE = Locator(
+        (By.CSS_SELECTOR, "div.oxd-table-body div[role='row'] > div[role='cell']:nth-child(3)"),
+        (By.XPATH, "//div[@class='oxd-table-body']//div[@role='row'][1]//div[@role='cell'][3]"),
+    )
+    FIRST_ROW_EMPLOYEE = Locator(
+        (By.CSS_SELECTOR, "div.oxd-table-body div[role='row'] > div[role='cell']:nth-child(4)"),
+        (By.XPATH, "//div[@class='oxd-table-body']//div[@role='row'][1]//div[@role='cell'][4]"),
+    )
+    FIRST_ROW_STATUS = Locator(
+        (By.CSS_SELECTOR, "div.oxd-table-body div[role='row'] > div[role='cell']:nth-child(5)"),
+        (By.XPATH, "//div[@class='oxd-table-body']//div[@role='row'][1]//div[@role='cell'][5]"),
+    )
+
+    # Delete functionality
+    FIRST_ROW_CHECKBOX = Locator(
+        (By.CSS_SELECTOR, "div.oxd-table-body div[role='row'] > div[role='cell']:nth-child(1) i"),
+        (By.XPATH, "//div[@class='oxd-table-body']//div[@role='row'][1]//div[@role='cell'][1]//i"),
+    )
+    FIRST_ROW_DELETE_BUTTON = Locator(
+        (By.CSS_SELECTOR, "div.oxd-table-body div[role='row'] button:has(> i.bi-trash)"),
+        (By.XPATH, "//div[@class='oxd-table-body']//div[@role='row'][1]//button[.//i[contains(@class, 'bi-trash')]]"),
+    )
+    ERROR_TOAST = Locator((By.CSS_SELECTOR, "div.oxd-toast--error"), (By.XPATH, "//div[contains(@class, 'oxd-toast--error')]"))
+    # Confirmation dialog of a delete (any modal over the page)
+    OPEN_DIALOG = Locator((By.CSS_SELECTOR, "div.oxd-dialog-container-default"))
+
+    # Edit functionality
+    FIRST_ROW_EDIT_BUTTON = Locator(
+        (By.CSS_SELECTOR, "div.oxd-table-body div[role='row'] button:has(> i.bi-pencil-fill)"),
+        (By.XPATH, "//div[@class='oxd-table-body']//div[@role='row'][1]//button[.//i[contains(@class, 'bi-pencil-fill')]]"),
+    )
+
+
+class UserFormLocators(metaclass=TrackedAttributes):
+    """Admin > User Management > Add / Edit User form locators"""
+    USER_ROLE_DROPDOWN = Locator(
+        (By.CSS_SELECTOR, "form.oxd-form .oxd-grid-item:nth-child(1) div.oxd-select-text-input"),
+        (By.XPATH, "//label[text()='User Role']/parent::div/following-sibling::div//div[@class='oxd-select-text-input']"),
+    )
+    EMPLOYEE_NAME_INPUT = Locator(
+        (By.CSS_SELECTOR, "input[placeholder='Type for hints...']"),
+        (By.XPATH, "//input[@placeholder='Type for hints...']"),
+    )
+    STATUS_DROPDOWN = Locator(
+        (By.CSS_SELECTOR, "form.oxd-form .oxd-grid-item:nth-child(3) div.oxd-select-text-input"),
+        (By.XPATH, "//label[text()='Status']/parent::div/following-sibling::div//div[@class='oxd-select-text-input']"),
+    )
+    USERNAME_INPUT = Locator(
+        (By.CSS_SELECTOR, "form.oxd-form .oxd-grid-item:nth-child(4) input.oxd-input"),
+        (By.XPATH, "//label[text()='Username']/parent::div/following-sibling::div/input"),
+    )
+    PASSWORD_INPUT = Locator(
+        (By.CSS_SELECTOR, "form.oxd-form .user-password-row .oxd-grid-item:nth-child(1) input[type='password']"),
+        (By.XPATH, "//label[text()='Password']/parent::div/following-sibling::div/input"),
+    )
+    CONFIRM_PASSWORD_INPUT = Locator(
+        (By.CSS_SELECTOR, "form.oxd-form .user-password-row .oxd-grid-item:nth-child(2) input[type='password']"),
+        (By.XPATH, "//label[text()='Confirm Password']/parent::div/following-sibling::div/input"),
+    )
+    SAVE_BUTTON = Locator((By.CSS_SELECTOR, "form.oxd-form button[type='submit']"), (By.XPATH, "//button[normalize-space()='Save']"))
+
+
+class NavigationLocators(metaclass=TrackedAttributes):
+    """Navigation element locators"""
+    UPGRADE_BUTTON = Locator((By.CSS_SELECTOR, "button.orangehrm-upgrade-button"), (By.XPATH, "//button[contains(., 'Upgrade')]"))
+    PROFILE_DROPDOWN = Locator((By.CSS_SELECTOR, "p.oxd-userdropdown-name"))
+    ABOUT_LINK = Locator((By.XPATH, "//a[contains(., 'About')]"))
+    SUPPORT_LINK = Locator((By.CSS_SELECTOR, "a[href*='/help/support']"), (By.XPATH, "//a[contains(., 'Support')]"))
+    ABOUT_DIALOG = Locator((By.CSS_SELECTOR, "div.oxd-dialog-container-default"))
+    COMPANY_NAME_LABEL = Locator((By.XPATH, ".//p[contains(., 'Company Name')]"))
+    SIDEBAR_SEARCH = Locator((By.CSS_SELECTOR, "input[placeholder='Search']"), (By.XPATH, "//input[@placeholder='Search']"))
+    SIDEBAR_MENU_ITEMS = Locator((By.CSS_SELECTOR, "ul.oxd-main-menu li"))
+    DASHBOARD_LINK = Locator(
+        (By.CSS_SELECTOR, "ul.oxd-main-menu a[href='/web/index.php/dashboard/index']"),
+        (By.XPATH, "//a[@href='/web/index.php/dashboard/index']"),
+    )
@@ -0,0 +1,273 @@
+"""
+Network control for the browser tests over the Chrome DevTools Protocol
+Blocks analytics, web fonts and marketing assets with Network.setBlockedURLs,
+answers requests for external pages (upgrade page, help center) with canned
+responses through the Fetch domain and counts requests and transferred bytes
+per test, so the suite spends no time on traffic its assertions never look at
+"""
+from collections import namedtuple
+from fnmatch import fnmatchcase
+from urllib.parse import urlsplit
+import base64
+import itertools
+import json
+import logging
+import threading
+import urllib.request
+
+import trio
+from trio_websocket import ConnectionClosed, open_websocket_url
+
+from utils.browser_profiles import FONT_URL_PATTERNS
+
+logger = logging.getLogger(__name__)
+
+# Requests no assertion depends on (* wildcards, as in Network.setBlockedURLs)
+BLOCKED_URL_PATTERNS = FONT_URL_PATTERNS + [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*hotjar.com*",
+    "*facebook.net*",
+    "*linkedin.com/px*",
+]
+
+CannedResponse = namedtuple("CannedResponse", ["status", "body", "content_type"], defaults=(200, "", "text/html"))
+
+
+def canned_page(title):
+    """Minimal HTML page standing in for an external site"""
+    return CannedResponse(body=f"<!DOCTYPE html><html><head><title>{title}</title></head><body><h1>{title}</h1></body></html>")
+
+
+# External pages opened by the navigation tests, which only check the URL
+STUBBED_URLS = {
+    "*orangehrm.com/open-source/upgrade-to-advanced*": canned_page("Upgrade to OrangeHRM Advanced (stub)"),
+    "*starterhelp.orangehrm.com/*": canned_page("OrangeHRM Help Center (stub)"),
+}
+
+# Seconds to wait for the DevTools endpoint and for the listener to attach
+CONNECT_TIMEOUT = 5
+
+# Hosts listed per test in the report, by bytes
+TOP_HOSTS = 5
+
+
+class NetworkControl:
+    """
+    Per-test network control for one browser
+
+    URL blocking goes through the driver's own CDP session, so it works
+    wherever execute_cdp_cmd does. Canned responses and the request/byte
+    counts need the browser's DevTools WebSocket; a background thread keeps
+    that connection and attaches to the test's tab and to every tab opened
+    while the test runs (a new tab's very first request can still go out
+    before interception is on). Without the WebSocket the test runs with
+    blocking only and the report says so (connected: false).
+    """
+
+    def __init__(self, driver, blocked=BLOCKED_URL_PATTERNS, stubs=None, restore_blocked=()):
+        """
+        Args:
+            blocked: URL patterns to block
+            stubs: Dict URL pattern -> CannedResponse (default STUBBED_URLS)
+            restore_blocked: Blocked patterns to put back on uninstall (the browser profile's own)
+        """
+        self.driver = driver
+        self.blocked = list(blocked)
+        self.stubs = dict(STUBBED_URLS if stubs is None else stubs)
+        self.restore_blocked = list(restore_blocked)
+        self.connected = False
+        self._counts = {"requests": 0, "bytes": 0, "blocked": 0, "stubbed": 0, "failed": 0}
+        self._hosts = {}
+        self._request_hosts = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        # Listener state, only touched from the listener thread
+        self._ws = None
+        self._nursery = None
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._results = {}
+        self._targets = set()
+
+    def install(self):
+        """Block the URL patterns and start the interception listener"""
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked})
+        except Exception as e:
+            # Non-Chromium drivers
+            logger.warning(f"⚠ CDP network control unavailable: {e}")
+            return self
+        ws_url = self._browser_ws_url()
+        if ws_url:
+            self._thread = threading.Thread(
+                target=self._run, args=(ws_url, self.driver.current_window_handle),
+                name="network-control", daemon=True,
+            )
+            self._thread.start()
+            self._ready.wait(CONNECT_TIMEOUT)
+        return self
+
+    def uninstall(self):
+        """Stop the listener (which ends its interception) and restore the profile's blocked URLs"""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join(CONNECT_TIMEOUT)
+        try:
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.restore_blocked})
+        except Exception as e:
+            logger.warning(f"⚠ Could not restore blocked URLs: {e}")
+
+    def report(self):
+        """
+        Returns:
+            dict: requests, bytes (encoded, as transferred), blocked, stubbed
+            and failed counts, plus the top hosts as [host, requests, bytes]
+        """
+        with self._lock:
+            hosts = sorted(self._hosts.items(), key=lambda h: h[1][1], reverse=True)[:TOP_HOSTS]
+            return dict(
+                self._counts,
+                connected=self.connected,
+                top_hosts=[[host, requests, size] for host, (requests, size) in hosts],
+            )
+
+    def _browser_ws_url(self):
+        """Browser-level DevTools WebSocket URL (Grid: se:cdp, local ChromeDriver: debuggerAddress)"""
+        caps = self.driver.capabilities
+        if caps.get("se:cdp"):
+            return caps["se:cdp"]
+        address = (caps.get("goog:chromeOptions") or {}).get("debuggerAddress")
+        if not address:
+            logger.info("No DevTools endpoint, network control limited to URL blocking")
+            return None
+        try:
+            with urllib.request.urlopen(f"http://{address}/json/version", timeout=CONNECT_TIMEOUT) as response:
+                return json.load(response)["webSocketDebuggerUrl"]
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"⚠ DevTools endpoint unavailable, network control limited to URL blocking: {e}")
+            return None
+
+    # ---------- listener thread ---------- #
+
+    def _run(self, ws_url, target_id):
+        try:
+            trio.run(self._serve, ws_url, target_id)
+        except Exception as e:
+            logger.warning(f"⚠ Network interception stopped: {type(e).__name__}: {e}")
+        finally:
+            self._ready.set()
+
+    async def _serve(self, ws_url, target_id):
+        async with open_websocket_url(ws_url, max_message_size=2 ** 26) as ws:
+            self._ws = ws
+            async with trio.open_nursery() as nursery:
+                self._nursery = nursery
+                nursery.start_soon(self._read)
+                await self._call("Target.setDiscoverTargets", {"discover": True})
+                await self._attach(target_id, required=True)
+                self.connected = True
+                self._ready.set()
+                while not self._stop.is_set():
+                    await trio.sleep(0.05)
+                nursery.cancel_scope.cancel()
+
+    async def _send(self, method, params=None, session_id=None, message_id=None):
+        message = {"id": message_id or next(self._ids), "method": method, "params": params or {}}
+        if session_id:
+            message["sessionId"] = session_id
+        await self._ws.send_message(json.dumps(message))
+
+    async def _call(self, method, params=None, session_id=None):
+        """Send a command and wait for its result"""
+        message_id = next(self._ids)
+        done = self._pending[message_id] = trio.Event()
+        await self._send(method, params, session_id, message_id)
+        await done.wait()
+        data = self._results.pop(message_id)
+        if "error" in data:
+            raise RuntimeError(f"{method}: {data['error'].get('message')}")
+        return data.get("result", {})
+
+    async def _read(self):
+        while True:
+            try:
+                data = json.loads(await self._ws.get_message())
+            except ConnectionClosed:
+                return
+            if "id" in data:
+                # Replies to fire-and-forget commands have no waiter
+                done = self._pending.pop(data["id"], None)
+                if done is not None:
+                    self._results[data["id"]] = data
+                    done.set()
+            elif "method" in data:
+                self._on_event(data["method"], data.get("params", {}), data.get("sessionId"))
+
+    async def _attach(self, target_id, required=False):
+        """Attach a flat session to a tab and turn on blocking, counting and stubs in it"""
+        if target_id in self._targets:
+            return
+        self._targets.add(target_id)
+        try:
+            session_id = (await self._call("Target.attachToTarget", {"targetId": target_id, "flatten": True}))["sessionId"]
+            await self._call("Network.enable", {}, session_id)
+            await self._call("Network.setBlockedURLs", {"urls": self.blocked}, session_id)
+            if self.stubs:
+                patterns = [{"urlPattern": pattern, "requestStage": "Request"} for pattern in self.stubs]
+                await self._call("Fetch.enable", {"patterns": patterns}, session_id)
+        except RuntimeError as e:
+            if required:
+                raise
+            logger.info(f"Network control not attached to new tab: {e}")
+
+    def _on_event(self, method, params, session_id):
+        if method == "Target.targetCreated":
+            info = params.get("targetInfo", {})
+            if info.get("type") == "page":
+                self._nursery.start_soon(self._attach, info["targetId"])
+        elif method == "Fetch.requestPaused":
+            self._nursery.start_soon(self._answer, params, session_id)
+        elif method == "Network.requestWillBeSent":
+            host = urlsplit(params["request"]["url"]).netloc
+            with self._lock:
+                self._counts["requests"] += 1
+                self._request_hosts[(session_id, params["requestId"])] = host
+                requests, size = self._hosts.get(host, (0, 0))
+                self._hosts[host] = (requests + 1, size)
+        elif method == "Network.loadingFinished":
+            size = int(params.get("encodedDataLength", 0))
+            with self._lock:
+                self._counts["bytes"] += size
+                host = self._request_hosts.pop((session_id, params["requestId"]), None)
+                if host is not None:
+                    requests, total = self._hosts[host]
+                    self._hosts[host] = (requests, total + size)
+        elif method == "Network.loadingFailed":
+            with self._lock:
+                self._request_hosts.pop((session_id, params["requestId"]), None)
+                if params.get("blockedReason"):
+                    self._counts["blocked"] += 1
+                elif not params.get("canceled"):
+                    self._counts["failed"] += 1
+
+    async def _answer(self, params, session_id):
+        """Fulfil a paused request from its canned response (or let it through)"""
+        url = params["request"]["url"]
+        stub = next((r for pattern, r in self.stubs.items() if fnmatchcase(url, pattern)), None)
+        if stub is None:
+            await self._send("Fetch.continueRequest", {"requestId": params["requestId"]}, session_id)
+            return
+        with self._lock:
+            self._counts["stubbed"] += 1
+        await self._send("Fetch.fulfillRequest", {
+            "requestId": params["requestId"],
+            "responseCode": stub.status,
+            "responseHeaders": [{"name": "Content-Type", "value": stub.content_type}],
+            "body": base64.b64encode(stub.body.encode("utf-8")).decode("ascii"),
+        }, session_id)
+        logger.info(f"✓ Stubbed {url}")
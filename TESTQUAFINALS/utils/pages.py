@@ -0,0 +1,357 @@
+"""
+Page objects for the OrangeHRM pages under test
+Built on the locator classes and SeleniumHelpers. A page object caches the
+element handles it has already waited for until the page navigates, and
+offers direct-URL navigation so tests that are not about a menu skip it.
+PageSession shares one loaded page between read-only tests
+"""
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    StaleElementReferenceException,
+)
+import logging
+
+from utils.config import get_base_url
+from utils.helpers import FormField, SeleniumHelpers
+from utils.locators import LISTBOX, AdminLocators, LoginLocators, NavigationLocators, admin_tab, admin_tab_link
+from utils.session import DASHBOARD_PATH, LOGIN_PATH
+from utils.step_timing import timed_step
+
+logger = logging.getLogger(__name__)
+
+SYSTEM_USERS_PATH = "/web/index.php/admin/viewSystemUsers"
+
+# Admin top bar: link text -> path, for direct navigation
+ADMIN_PAGES = {
+    "Users": SYSTEM_USERS_PATH,
+    "Job Titles": "/web/index.php/admin/viewJobTitleList",
+    "Pay Grades": "/web/index.php/admin/viewPayGrades",
+    "Employment Status": "/web/index.php/admin/employmentStatus",
+    "Job Categories": "/web/index.php/admin/jobCategory",
+    "Work Shifts": "/web/index.php/admin/workShift",
+    "General Information": "/web/index.php/admin/viewOrganizationGeneralInformation",
+    "Locations": "/web/index.php/admin/viewLocations",
+    "Structure": "/web/index.php/admin/viewCompanyStructure",
+    "Skills": "/web/index.php/admin/viewSkills",
+    "Education": "/web/index.php/admin/viewEducation",
+    "Licenses": "/web/index.php/admin/viewLicenses",
+    "Languages": "/web/index.php/admin/viewLanguages",
+    "Memberships": "/web/index.php/admin/membership",
+    "Nationalities": "/web/index.php/admin/nationality",
+    "Corporate Branding": "/web/index.php/admin/addTheme",
+    "Email Configuration": "/web/index.php/admin/listMailConfiguration",
+    "Email Subscriptions": "/web/index.php/admin/viewEmailNotification",
+    "Localization": "/web/index.php/admin/localization",
+    "Language Packages": "/web/index.php/admin/languagePackage",
+    "Modules": "/web/index.php/admin/viewModules",
+}
+
+# Text of a custom dropdown with nothing selected
+EMPTY_SELECT = "-- Select --"
+
+# Cached handles that fail with these are looked up again
+_RETRY_LOOKUP = (StaleElementReferenceException, ElementClickInterceptedException, ElementNotInteractableException)
+
+
+class BasePage:
+    """
+    Page object base class
+
+    Subclasses set `path` (for open()) and `ready_locators` (elements that
+    must be visible before the page is used). Element handles found through
+    element() are cached until invalidate() - called by every method that
+    navigates - and a stale handle is transparently looked up again.
+    """
+    path = None
+    ready_locators = ()
+
+    def __init__(self, driver, base_url=None):
+        self.driver = driver
+        self.base_url = base_url or get_base_url()
+        self._elements = {}
+
+    @property
+    def page_driver(self):
+        """Driver used by @timed_step when a page method is the recorded step"""
+        return self.driver
+
+    def open(self):
+        """Load the page by URL and wait until it is ready"""
+        self.driver.get(self.base_url + self.path)
+        return self.wait_until_ready()
+
+    def wait_until_ready(self):
+        """Drop cached handles, then wait for (and cache) the ready locators"""
+        self.invalidate()
+        for locator in self.ready_locators:
+            self.element(locator)
+        return self
+
+    def invalidate(self):
+        """Forget cached element handles (the DOM they belong to is gone)"""
+        self._elements.clear()
+
+    def is_intact(self):
+        """Still on this page (no navigation) with every ready locator present"""
+        return self.path in self.driver.current_url and all(
+            SeleniumHelpers.find_elements_now(self.driver, locator) for locator in self.ready_locators
+        )
+
+    def reset_state(self):
+        """Bring the page back to its just-loaded state; by default by loading it again"""
+        return self.open()
+
+    def is_clean(self):
+        """True when reset_state() left nothing of the previous test behind"""
+        return True
+
+    def element(self, locator, timeout=10):
+        """Visible element for a locator, from the cache when already found on this page"""
+        element = self._elements.get(locator.name)
+        if element is None:
+            element = SeleniumHelpers.wait_for_element_visible(self.driver, locator, timeout)
+            self._elements[locator.name] = element
+        return element
+
+    @timed_step
+    def click(self, locator, timeout=10):
+        """Click through the cached handle; falls back to safe_click when it is stale or covered"""
+        try:
+            self.element(locator, timeout).click()
+            return True
+        except _RETRY_LOOKUP:
+            self._elements.pop(locator.name, None)
+        return SeleniumHelpers.safe_click(self.driver, locator, timeout)
+
+    @timed_step
+    def type(self, locator, text, timeout=10, clear_first=True):
+        """send_keys through the cached handle; falls back to safe_send_keys when it is stale"""
+        try:
+            element = self.element(locator, timeout)
+            if clear_first:
+                element.clear()
+            element.send_keys(text)
+            return
+        except _RETRY_LOOKUP:
+            self._elements.pop(locator.name, None)
+        SeleniumHelpers.safe_send_keys(self.driver, locator, text, timeout, clear_first)
+
+
+class LoginPage(BasePage):
+    """Login form"""
+    path = LOGIN_PATH
+    ready_locators = (LoginLocators.USERNAME_INPUT,)
+
+    def login(self, username, password):
+        """Submit the form; empty values leave the field untouched (for the Required checks)"""
+        if username:
+            self.type(LoginLocators.USERNAME_INPUT, username)
+        if password:
+            self.type(LoginLocators.PASSWORD_INPUT, password)
+        self.click(LoginLocators.LOGIN_BUTTON)
+        self.invalidate()
+        return self
+
+    def error_text(self, timeout=10):
+        return SeleniumHelpers.get_element_text(self.driver, LoginLocators.ERROR_MESSAGE, timeout)
+
+    def dashboard_header(self, timeout=10):
+        return SeleniumHelpers.get_element_text(self.driver, LoginLocators.DASHBOARD_HEADER, timeout)
+
+
+class AdminUsersPage(BasePage):
+    """Admin > User Management > Users: search form and result table"""
+    path = SYSTEM_USERS_PATH
+    ready_locators = (AdminLocators.TABLE, AdminLocators.FORM)
+
+    def open_via_menu(self):
+        """Reach the page through the sidebar Admin menu (for tests about the menu)"""
+        SeleniumHelpers.safe_click(self.driver, AdminLocators.ADMIN_MENU)
+        return self.wait_until_ready()
+
+    @staticmethod
+    def search_fields():
+        """Controls of the search form (read per call so impact tracking sees each locator)"""
+        return {
+            "username": FormField(AdminLocators.USERNAME_INPUT, "text"),
+            "role": FormField(AdminLocators.USER_ROLE_DROPDOWN, "select"),
+            "employee": FormField(AdminLocators.EMPLOYEE_NAME_INPUT, "autocomplete"),
+            "status": FormField(AdminLocators.STATUS_DROPDOWN, "select"),
+        }
+
+    def search(self, username=None, role=None, status=None, employee=None, wait="rows", fill_mode=None):
+        """
+        Fill the given filters and click Search
+
+        Args:
+            employee: (search text, option text) for the autocomplete
+            wait: "rows" waits for at least one row, "loaded" for the reload to
+                finish (also with no results), None does not wait; both waits
+                start only once the click changed the table
+            fill_mode: "batched" or "ui" (default FormFillPolicy.mode, --form-fill)
+        """
+        SeleniumHelpers.fill_form(
+            self.driver,
+            self.search_fields(),
+            {"username": username, "role": role, "employee": employee, "status": status},
+            mode=fill_mode,
+        )
+        watched = self._watch_table(wait)
+        self.click(AdminLocators.SEARCH_BUTTON)
+        self._wait_for_table(wait, watched)
+        return self
+
+    def reset(self, wait="rows", previous_count=None):
+        """Click Reset; with previous_count, wait until the row count differs from it"""
+        if previous_count is not None:
+            self.click(AdminLocators.RESET_BUTTON)
+            SeleniumHelpers.wait_for_row_count_change(self.driver, previous_count)
+            return self
+        watched = self._watch_table(wait)
+        self.click(AdminLocators.RESET_BUTTON)
+        self._wait_for_table(wait, watched)
+        return self
+
+    def rows(self):
+        """Every row of the result table (UserRow records, one script call)"""
+        return SeleniumHelpers.read_table(self.driver)
+
+    def row_count(self):
+        return len(SeleniumHelpers.find_elements_now(self.driver, AdminLocators.TABLE_ROWS))
+
+    def username_filter(self):
+        return self.element(AdminLocators.USERNAME_INPUT).get_attribute("value")
+
+    def role_filter(self):
+        return self.element(AdminLocators.USER_ROLE_DROPDOWN).text
+
+    def status_filter(self):
+        return self.element(AdminLocators.STATUS_DROPDOWN).text
+
+    def is_intact(self):
+        """Also no dialog or dropdown list left open over the page"""
+        return (
+            super().is_intact()
+            and not SeleniumHelpers.find_elements_now(self.driver, AdminLocators.OPEN_DIALOG)
+            and not SeleniumHelpers.find_elements_now(self.driver, LISTBOX)
+        )
+
+    def reset_state(self):
+        """Clear the search form with Reset instead of reloading the page"""
+        return self.reset(wait="loaded")
+
+    def is_clean(self):
+        return not self.username_filter() and self.role_filter() == EMPTY_SELECT and self.status_filter() == EMPTY_SELECT
+
+    def open_add_user(self):
+        """Click Add and wait for the Add User form"""
+        self.click(AdminLocators.ADD_BUTTON)
+        SeleniumHelpers.wait_for_url_contains(self.driver, "/admin/saveSystemUser")
+        self.invalidate()
+
+    def edit_first_row(self):
+        """Open the first result in edit mode"""
+        SeleniumHelpers.safe_click(self.driver, AdminLocators.FIRST_ROW_EDIT_BUTTON)
+        SeleniumHelpers.wait_for_url_contains(self.driver, "/admin/saveSystemUser/")
+        self.invalidate()
+
+    def _watch_table(self, wait):
+        return wait is not None and SeleniumHelpers.watch_table(self.driver)
+
+    def _wait_for_table(self, wait, watched=False):
+        if wait == "rows":
+            SeleniumHelpers.wait_for_table_to_update(self.driver, watched=watched)
+        elif wait == "loaded":
+            SeleniumHelpers.wait_for_table_loaded(self.driver, watched=watched)
+
+
+class AdminTabs(BasePage):
+    """Admin module top bar (User Management, Job, Organization, ...)"""
+    ready_locators = (AdminLocators.TABLE,)
+    path = SYSTEM_USERS_PATH
+
+    def goto(self, link_text):
+        """Open an Admin page by URL instead of through the top bar; returns the new URL"""
+        self.driver.get(self.base_url + ADMIN_PAGES[link_text])
+        self.invalidate()
+        return self.driver.current_url
+
+    def open_tab(self, tab_text, expected_path):
+        """Click a plain top bar tab and wait for its page; returns the new URL"""
+        SeleniumHelpers.safe_click(self.driver, admin_tab(tab_text))
+        return self._arrived(expected_path)
+
+    def open_menu_item(self, tab_text, link_text, expected_path):
+        """Expand a top bar menu, click one of its links and wait for its page; returns the new URL"""
+        SeleniumHelpers.safe_click(self.driver, admin_tab(tab_text))
+        SeleniumHelpers.safe_click(self.driver, admin_tab_link(link_text))
+        return self._arrived(expected_path)
+
+    def _arrived(self, expected_path):
+        url = SeleniumHelpers.wait_for_url_contains(self.driver, expected_path)
+        self.invalidate()
+        return url
+
+
+class TopNav(BasePage):
+    """Header (upgrade button, user menu) and sidebar shared by every page after login"""
+    ready_locators = (LoginLocators.DASHBOARD_HEADER,)
+    path = DASHBOARD_PATH
+
+    def open_user_menu_item(self, item_locator):
+        """Open the user dropdown and click one of its entries"""
+        self.click(NavigationLocators.PROFILE_DROPDOWN)
+        SeleniumHelpers.safe_click(self.driver, item_locator)
+
+    def about_dialog(self):
+        """Open About from the user menu and return the dialog element"""
+        self.open_user_menu_item(NavigationLocators.ABOUT_LINK)
+        return SeleniumHelpers.wait_for_element_visible(self.driver, NavigationLocators.ABOUT_DIALOG)
+
+    def open_support(self):
+        """Open Support from the user menu; returns the new URL"""
+        self.open_user_menu_item(NavigationLocators.SUPPORT_LINK)
+        url = SeleniumHelpers.wait_for_url_contains(self.driver, "/web/index.php/help/support")
+        self.invalidate()
+        return url
+
+    def search_sidebar(self, text):
+        """Type into the sidebar search box"""
+        self.type(NavigationLocators.SIDEBAR_SEARCH, text, clear_first=False)
+
+    def goto_dashboard(self):
+        """Click the sidebar Dashboard link and return the header text"""
+        SeleniumHelpers.safe_click(self.driver, NavigationLocators.DASHBOARD_LINK)
+        self.invalidate()
+        return SeleniumHelpers.get_element_text(self.driver, LoginLocators.DASHBOARD_HEADER)
+
+
+class PageSession:
+    """
+    One loaded page shared by read-only tests that run back to back
+
+    begin() hands the page to the next test. The first test gets it as
+    loaded; later ones get it after reset_state() when it passes the
+    integrity check (is_intact() before, is_clean() after the reset), and
+    reloaded by URL when it does not.
+    """
+
+    def __init__(self, page):
+        self.page = page
+        self.reuses = 0
+        self.reloads = 0
+        self._fresh = True
+
+    def begin(self):
+        if self._fresh:
+            self._fresh = False
+            return self.page
+        if self.page.is_intact():
+            self.page.reset_state()
+            if self.page.is_clean():
+                self.reuses += 1
+                return self.page
+        logger.info(f"Shared {type(self.page).__name__} failed its integrity check, reloading")
+        self.reloads += 1
+        return self.page.open()
@@ -0,0 +1,279 @@
+"""
+Run-to-run performance history for the suite
+Benchmark runs (pytest --benchmark) store per-test and per-step durations in
+a SQLite file under reports/, compare each test to a rolling baseline of its
+previous passing runs and flag regressions beyond the budget
+
+CLI:
+    python -m utils.perf_history runs
+    python -m utils.perf_history compare [RUN_A] [RUN_B] --top 10 [--steps]
+"""
+from datetime import datetime
+from statistics import median
+import argparse
+import os
+import sqlite3
+import subprocess
+
+DEFAULT_DB = "reports/perf_history.sqlite"
+DEFAULT_WINDOW = 5
+DEFAULT_BUDGET_PCT = 25.0
+# Regressions smaller than this (seconds) are treated as noise
+DEFAULT_MIN_DELTA = 0.5
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started TEXT NOT NULL,
+    git_sha TEXT,
+    target TEXT,
+    browser_profile TEXT,
+    workers INTEGER
+);
+CREATE TABLE IF NOT EXISTS test_results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    nodeid TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    setup_s REAL,
+    call_s REAL,
+    teardown_s REAL,
+    PRIMARY KEY (run_id, nodeid)
+);
+CREATE TABLE IF NOT EXISTS step_results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    nodeid TEXT NOT NULL,
+    helper TEXT NOT NULL,
+    locator TEXT,
+    calls INTEGER NOT NULL,
+    wall_s REAL NOT NULL,
+    wait_s REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_test_results_nodeid ON test_results (nodeid, run_id);
+"""
+
+
+def current_git_sha():
+    """Short commit hash of the working tree, or None outside a git checkout"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5, check=True
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+class Regression:
+    """A test whose call duration exceeded its baseline by more than the budget"""
+
+    def __init__(self, nodeid, duration, baseline, budget_pct, samples):
+        self.nodeid = nodeid
+        self.duration = duration
+        self.baseline = baseline
+        self.budget_pct = budget_pct
+        self.samples = samples
+
+    @property
+    def pct(self):
+        return (self.duration / self.baseline - 1) * 100 if self.baseline else float("inf")
+
+    def __str__(self):
+        return (
+            f"{self.nodeid}: {self.duration:.2f}s vs baseline {self.baseline:.2f}s "
+            f"(+{self.pct:.0f}%, budget {self.budget_pct:.0f}%, {self.samples} runs)"
+        )
+
+
+class HistoryStore:
+    """SQLite store of benchmark runs"""
+
+    def __init__(self, path=DEFAULT_DB):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def record_run(self, tests, steps=None, target=None, browser_profile=None, workers=0):
+        """
+        Store one run
+
+        Args:
+            tests: dict nodeid -> {"outcome", "setup_s", "call_s", "teardown_s"}
+            steps: dict nodeid -> list of step dicts from utils.step_timing
+                (only top-level steps are stored, aggregated per helper and locator)
+
+        Returns:
+            int: The new run id
+        """
+        with self.conn:
+            run_id = self.conn.execute(
+                "INSERT INTO runs (started, git_sha, target, browser_profile, workers) VALUES (?, ?, ?, ?, ?)",
+                (datetime.now().isoformat(timespec="seconds"), current_git_sha(), target, browser_profile, workers),
+            ).lastrowid
+            self.conn.executemany(
+                "INSERT INTO test_results (run_id, nodeid, outcome, setup_s, call_s, teardown_s) VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (run_id, nodeid, t["outcome"], t.get("setup_s"), t.get("call_s"), t.get("teardown_s"))
+                    for nodeid, t in tests.items()
+                ],
+            )
+            self.conn.executemany(
+                "INSERT INTO step_results (run_id, nodeid, helper, locator, calls, wall_s, wait_s) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (run_id, nodeid, helper, locator, totals[0], totals[1], totals[2])
+                    for nodeid, step_list in (steps or {}).items()
+                    for (helper, locator), totals in _aggregate_steps(step_list).items()
+                ],
+            )
+        return run_id
+
+    def runs(self, limit=20):
+        return self.conn.execute(
+            "SELECT r.*, COUNT(t.nodeid) AS tests, SUM(t.call_s) AS call_s FROM runs r "
+            "LEFT JOIN test_results t ON t.run_id = r.id GROUP BY r.id ORDER BY r.id DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+
+    def latest_run_ids(self, count=2):
+        rows = self.conn.execute("SELECT id FROM runs ORDER BY id DESC LIMIT ?", (count,)).fetchall()
+        return [row["id"] for row in reversed(rows)]
+
+    def baseline(self, nodeid, target=None, browser_profile=None, window=DEFAULT_WINDOW, before_run=None):
+        """
+        Median call duration of the last `window` passing runs of a test
+        on the same target and browser profile
+
+        Returns:
+            tuple: (median seconds or None, number of samples)
+        """
+        rows = self.conn.execute(
+            "SELECT t.call_s FROM test_results t JOIN runs r ON r.id = t.run_id "
+            "WHERE t.nodeid = ? AND t.outcome = 'passed' AND t.call_s IS NOT NULL "
+            "AND r.target IS ? AND r.browser_profile IS ? AND (? IS NULL OR r.id < ?) "
+            "ORDER BY r.id DESC LIMIT ?",
+            (nodeid, target, browser_profile, before_run, before_run, window),
+        ).fetchall()
+        samples = [row["call_s"] for row in rows]
+        return (median(samples) if samples else None), len(samples)
+
+    def check_budgets(self, run_id, budget_pct=DEFAULT_BUDGET_PCT, min_delta=DEFAULT_MIN_DELTA,
+                      window=DEFAULT_WINDOW, test_budgets=None):
+        """
+        Compare every passing test of a run against its rolling baseline
+
+        Args:
+            test_budgets: dict nodeid -> budget percent overriding budget_pct
+
+        Returns:
+            list: Regression objects, worst first
+        """
+        run = self.conn.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
+        regressions = []
+        for row in self.conn.execute(
+            "SELECT nodeid, call_s FROM test_results WHERE run_id = ? AND outcome = 'passed'", (run_id,)
+        ).fetchall():
+            baseline, samples = self.baseline(
+                row["nodeid"], run["target"], run["browser_profile"], window, before_run=run_id
+            )
+            if baseline is None:
+                continue
+            pct = (test_budgets or {}).get(row["nodeid"], budget_pct)
+            duration = row["call_s"]
+            if duration > baseline * (1 + pct / 100) and duration - baseline >= min_delta:
+                regressions.append(Regression(row["nodeid"], duration, baseline, pct, samples))
+        return sorted(regressions, key=lambda r: r.duration - r.baseline, reverse=True)
+
+    def compare(self, run_a, run_b, steps=False):
+        """
+        Duration deltas between two runs for tests (or steps) present in both
+
+        Returns:
+            list: (name, seconds in A, seconds in B) tuples, largest increase first
+        """
+        if steps:
+            query = (
+                "SELECT nodeid || ' :: ' || helper || COALESCE(' [' || locator || ']', '') AS name, "
+                "SUM(wall_s) AS seconds FROM step_results WHERE run_id = ? GROUP BY name"
+            )
+        else:
+            query = "SELECT nodeid AS name, call_s AS seconds FROM test_results WHERE run_id = ? AND call_s IS NOT NULL"
+        a = {row["name"]: row["seconds"] for row in self.conn.execute(query, (run_a,))}
+        b = {row["name"]: row["seconds"] for row in self.conn.execute(query, (run_b,))}
+        rows = [(name, a[name], b[name]) for name in a.keys() & b.keys()]
+        return sorted(rows, key=lambda r: r[2] - r[1], reverse=True)
+
+
+def _aggregate_steps(steps):
+    """Top-level steps summed per (helper, locator): [calls, wall_s, wait_s]"""
+    totals = {}
+    for step in steps:
+        if step["depth"] != 0:
+            continue
+        entry = totals.setdefault((step["helper"], step["locator"]), [0, 0.0, 0.0])
+        entry[0] += 1
+        entry[1] += step["wall_s"]
+        entry[2] += step["wait_s"]
+    return totals
+
+
+def _print_runs(store, limit):
+    print(f"{'run':>5}  {'started':19}  {'git':8}  {'target':6}  {'profile':9}  {'tests':>5}  {'call s':>8}")
+    for run in store.runs(limit):
+        print(
+            f"{run['id']:>5}  {run['started']:19}  {run['git_sha'] or '-':8}  {run['target'] or '-':6}  "
+            f"{run['browser_profile'] or '-':9}  {run['tests']:>5}  {run['call_s'] or 0:>8.2f}"
+        )
+
+
+def _print_compare(store, run_a, run_b, top, steps):
+    rows = store.compare(run_a, run_b, steps=steps)
+    if not rows:
+        print(f"No common {'steps' if steps else 'tests'} between runs {run_a} and {run_b}")
+        return
+    print(f"Top regressions from run {run_a} to run {run_b}:")
+    print(f"{'A (s)':>8}  {'B (s)':>8}  {'delta':>8}  {'%':>6}  name")
+    for name, a, b in rows[:top]:
+        pct = f"{(b / a - 1) * 100:+.0f}" if a else "n/a"
+        print(f"{a:>8.2f}  {b:>8.2f}  {b - a:>+8.2f}  {pct:>6}  {name}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m utils.perf_history", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--db", default=DEFAULT_DB, help=f"History database (default {DEFAULT_DB})")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    runs = commands.add_parser("runs", help="List recent benchmark runs")
+    runs.add_argument("--limit", type=int, default=20)
+
+    compare = commands.add_parser("compare", help="Print the top regressions between two runs")
+    compare.add_argument("run_a", nargs="?", type=int, help="Older run id (default: second latest)")
+    compare.add_argument("run_b", nargs="?", type=int, help="Newer run id (default: latest)")
+    compare.add_argument("--top", type=int, default=10)
+    compare.add_argument("--steps", action="store_true", help="Compare per-step helper timings instead of tests")
+
+    args = parser.parse_args(argv)
+    if not os.path.exists(args.db):
+        parser.error(f"No history database at {args.db} - run pytest --benchmark first")
+    store = HistoryStore(args.db)
+    try:
+        if args.command == "runs":
+            _print_runs(store, args.limit)
+            return 0
+        run_a, run_b = args.run_a, args.run_b
+        if run_a is None or run_b is None:
+            latest = store.latest_run_ids(2)
+            if len(latest) < 2 and run_a is None:
+                parser.error("Need at least two recorded runs to compare")
+            run_a = run_a if run_a is not None else latest[0]
+            run_b = run_b if run_b is not None else latest[-1]
+        _print_compare(store, run_a, run_b, args.top, args.steps)
+        return 0
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
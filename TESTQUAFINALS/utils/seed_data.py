@@ -0,0 +1,116 @@
+"""
+Deterministic test data created over the REST API
+A test module declares the employees and system users it needs in SEED_DATA;
+the module-scoped seed_data fixture creates them with unique names in one
+batch before the first test that asks for them and deletes them (plus any
+user a test created through the UI and registered) in one batched call per
+record type after the module
+"""
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import uuid
+
+from utils.api import ApiError
+
+logger = logging.getLogger(__name__)
+
+# Concurrent create requests (the default OrangeHrmApi connection pool size)
+SEED_WORKERS = 4
+
+# Password of every seeded user (7+ characters with a digit)
+SEED_PASSWORD = "QaSeed123"
+
+SeedEmployee = namedtuple("SeedEmployee", ["emp_number", "first_name", "last_name", "name"])
+SeedUser = namedtuple("SeedUser", ["id", "username", "password", "role", "status", "employee"])
+
+
+class DataFactory:
+    """
+    Creates and removes the records of one test module
+
+    Usage:
+        SEED_DATA = {
+            "employees": ["new_user_owner"],
+            "users": {"edit_target": {"role": "ESS", "status": "Enabled"}},
+        }
+
+        def test_x(seed_data):
+            user = seed_data.users["edit_target"]   # SeedUser, with its own employee
+            owner = seed_data.employees["new_user_owner"]
+
+    Every name carries a random run token, so parallel workers and leftovers
+    of an aborted run never collide, and each seeded user gets an employee
+    of its own.
+    """
+
+    def __init__(self, api, token=None):
+        self.api = api
+        self.token = token or uuid.uuid4().hex[:6]
+        self.employees = {}
+        self.users = {}
+        self._tracked_usernames = []
+
+    def username(self, key):
+        """Unique username for a key (also for users a test creates itself)"""
+        return f"qa.{self.token}.{key}"
+
+    def seed(self, employees=(), users=None):
+        """
+        Create the declared records: all employees concurrently, then all users
+
+        Args:
+            employees: Keys of employees without a system user
+            users: Dict key -> {"role": ..., "status": ...} of system users
+
+        Returns:
+            DataFactory: self, with .employees and .users filled in
+        """
+        users = users or {}
+        keys = list(employees) + [key for key in users if key not in employees]
+        if not keys:
+            return self
+        # Renew an expired session once, before the requests run in parallel
+        self.api.search_users(limit=1)
+        # Records are kept as they are created, so cleanup() also undoes a partial seed
+        with ThreadPoolExecutor(max_workers=min(SEED_WORKERS, len(keys))) as pool:
+            list(pool.map(self._create_employee, keys))
+            list(pool.map(self._create_user, users.items()))
+        logger.info(f"✓ Seeded {len(self.employees)} employees and {len(self.users)} users ({self.token})")
+        return self
+
+    def track_user(self, username):
+        """Delete a user created through the UI along with the seeded records"""
+        self._tracked_usernames.append(username)
+
+    def cleanup(self):
+        """Delete every user, then every employee, in one request each"""
+        user_ids = [user.id for user in self.users.values()]
+        emp_numbers = [employee.emp_number for employee in self.employees.values()]
+        try:
+            for username in self._tracked_usernames:
+                user_ids.extend(u["id"] for u in self.api.search_users(username=username))
+            if user_ids:
+                self.api.delete_users(user_ids)
+            if emp_numbers:
+                self.api.delete_employees(emp_numbers)
+        except ApiError as e:
+            logger.warning(f"⚠ Seed data cleanup incomplete ({self.token}): {e}")
+            return
+        logger.info(f"✓ Deleted {len(user_ids)} users and {len(emp_numbers)} employees ({self.token})")
+        self.users.clear()
+        self.employees.clear()
+        self._tracked_usernames.clear()
+
+    def _create_employee(self, key):
+        first_name = f"Seed{self.token}"
+        last_name = "".join(part.capitalize() for part in key.split("_"))
+        record = self.api.create_employee(first_name, last_name)
+        self.employees[key] = SeedEmployee(record["empNumber"], first_name, last_name, f"{first_name} {last_name}")
+
+    def _create_user(self, spec):
+        key, options = spec
+        role, status = options.get("role", "ESS"), options.get("status", "Enabled")
+        employee = self.employees[key]
+        record = self.api.create_user(self.username(key), SEED_PASSWORD, employee.emp_number, role, status)
+        self.users[key] = SeedUser(record["id"], record["userName"], SEED_PASSWORD, role, status, employee)
@@ -0,0 +1,159 @@
+"""
+Authenticated-session snapshot for skipping the UI login flow
+Logs in once, captures cookies and web storage, and restores them into
+later browsers by cookie injection
+"""
+import logging
+
+from utils.helpers import SeleniumHelpers
+from utils.locators import LoginLocators, NavigationLocators, registry
+
+logger = logging.getLogger(__name__)
+
+LOGIN_PATH = "/web/index.php/auth/login"
+DASHBOARD_PATH = "/web/index.php/dashboard/index"
+
+_STORAGE_DUMP_JS = """
+const dump = (store) => {
+    const items = {};
+    for (let i = 0; i < store.length; i++) {
+        const key = store.key(i);
+        items[key] = store.getItem(key);
+    }
+    return items;
+};
+return {local: dump(window.localStorage), session: dump(window.sessionStorage)};
+"""
+
+_STORAGE_LOAD_JS = """
+const [local, session] = arguments;
+for (const [k, v] of Object.entries(local)) window.localStorage.setItem(k, v);
+for (const [k, v] of Object.entries(session)) window.sessionStorage.setItem(k, v);
+"""
+
+
+def ui_login(driver, base_url, username, password, timeout=10):
+    """
+    Log in through the real login form using LoginLocators
+    Waits until the dashboard header is visible
+    """
+    driver.get(base_url + LOGIN_PATH)
+    registry.validate(driver, LoginLocators)
+    SeleniumHelpers.safe_send_keys(driver, LoginLocators.USERNAME_INPUT, username, timeout)
+    SeleniumHelpers.safe_send_keys(driver, LoginLocators.PASSWORD_INPUT, password, timeout)
+    SeleniumHelpers.safe_click(driver, LoginLocators.LOGIN_BUTTON, timeout)
+    SeleniumHelpers.wait_for_element_visible(driver, LoginLocators.DASHBOARD_HEADER, timeout)
+    logger.info(f"✓ Logged in through UI as {username}")
+
+
+class SessionSnapshot:
+    """
+    Captured authentication state of a logged-in browser
+
+    Attributes:
+        cookies: List of cookie dicts from driver.get_cookies()
+        local_storage: Dict of localStorage items for the app origin
+        session_storage: Dict of sessionStorage items for the app origin
+    """
+
+    def __init__(self, cookies, local_storage=None, session_storage=None):
+        self.cookies = cookies
+        self.local_storage = local_storage or {}
+        self.session_storage = session_storage or {}
+
+    @classmethod
+    def capture(cls, driver):
+        """Capture cookies and web storage from a logged-in browser"""
+        storage = driver.execute_script(_STORAGE_DUMP_JS) or {}
+        snapshot = cls(driver.get_cookies(), storage.get("local"), storage.get("session"))
+        logger.info(f"✓ Captured session snapshot ({len(snapshot.cookies)} cookies)")
+        return snapshot
+
+    def restore(self, driver, base_url, landing_path=DASHBOARD_PATH):
+        """
+        Inject the snapshot into a browser and open the landing page
+
+        Returns:
+            bool: True if the app accepted the session, False if it
+            redirected back to the login page
+        """
+        self._inject_cookies(driver, base_url)
+        driver.get(base_url + landing_path)
+
+        if LOGIN_PATH in driver.current_url:
+            logger.warning("⚠ Session snapshot rejected, redirected to login")
+            return False
+
+        if self.local_storage or self.session_storage:
+            driver.execute_script(_STORAGE_LOAD_JS, self.local_storage, self.session_storage)
+        return True
+
+    def _inject_cookies(self, driver, base_url):
+        """
+        Set cookies through CDP so no page load is needed first
+        Falls back to WebDriver add_cookie on the app origin
+        """
+        try:
+            for cookie in self.cookies:
+                params = {
+                    "name": cookie["name"],
+                    "value": cookie["value"],
+                    "path": cookie.get("path", "/"),
+                    "secure": cookie.get("secure", False),
+                    "httpOnly": cookie.get("httpOnly", False),
+                }
+                domain = cookie.get("domain") or ""
+                if domain.startswith("."):
+                    params["domain"] = domain
+                else:
+                    # Host-only cookie (also the only kind an IP host like the local stand-in gets)
+                    params["url"] = base_url
+                if "expiry" in cookie:
+                    params["expires"] = cookie["expiry"]
+                if cookie.get("sameSite"):
+                    params["sameSite"] = cookie["sameSite"]
+                driver.execute_cdp_cmd("Network.setCookie", params)
+        except Exception as e:
+            logger.info(f"CDP cookie injection unavailable ({e}), using add_cookie")
+            driver.get(base_url + LOGIN_PATH)
+            for cookie in self.cookies:
+                driver.add_cookie(cookie)
+
+
+class SessionCache:
+    """
+    Holds one SessionSnapshot per test session and refreshes it on demand
+    The first caller logs in through the UI; later callers inject cookies
+    """
+
+    def __init__(self, base_url, username, password):
+        self.base_url = base_url
+        self.username = username
+        self.password = password
+        self._snapshot = None
+
+    def login(self, driver, landing_path=DASHBOARD_PATH):
+        """
+        Leave the browser on landing_path (the dashboard by default) with an
+        authenticated session; restoring lands there directly, without
+        loading the dashboard first
+        """
+        if self._snapshot and self._snapshot.restore(driver, self.base_url, landing_path):
+            SeleniumHelpers.wait_for_element_visible(driver, LoginLocators.DASHBOARD_HEADER)
+            registry.validate(driver, NavigationLocators)
+            logger.info("✓ Restored session snapshot")
+            return driver
+
+        # No snapshot yet, or the app rejected it - log in for real and recapture
+        ui_login(driver, self.base_url, self.username, self.password)
+        self._snapshot = SessionSnapshot.capture(driver)
+        if landing_path != DASHBOARD_PATH:
+            driver.get(self.base_url + landing_path)
+        return driver
+
+    def cookies(self):
+        """Cookies of the current snapshot (empty before the first login)"""
+        return list(self._snapshot.cookies) if self._snapshot else []
+
+    def invalidate(self):
+        self._snapshot = None
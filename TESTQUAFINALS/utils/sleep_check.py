@@ -0,0 +1,45 @@
+"""
+Static check that keeps fixed time.sleep calls out of the test modules
+Used by conftest.py to fail the run before any browser is launched
+"""
+import ast
+
+
+def find_bare_sleeps(path):
+    """
+    Find time.sleep / sleep calls in a Python file
+
+    Detects `time.sleep(...)`, aliased `import time as t; t.sleep(...)`
+    and `from time import sleep; sleep(...)`
+
+    Returns:
+        list: (line number, source line) tuples for each call found
+    """
+    with open(path, encoding="utf-8") as f:
+        source = f.read()
+    tree = ast.parse(source, filename=str(path))
+
+    time_modules = set()
+    sleep_names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            time_modules.update(a.asname or a.name for a in node.names if a.name == "time")
+        elif isinstance(node, ast.ImportFrom) and node.module == "time":
+            sleep_names.update(a.asname or a.name for a in node.names if a.name == "sleep")
+
+    lines = source.splitlines()
+    found = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        func = node.func
+        is_module_sleep = (
+            isinstance(func, ast.Attribute)
+            and func.attr == "sleep"
+            and isinstance(func.value, ast.Name)
+            and func.value.id in time_modules
+        )
+        is_imported_sleep = isinstance(func, ast.Name) and func.id in sleep_names
+        if is_module_sleep or is_imported_sleep:
+            found.append((node.lineno, lines[node.lineno - 1].strip()))
+    return sorted(found)
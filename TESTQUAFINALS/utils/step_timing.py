@@ -0,0 +1,259 @@
+"""
+Per-step timing for SeleniumHelpers calls
+Records wall time, time spent inside explicit waits, poll/fallback counts and
+the locator used for every helper call, grouped per test by conftest.py
+"""
+from selenium.webdriver.support.ui import WebDriverWait
+from datetime import datetime
+from html import escape
+import functools
+import json
+import os
+import threading
+import time
+
+from utils.locators import Locator, registry
+
+# Rows shown in the "Slowest steps" section of the HTML report
+SLOWEST_STEPS = 15
+
+
+class Step:
+    """One helper call; nested helper calls are recorded as separate steps with depth + 1"""
+
+    def __init__(self, helper, locator, depth, phase):
+        self.helper = helper
+        self.locator = locator
+        self.depth = depth
+        self.phase = phase
+        self.started = time.perf_counter()
+        self.wall = 0.0
+        self.wait = 0.0
+        self.polls = 0
+        self.js_fallbacks = 0
+        self.strategy_index = None
+        self.error = None
+
+    def to_dict(self):
+        return {
+            "helper": self.helper,
+            "locator": self.locator,
+            "strategy_index": self.strategy_index,
+            "phase": self.phase,
+            "depth": self.depth,
+            "wall_s": round(self.wall, 4),
+            "wait_s": round(self.wait, 4),
+            "polls": self.polls,
+            "js_fallbacks": self.js_fallbacks,
+            "locator_fallback": bool(self.strategy_index),
+            "error": self.error,
+        }
+
+
+class StepRecorder:
+    """
+    Collects Step records for the running test (per thread) and the
+    finished per-test results for the session
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self.results = {}
+
+    @property
+    def _state(self):
+        if not hasattr(self._local, "steps"):
+            self._local.steps = []
+            self._local.stack = []
+            self._local.phase = None
+            self._local.listeners = []
+        return self._local
+
+    def begin(self, phase):
+        """Start recording a test phase (setup clears the previous test's steps)"""
+        if phase == "setup":
+            self._state.steps = []
+            self._state.stack = []
+        self._state.phase = phase
+
+    def pop_steps(self):
+        """Return and clear the steps recorded for the current test"""
+        steps = [step.to_dict() for step in self._state.steps]
+        self._state.steps = []
+        return steps
+
+    def open_step(self, helper, locator):
+        state = self._state
+        step = Step(helper, locator, len(state.stack), state.phase)
+        state.stack.append(step)
+        state.steps.append(step)
+        return step
+
+    def close_step(self, step):
+        state = self._state
+        step.wall = time.perf_counter() - step.started
+        state.stack.remove(step)
+        # Parent steps include the waits and fallbacks of the helpers they call
+        if state.stack:
+            parent = state.stack[-1]
+            parent.wait += step.wait
+            parent.polls += step.polls
+            parent.js_fallbacks += step.js_fallbacks
+
+    def add_listener(self, callback):
+        """Call callback(step, driver) after every successful top-level helper call in this thread"""
+        self._state.listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self._state.listeners:
+            self._state.listeners.remove(callback)
+
+    def notify(self, step, driver):
+        for callback in list(self._state.listeners):
+            callback(step, driver)
+
+    def add_wait(self, seconds, polls):
+        if self._state.stack:
+            step = self._state.stack[-1]
+            step.wait += seconds
+            step.polls += polls
+
+    def count_js_fallback(self):
+        if self._state.stack:
+            self._state.stack[-1].js_fallbacks += 1
+
+    def add_result(self, nodeid, steps):
+        self.results[nodeid] = steps
+
+    def summary(self):
+        """
+        Machine-readable summary of all finished tests
+
+        Returns:
+            dict: per-test totals (top-level steps only), per-helper totals
+            (all steps) and the slowest individual steps
+        """
+        tests = {}
+        helpers = {}
+        all_steps = []
+        for nodeid, steps in self.results.items():
+            top = [s for s in steps if s["depth"] == 0]
+            tests[nodeid] = {
+                "steps": len(top),
+                "wall_s": round(sum(s["wall_s"] for s in top), 4),
+                "wait_s": round(sum(s["wait_s"] for s in top), 4),
+                "polls": sum(s["polls"] for s in top),
+                "js_fallbacks": sum(s["js_fallbacks"] for s in top),
+                "locator_fallbacks": sum(s["locator_fallback"] for s in steps),
+                "detail": steps,
+            }
+            for step in steps:
+                totals = helpers.setdefault(step["helper"], {"calls": 0, "wall_s": 0.0, "wait_s": 0.0, "max_s": 0.0})
+                totals["calls"] += 1
+                totals["wall_s"] = round(totals["wall_s"] + step["wall_s"], 4)
+                totals["wait_s"] = round(totals["wait_s"] + step["wait_s"], 4)
+                totals["max_s"] = max(totals["max_s"], step["wall_s"])
+                all_steps.append(dict(step, test=nodeid))
+        slowest = sorted(all_steps, key=lambda s: s["wall_s"], reverse=True)[:SLOWEST_STEPS]
+        return {
+            "generated": datetime.now().isoformat(timespec="seconds"),
+            "tests": tests,
+            "helpers": helpers,
+            "slowest_steps": slowest,
+        }
+
+    def write_json(self, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, indent=2)
+        return path
+
+    def slowest_steps_html(self):
+        """HTML table for the pytest-html summary section"""
+        rows = "".join(
+            "<tr><td>{test}</td><td>{helper}</td><td>{locator}</td><td>{wall:.3f}</td>"
+            "<td>{wait:.3f}</td><td>{polls}</td><td>{fallbacks}</td></tr>".format(
+                test=escape(step["test"]),
+                helper=escape(step["helper"]),
+                locator=escape(step["locator"] or ""),
+                wall=step["wall_s"],
+                wait=step["wait_s"],
+                polls=step["polls"],
+                fallbacks=step["js_fallbacks"] + step["locator_fallback"],
+            )
+            for step in self.summary()["slowest_steps"]
+        )
+        if not rows:
+            return ""
+        return (
+            "<h2>Slowest steps</h2>"
+            "<table id='slowest-steps'><thead><tr><th>Test</th><th>Helper</th><th>Locator</th>"
+            "<th>Wall (s)</th><th>Wait (s)</th><th>Polls</th><th>Fallbacks</th></tr></thead>"
+            f"<tbody>{rows}</tbody></table>"
+        )
+
+
+recorder = StepRecorder()
+
+
+class TimedWait(WebDriverWait):
+    """WebDriverWait that reports time spent in until/until_not to the current step"""
+
+    def until(self, method, message=""):
+        return self._timed(super().until, method, message)
+
+    def until_not(self, method, message=""):
+        return self._timed(super().until_not, method, message)
+
+    def _timed(self, wait_method, method, message):
+        polls = [0]
+
+        def counted(driver):
+            polls[0] += 1
+            return method(driver)
+
+        start = time.perf_counter()
+        try:
+            return wait_method(counted, message)
+        finally:
+            recorder.add_wait(time.perf_counter() - start, polls[0])
+
+
+def _locator_label(locator):
+    if isinstance(locator, Locator):
+        return locator.name or str(locator[1])
+    return str(locator[1])
+
+
+def timed_step(func):
+    """
+    Record a SeleniumHelpers call as a Step
+    The locator is the first (By, value) tuple argument after the driver;
+    page object methods pass the page first, which carries the driver
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        driver = args[0] if args else kwargs.get("driver")
+        driver = getattr(driver, "page_driver", driver)
+        locator = next(
+            (a for a in list(args[1:]) + list(kwargs.values())
+             if isinstance(a, tuple) and len(a) == 2 and isinstance(a[0], str)),
+            None,
+        )
+        step = recorder.open_step(func.__name__, _locator_label(locator) if locator else None)
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            step.error = type(e).__name__
+            raise
+        finally:
+            if isinstance(locator, Locator) and driver is not None:
+                strategy = registry.cached_strategy(driver, locator)
+                if strategy is not None:
+                    step.strategy_index = locator.strategies.index(strategy)
+            recorder.close_step(step)
+        # Listeners (e.g. browser metrics) run outside the step's own wall time
+        if step.depth == 0:
+            recorder.notify(step, driver)
+        return result
+    return wrapper